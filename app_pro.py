@@ -304,10 +304,10 @@ with tab_armature:
         )
         
         as_inf = 0
-        for idx, row in df_inf.iterrows():
-            if row["Attiva"]:
-                d = row["Diametro [mm]"]
-                n = int(row["N° barre"])
+        righe_inf = df_inf[["Diametro [mm]", "N° barre", "Attiva"]].itertuples(index=False, name=None)
+        for d, n, attiva in righe_inf:
+            if attiva:
+                n = int(n)
                 a = n * np.pi * (d/2)**2
                 as_inf += a
                 sezione.aggiungi_armatura_inferiore(d, n)
@@ -328,10 +328,10 @@ with tab_armature:
         )
         
         as_sup = 0
-        for idx, row in df_sup.iterrows():
-            if row["Attiva"]:
-                d = row["Diametro [mm]"]
-                n = int(row["N° barre"])
+        righe_sup = df_sup[["Diametro [mm]", "N° barre", "Attiva"]].itertuples(index=False, name=None)
+        for d, n, attiva in righe_sup:
+            if attiva:
+                n = int(n)
                 a = n * np.pi * (d/2)**2
                 as_sup += a
                 sezione.aggiungi_armatura_superiore(d, n)
@@ -23,8 +23,6 @@ from verifiche_dm1939.verifications.verifica_pressoflessione import (
     VerificaPressoflessioneDeviata,
 )
 from verifiche_dm1939.io_handlers.csv_handler import CSVHandler
-from verifiche_dm1939.reporting.grafici import GeneratoreGrafici
-from verifiche_dm1939.reporting.report_generator import GeneratoreReport
 
 
 def verifica_trave_da_config(config_path: Path, output_dir: Optional[Path] = None) -> None:
@@ -114,6 +112,9 @@ def verifica_trave_da_config(config_path: Path, output_dir: Optional[Path] = Non
     if output_dir and config.opzioni_calcolo.genera_grafici:
         output_dir.mkdir(exist_ok=True, parents=True)
         
+        # matplotlib viene caricato solo quando servono i grafici
+        from verifiche_dm1939.reporting.grafici import GeneratoreGrafici
+        
         generatore = GeneratoreGrafici()
         fig = generatore.disegna_sezione(sezione, titolo="Sezione Trave")
         generatore.salva_grafico(fig, output_dir / "sezione.png")
@@ -0,0 +1,94 @@
+"""
+Compatibilità tra versioni di Python e dipendenze opzionali.
+
+Il progetto supporta Python >= 3.9, ma alcune opzioni dei dataclass
+(es. ``slots=True``) sono disponibili solo da Python 3.10.
+La compilazione JIT con numba è opzionale (extra ``jit``), così come
+il parser CSV di pyarrow (extra ``arrow``) e la serializzazione JSON
+di orjson (extra ``json``).
+"""
+
+import functools
+import sys
+import types
+from importlib.util import find_spec
+from typing import Callable, Optional
+
+
+# Argomenti da passare a @dataclass per generare __slots__ quando supportato
+# (Python >= 3.10). Su Python 3.9 il dataclass resta con __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# numba è opzionale: se installato, le funzioni decorate con njit sono
+# compilate alla prima chiamata. Si verifica solo la presenza: l'import
+# (alcuni decimi di secondo) avviene alla prima compilazione.
+NUMBA_DISPONIBILE = find_spec("numba") is not None
+
+# Cicli paralleli: nelle funzioni compilate diventano numba.prange,
+# altrimenti restano cicli ordinari
+prange = range
+
+
+class _FunzioneJit:
+    """
+    Funzione da compilare con numba.njit alla prima chiamata.
+    
+    Le funzioni njit richiamate sono compilate prima della chiamante
+    (numba deve vederle già compilate) e prange diventa numba.prange.
+    """
+    
+    def __init__(self, funzione: Callable, opzioni: dict):
+        functools.update_wrapper(self, funzione)
+        self._funzione = funzione
+        self._opzioni = opzioni
+        self._compilata: Optional[Callable] = None
+    
+    def compila(self) -> Callable:
+        """Dispatcher numba della funzione (importa numba e compila alla prima richiesta)."""
+        if self._compilata is None:
+            import numba
+            
+            funzione = self._funzione
+            globali = dict(funzione.__globals__)
+            for nome in funzione.__code__.co_names:
+                valore = globali.get(nome)
+                if isinstance(valore, _FunzioneJit):
+                    globali[nome] = valore.compila()
+                elif valore is prange:
+                    globali[nome] = numba.prange
+            
+            copia = types.FunctionType(funzione.__code__, globali, funzione.__name__,
+                                       funzione.__defaults__, funzione.__closure__)
+            copia.__qualname__ = funzione.__qualname__
+            self._compilata = numba.njit(**self._opzioni)(copia)
+        return self._compilata
+    
+    def __call__(self, *args):
+        return self.compila()(*args)
+
+
+def njit(*args, **kwargs):
+    """
+    Come numba.njit, ma senza importare numba finché la funzione non è chiamata.
+    
+    Senza numba restituisce la funzione invariata.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return njit()(args[0])
+    
+    def decora(funzione: Callable) -> Callable:
+        return _FunzioneJit(funzione, kwargs) if NUMBA_DISPONIBILE else funzione
+    
+    return decora
+
+
+# pyarrow è opzionale: se installato, pandas lo usa come motore di lettura CSV.
+# Si verifica solo la presenza, senza importarlo (l'import è oneroso).
+PYARROW_DISPONIBILE = find_spec("pyarrow") is not None
+
+
+try:
+    import orjson
+except ImportError:  # orjson è opzionale: senza, si usa il modulo json della libreria standard
+    orjson = None
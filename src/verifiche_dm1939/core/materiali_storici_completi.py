@@ -8,8 +8,17 @@ Fonti:
 - Tabelle III e II dal Prontuario Santarella
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+import math
+from dataclasses import asdict, dataclass
+from enum import Enum, IntEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from verifiche_dm1939.core.compat import DATACLASS_SLOTS
+from verifiche_dm1939.core.dati_storici_rd2229 import MODULO_ELASTICITA_ACCIAIO_KGCM2
 
 
 # ======================================================================================
@@ -20,7 +29,7 @@ from typing import Dict, List, Optional, Tuple
 # DATACLASSES - DEFINIZIONE COMPLETA PARAMETRI
 # ======================================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class CalcestrutzoCompleto:
     """Calcestruzzo con TUTTI i parametri storici."""
     
@@ -63,9 +72,40 @@ class CalcestrutzoCompleto:
     # ADDITIONAL INFO
     applicazioni: str = ""  # Usi comuni nell'epoca
     limitazioni: str = ""  # Limitazioni d'uso
+    
+    def to_dict(self) -> Dict:
+        """Parametri come dizionario (le istanze non hanno __dict__)."""
+        return asdict(self)
 
 
-@dataclass
+class TipoAderenza(str, Enum):
+    """Tipo di aderenza delle barre (RD 2229 pag. 11)."""
+    
+    LISCIA = "liscia"
+    MIGLIORATA = "migliorata"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+class ClassificazioneAcciaio(str, Enum):
+    """Classificazione storica degli acciai da c.a."""
+    
+    FEB_LISCIO = "FeB (Ferro-Beton liscio)"
+    FEB_MIGLIORATO = "FeB (Ferro-Beton migliorato)"
+    AQ_QUALIFICATO = "Aq (Qualificato - Laminato raschiato)"
+    
+    def __str__(self) -> str:
+        return self.value
+
+
+# Serie storiche dei diametri [mm], condivise tra le istanze (immutabili)
+DIAMETRI_SERIE_DA_6: Tuple[float, ...] = (6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32)
+DIAMETRI_SERIE_DA_8: Tuple[float, ...] = DIAMETRI_SERIE_DA_6[1:]
+DIAMETRI_SERIE_DA_10: Tuple[float, ...] = DIAMETRI_SERIE_DA_6[2:]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AcciaioCompleto:
     """Acciaio con TUTTI i parametri storici."""
     
@@ -73,7 +113,7 @@ class AcciaioCompleto:
     nome: str  # es. "FeB32k Dolce"
     sigla: str  # es. "FeB32k"
     tipo: str  # es. "FeB32k" | "Aq70"
-    classificazione: str  # "FeB (Ferro-Beton)" | "Aq (Qualificato)"
+    classificazione: ClassificazioneAcciaio
     
     # RESISTENZA (RD 2229 pag. 14-15)
     sigma_y_kgcm2: float  # Tensione di snervamento fy [Kg/cm²]
@@ -86,12 +126,12 @@ class AcciaioCompleto:
     modulo_elastico_kgcm2: float = 2000000  # Es [Kg/cm²]
     
     # ADERENZA (Pag. 11 RD 2229)
-    tipo_aderenza: str = "liscia"  # "liscia" | "migliorata"
+    tipo_aderenza: TipoAderenza = TipoAderenza.LISCIA
     aderenza_migliorata: bool = False  # True se migliorata
     caratteri_aderenza: str = ""  # es. "barre lisce, raschiate, ecc."
     
     # DIAMETRI DISPONIBILI (Serie storiche)
-    diametri_disponibili: List[float] = field(default_factory=lambda: [6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32])
+    diametri_disponibili: Tuple[float, ...] = DIAMETRI_SERIE_DA_6
     diametro_min_mm: float = 6.0
     diametro_max_mm: float = 32.0
     
@@ -108,22 +148,25 @@ class AcciaioCompleto:
     # ADDITIONAL INFO
     applicazioni: str = ""  # Usi comuni
     limitazioni: str = ""  # Limitazioni d'uso
+    
+    def to_dict(self) -> Dict:
+        """Parametri come dizionario (le istanze non hanno __dict__)."""
+        return asdict(self)
 
 
 # ======================================================================================
 # TABELLA CALCESTRUZZI COMPLETI (RD 2229/1939 + Santarella Prontuario)
 # ======================================================================================
 
-CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
-    CalcestrutzoCompleto(
+# Dati primari per classe: Ec e n sono derivati da sigma_c in _costruisci_calcestruzzi
+_CALCESTRUZZI_DATI: List[Dict] = [
+    dict(
         nome="C150 - Cemento Normale - RD2229/1939",
         sigla="C150",
         sigma_c_kgcm2=150,
         sigma_c_semplice_kgcm2=15,
         sigma_c_inflessa_kgcm2=12,
         tau_ammissibile_kgcm2=2.5,
-        modulo_elastico_kgcm2=250000,
-        coefficiente_omogeneo=8.0,
         tipo_cemento="normale",
         rapporto_ac=1.10,
         rapporto_cemento_sabbia="1:2.70",
@@ -132,21 +175,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1080,
         pagina_tabella_ii="pag. 9 (Tabella II RD2229)",
         pagina_carichi="pag. 14-15 (Carichi ammissibili)",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 250000 Kg/cm²",
         note="Calcestruzzo ordinario per edilizia generale con scariche limitate",
         applicazioni="Solai, travi, pilastri in edifici ordinari, murature",
         limitazioni="Non adatto per strutture critiche o esposizioni chimiche"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C200 - Cemento Normale - RD2229/1939",
         sigla="C200",
         sigma_c_kgcm2=200,
         sigma_c_semplice_kgcm2=20,
         sigma_c_inflessa_kgcm2=16,
         tau_ammissibile_kgcm2=3.0,
-        modulo_elastico_kgcm2=303000,
-        coefficiente_omogeneo=6.6,
         tipo_cemento="normale",
         rapporto_ac=0.95,
         rapporto_cemento_sabbia="1:2.30",
@@ -155,21 +195,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1100,
         pagina_tabella_ii="pag. 9 (Tabella II RD2229)",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 303000 Kg/cm²",
         note="Calcestruzzo intermedio, uso comune in strutture ordinarie",
         applicazioni="Solai, travi, pilastri, muri in edifici residenziali e commerciali",
         limitazioni="Moderato per ambienti aggressivi"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C240 - Cemento Normale - RD2229/1939",
         sigla="C240",
         sigma_c_kgcm2=240,
         sigma_c_semplice_kgcm2=24,
         sigma_c_inflessa_kgcm2=19,
         tau_ammissibile_kgcm2=3.5,
-        modulo_elastico_kgcm2=340000,
-        coefficiente_omogeneo=5.9,
         tipo_cemento="normale",
         rapporto_ac=0.80,
         rapporto_cemento_sabbia="1:2.00",
@@ -178,21 +215,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1120,
         pagina_tabella_ii="pag. 9",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 340000 Kg/cm²",
         note="Calcestruzzo per strutture ordinarie importanti",
         applicazioni="Strutture portanti, ponti di piccola-media luce, viadotti",
         limitazioni="Moderato per ambienti aggressivi"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C280 - Cemento Normale STANDARD - RD2229/1939",
         sigla="C280",
         sigma_c_kgcm2=280,
         sigma_c_semplice_kgcm2=28,
         sigma_c_inflessa_kgcm2=22,
         tau_ammissibile_kgcm2=4.0,
-        modulo_elastico_kgcm2=373000,
-        coefficiente_omogeneo=5.4,
         tipo_cemento="normale",
         rapporto_ac=0.70,
         rapporto_cemento_sabbia="1:1.85",
@@ -201,21 +235,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1130,
         pagina_tabella_ii="pag. 9 (Tabella II RD2229)",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 373000 Kg/cm²",
         note="CALCESTRUZZO STORICO PIÙ UTILIZZATO - Standard epoca Santarella (1930-1970)",
         applicazioni="Uso generale, strutture portanti, ponti, infrastrutture",
         limitazioni="Buono per ambienti ordinari"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C330 - Cemento Alta Resistenza - RD2229/1939",
         sigla="C330",
         sigma_c_kgcm2=330,
         sigma_c_semplice_kgcm2=33,
         sigma_c_inflessa_kgcm2=26,
         tau_ammissibile_kgcm2=4.5,
-        modulo_elastico_kgcm2=407000,
-        coefficiente_omogeneo=4.9,
         tipo_cemento="alta_resistenza",
         rapporto_ac=0.60,
         rapporto_cemento_sabbia="1:1.40",
@@ -224,21 +255,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1130,
         pagina_tabella_ii="pag. 9",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 407000 Kg/cm²",
         note="Calcestruzzo ad alta resistenza, cemento tipo PS (Pozzolana Speciale)",
         applicazioni="Strutture speciali, ponti importanti, edifici alti, gallerie",
         limitazioni="Richiede controllo qualità rigoroso"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C400 - Cemento Alta Resistenza - RD2229/1939",
         sigla="C400",
         sigma_c_kgcm2=400,
         sigma_c_semplice_kgcm2=40,
         sigma_c_inflessa_kgcm2=32,
         tau_ammissibile_kgcm2=5.0,
-        modulo_elastico_kgcm2=441000,
-        coefficiente_omogeneo=4.5,
         tipo_cemento="alta_resistenza",
         rapporto_ac=0.50,
         rapporto_cemento_sabbia="1:1.00",
@@ -247,21 +275,18 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1150,
         pagina_tabella_ii="pag. 9",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 441000 Kg/cm²",
         note="Calcestruzzo altissima resistenza, cemento tipo PS o alluminoso",
         applicazioni="Strutture critiche, ponti lunghi, edifici speciali, gallerie",
         limitazioni="Controllo qualità essenziale, costo elevato"
     ),
     
-    CalcestrutzoCompleto(
+    dict(
         nome="C750 - Cemento Alluminoso SPECIALE - RD2229/1939",
         sigla="C750",
         sigma_c_kgcm2=750,
         sigma_c_semplice_kgcm2=75,
         sigma_c_inflessa_kgcm2=60,
         tau_ammissibile_kgcm2=6.0,
-        modulo_elastico_kgcm2=500000,
-        coefficiente_omogeneo=4.0,
         tipo_cemento="alluminoso",
         rapporto_ac=0.40,
         rapporto_cemento_sabbia="1:0.50",
@@ -270,7 +295,6 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
         massa_volumica_kg_m3=1200,
         pagina_tabella_ii="pag. 9 (Speciale - Ciment Fondu)",
         pagina_carichi="pag. 14-15",
-        fonte_ec="Ec = 550000·σc/(σc+200) = 500000 Kg/cm² (Ciment Fondu)",
         note="Calcestruzzo alluminoso ad altissima resistenza e durabilità (Ciment Fondu - sigma_amm=75 Kg/cm²)",
         applicazioni="Strutture in ambienti chimicamente aggressivi, refrattari, strutture critiche sottomarine",
         limitazioni="Molto costoso, reazioni esotermiche in stagionamento, possibile invecchiamento chimico"
@@ -278,25 +302,52 @@ CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = [
 ]
 
 
+def _costruisci_calcestruzzi(dati: List[Dict]) -> List[CalcestrutzoCompleto]:
+    """
+    Costruisce la tabella dei calcestruzzi derivando Ec e n da sigma_c.
+    
+    Formula Santarella: Ec = 550000·σc/(σc+200), n = Es/Ec (Es = 2,000,000 Kg/cm²),
+    calcolate in un'unica passata vettoriale su tutte le classi.
+    """
+    sigma_c = np.array([d['sigma_c_kgcm2'] for d in dati], dtype=float)
+    ec = 550000 * sigma_c / (sigma_c + 200)
+    n = MODULO_ELASTICITA_ACCIAIO_KGCM2 / ec
+    
+    return [
+        CalcestrutzoCompleto(
+            **d,
+            modulo_elastico_kgcm2=ec_i,
+            coefficiente_omogeneo=n_i,
+            fonte_ec=f"Ec = 550000·σc/(σc+200) = {ec_i:.0f} Kg/cm²",
+        )
+        for d, ec_i, n_i in zip(dati, ec.tolist(), n.tolist())
+    ]
+
+
+CALCESTRUZZI_COMPLETI: List[CalcestrutzoCompleto] = _costruisci_calcestruzzi(_CALCESTRUZZI_DATI)
+
+
 # ======================================================================================
 # TABELLA ACCIAI COMPLETI (RD 2229/1939)
 # ======================================================================================
 
-ACCIAI_COMPLETI: List[AcciaioCompleto] = [
+# Dati per acciaio: le istanze AcciaioCompleto sono create solo quando richieste
+# (get_acciaio o primo accesso a ACCIAI_COMPLETI)
+_ACCIAI_DATI: Tuple[Dict, ...] = (
     # FeB - Ferro-Beton (barre lisce storiche)
-    AcciaioCompleto(
+    dict(
         nome="FeB32k Dolce - Ferro-Beton Liscio",
         sigla="FeB32k",
         tipo="FeB32k",
-        classificazione="FeB (Ferro-Beton liscio)",
+        classificazione=ClassificazioneAcciaio.FEB_LISCIO,
         sigma_y_kgcm2=1400,
         sigma_ammissibile_traczione_kgcm2=609,
         sigma_ammissibile_compressione_kgcm2=609,
         modulo_elastico_kgcm2=2000000,
-        tipo_aderenza="liscia",
+        tipo_aderenza=TipoAderenza.LISCIA,
         aderenza_migliorata=False,
         caratteri_aderenza="Barre lisce, superficie liscia ordinaria",
-        diametri_disponibili=[6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_6,
         diametro_min_mm=6.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9 (Tabella I RD2229)",
@@ -307,19 +358,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         limitazioni="Aderenza semplice, minore rispetto acciai migliorati"
     ),
     
-    AcciaioCompleto(
+    dict(
         nome="FeB38k Semiriduro - Ferro-Beton Migliorato",
         sigla="FeB38k",
         tipo="FeB38k",
-        classificazione="FeB (Ferro-Beton migliorato)",
+        classificazione=ClassificazioneAcciaio.FEB_MIGLIORATO,
         sigma_y_kgcm2=1800,
         sigma_ammissibile_traczione_kgcm2=800,
         sigma_ammissibile_compressione_kgcm2=800,
         modulo_elastico_kgcm2=2000000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre con lamine trasversali o nervature, trattamento superficiale",
-        diametri_disponibili=[6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_6,
         diametro_min_mm=6.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9",
@@ -330,19 +381,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         limitazioni="Aderenza migliorata ma inferiore a Aq"
     ),
     
-    AcciaioCompleto(
+    dict(
         nome="FeB44k Duro - Ferro-Beton Migliorato",
         sigla="FeB44k",
         tipo="FeB44k",
-        classificazione="FeB (Ferro-Beton migliorato)",
+        classificazione=ClassificazioneAcciaio.FEB_MIGLIORATO,
         sigma_y_kgcm2=2000,
         sigma_ammissibile_traczione_kgcm2=880,
         sigma_ammissibile_compressione_kgcm2=880,
         modulo_elastico_kgcm2=2000000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre con trattamento superficiale migliorato, nervature poco marcate",
-        diametri_disponibili=[6, 8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_6,
         diametro_min_mm=6.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9",
@@ -354,19 +405,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
     ),
     
     # Aq - Acciai laminati Qualificati (barre raschiate - serie italiana)
-    AcciaioCompleto(
+    dict(
         nome="Aq50 Qualificato - Acciaio Laminato",
         sigla="Aq50",
         tipo="Aq50",
-        classificazione="Aq (Qualificato - Laminato raschiato)",
+        classificazione=ClassificazioneAcciaio.AQ_QUALIFICATO,
         sigma_y_kgcm2=500,
         sigma_ammissibile_traczione_kgcm2=220,
         sigma_ammissibile_compressione_kgcm2=220,
         modulo_elastico_kgcm2=2050000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre laminare raschiate, superficie ruvida per eccellente aderenza",
-        diametri_disponibili=[8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_8,
         diametro_min_mm=8.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9 (Acciai qualificati)",
@@ -377,19 +428,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         limitazioni="Produzione selettiva, non sempre disponibile nel mercato storico"
     ),
     
-    AcciaioCompleto(
+    dict(
         nome="Aq60 Qualificato - Acciaio Laminato",
         sigla="Aq60",
         tipo="Aq60",
-        classificazione="Aq (Qualificato - Laminato raschiato)",
+        classificazione=ClassificazioneAcciaio.AQ_QUALIFICATO,
         sigma_y_kgcm2=600,
         sigma_ammissibile_traczione_kgcm2=264,
         sigma_ammissibile_compressione_kgcm2=264,
         modulo_elastico_kgcm2=2050000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre laminare raschiate con eccellente aderenza",
-        diametri_disponibili=[8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_8,
         diametro_min_mm=8.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9",
@@ -400,19 +451,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         limitazioni="Reperibilità limitata nel mercato storico"
     ),
     
-    AcciaioCompleto(
+    dict(
         nome="Aq70 Qualificato - Acciaio Laminato",
         sigla="Aq70",
         tipo="Aq70",
-        classificazione="Aq (Qualificato - Laminato raschiato)",
+        classificazione=ClassificazioneAcciaio.AQ_QUALIFICATO,
         sigma_y_kgcm2=700,
         sigma_ammissibile_traczione_kgcm2=308,
         sigma_ammissibile_compressione_kgcm2=308,
         modulo_elastico_kgcm2=2050000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre laminare raschiate, ottima aderenza",
-        diametri_disponibili=[8, 10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_8,
         diametro_min_mm=8.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9",
@@ -423,19 +474,19 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         limitazioni="Costo moderato, reperibilità selettiva"
     ),
     
-    AcciaioCompleto(
+    dict(
         nome="Aq80 Qualificato - Acciaio Laminato",
         sigla="Aq80",
         tipo="Aq80",
-        classificazione="Aq (Qualificato - Laminato raschiato)",
+        classificazione=ClassificazioneAcciaio.AQ_QUALIFICATO,
         sigma_y_kgcm2=800,
         sigma_ammissibile_traczione_kgcm2=352,
         sigma_ammissibile_compressione_kgcm2=352,
         modulo_elastico_kgcm2=2050000,
-        tipo_aderenza="migliorata",
+        tipo_aderenza=TipoAderenza.MIGLIORATA,
         aderenza_migliorata=True,
         caratteri_aderenza="Barre laminare raschiate, ottima aderenza",
-        diametri_disponibili=[10, 12, 14, 16, 18, 20, 22, 25, 28, 32],
+        diametri_disponibili=DIAMETRI_SERIE_DA_10,
         diametro_min_mm=10.0,
         diametro_max_mm=32.0,
         pagina_resistenza="pag. 9",
@@ -445,53 +496,223 @@ ACCIAI_COMPLETI: List[AcciaioCompleto] = [
         applicazioni="Strutture critiche, ponti lunghi, edifici speciali",
         limitazioni="Costo elevato, reperibilità limitata"
     ),
-]
+)
 
+_INDICE_ACCIAI: Dict[str, int] = {d['sigla']: i for i, d in enumerate(_ACCIAI_DATI)}
 
-# ======================================================================================
-# FORMULE DI VALIDAZIONE (Santarella - RD 2229/1939)
-# ======================================================================================
 
-def valida_calcestruzzo(sigma_c: float, sigma_amm: float, tau_amm: float, 
-                        ec: float, n: float) -> Tuple[bool, List[str]]:
+@lru_cache(maxsize=None)
+def _crea_acciaio(indice: int) -> AcciaioCompleto:
+    """Crea (una sola volta) l'acciaio in posizione indice della tabella."""
+    return AcciaioCompleto(**_ACCIAI_DATI[indice])
+
+
+def get_acciaio(sigla: str) -> Optional[AcciaioCompleto]:
     """
-    Valida i parametri di un calcestruzzo secondo le formule di Santarella.
+    Recupera un acciaio completo dalla sigla (es. "FeB32k", "Aq70").
     
     Returns:
-        (è_valido, lista_avvisi)
+        Oggetto AcciaioCompleto o None se non trovato
     """
-    avvisi = []
-    
+    indice = _INDICE_ACCIAI.get(sigla)
+    return None if indice is None else _crea_acciaio(indice)
+
+
+def __getattr__(nome: str):
+    # ACCIAI_COMPLETI (List[AcciaioCompleto]) è costruita al primo accesso
+    if nome == "ACCIAI_COMPLETI":
+        acciai = [_crea_acciaio(i) for i in range(len(_ACCIAI_DATI))]
+        globals()[nome] = acciai
+        return acciai
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+
+# Archivio colonnare (Struct-of-Arrays) degli acciai: una colonna per campo, con le
+# righe nello stesso ordine di ACCIAI_COMPLETI. È costruito dai dati della tabella,
+# senza creare istanze. I campi numerici sono array NumPy contigui, i campi testuali
+# liste Python.
+_CAMPI_NUMERICI_ACCIAIO = (
+    'sigma_y_kgcm2',
+    'sigma_ammissibile_traczione_kgcm2',
+    'modulo_elastico_kgcm2',
+    'diametro_min_mm',
+    'diametro_max_mm',
+)
+_CAMPI_TESTO_ACCIAIO = ('nome', 'sigla', 'tipo', 'classificazione', 'tipo_aderenza', 'note')
+
+
+def _costruisci_colonne_acciai(dati: Tuple[Dict, ...]) -> Dict[str, object]:
+    """Costruisce le colonne dell'archivio acciai a partire dai dati della tabella."""
+    colonne: Dict[str, object] = {
+        campo: np.array([d[campo] for d in dati], dtype=float)
+        for campo in _CAMPI_NUMERICI_ACCIAIO
+    }
+    colonne['aderenza_migliorata'] = np.array([d['aderenza_migliorata'] for d in dati], dtype=bool)
+    for campo in _CAMPI_TESTO_ACCIAIO:
+        colonne[campo] = [d[campo] for d in dati]
+    return colonne
+
+
+ACCIAI_COLONNE: Dict[str, object] = _costruisci_colonne_acciai(_ACCIAI_DATI)
+
+
+# ======================================================================================
+# FORMULE DI VALIDAZIONE (Santarella - RD 2229/1939)
+# ======================================================================================
+
+class CodiceAvviso(IntEnum):
+    """Codici degli avvisi di validazione (il testo è in _MESSAGGI_AVVISI)."""
+    
+    # Calcestruzzo
+    CLS_RAPPORTO_BASSO = 1
+    CLS_RAPPORTO_ALTO = 2
+    CLS_TAU_BASSO = 3
+    CLS_TAU_ALTO = 4
+    CLS_EC_ANOMALO = 5
+    CLS_N_ANOMALO = 6
+    CLS_SIGMA_FUORI_RANGE = 7
+    # Acciaio
+    ACC_RAPPORTO_BASSO = 11
+    ACC_RAPPORTO_ALTO = 12
+    ACC_ES_ANOMALO = 13
+    ACC_SIGMA_FUORI_RANGE = 14
+
+
+# Testo degli avvisi, formattato solo quando richiesto (format_avvisi)
+_MESSAGGI_AVVISI: Dict[CodiceAvviso, str] = {
+    CodiceAvviso.CLS_RAPPORTO_BASSO:
+        "⚠ Carico ammissibile molto basso: {rapporto:.1%} (tipico: 8-12%)",
+    CodiceAvviso.CLS_RAPPORTO_ALTO:
+        "⚠ Carico ammissibile molto alto: {rapporto:.1%} (tipico: 8-12%)",
+    CodiceAvviso.CLS_TAU_BASSO:
+        "⚠ Taglio ammissibile basso: {rapporto_tau:.1%} di compressione (tipico: 10-15%)",
+    CodiceAvviso.CLS_TAU_ALTO:
+        "⚠ Taglio ammissibile alto: {rapporto_tau:.1%} di compressione (tipico: 10-15%)",
+    CodiceAvviso.CLS_EC_ANOMALO:
+        "⚠ Modulo elastico anomalo: {ec:.0f} vs atteso {ec_atteso:.0f} (errore {errore_ec:.1%})",
+    CodiceAvviso.CLS_N_ANOMALO:
+        "⚠ Coefficiente omogeneizzazione anomalo: {n:.2f} vs atteso {n_atteso:.2f} (errore {errore_n:.1%})",
+    CodiceAvviso.CLS_SIGMA_FUORI_RANGE:
+        "⚠ Resistenza fuori range storico: {sigma_c} Kg/cm² (storico: 100-500)",
+    CodiceAvviso.ACC_RAPPORTO_BASSO:
+        "⚠ Carico ammissibile basso: {rapporto:.1%} di snervamento (tipico: 40-50%)",
+    CodiceAvviso.ACC_RAPPORTO_ALTO:
+        "⚠ Carico ammissibile alto: {rapporto:.1%} di snervamento (tipico: 40-50%)",
+    CodiceAvviso.ACC_ES_ANOMALO:
+        "⚠ Modulo elastico anomalo: {es:.0f} Kg/cm² (storico: 200,000-210,000)",
+    CodiceAvviso.ACC_SIGMA_FUORI_RANGE:
+        "⚠ Snervamento fuori range storico: {sigma_y} Kg/cm² (storico: 300-1000)",
+}
+
+# Soglie dei controlli: (grandezza, minimo, massimo, codice_sotto, codice_sopra).
+_CONTROLLI_CALCESTRUZZO = (
     # 1. Rapporto sigma_amm / sigma_c
-    rapporto = sigma_amm / sigma_c if sigma_c > 0 else 0
-    if rapporto < 0.08:
-        avvisi.append(f"⚠ Carico ammissibile molto basso: {rapporto:.1%} (tipico: 8-12%)")
-    elif rapporto > 0.15:
-        avvisi.append(f"⚠ Carico ammissibile molto alto: {rapporto:.1%} (tipico: 8-12%)")
-    
+    ("rapporto", 0.08, 0.15,
+     CodiceAvviso.CLS_RAPPORTO_BASSO, CodiceAvviso.CLS_RAPPORTO_ALTO),
     # 2. Rapporto tau_amm / sigma_amm (tipicamente 10-15%)
-    rapporto_tau = tau_amm / sigma_amm if sigma_amm > 0 else 0
-    if rapporto_tau < 0.08:
-        avvisi.append(f"⚠ Taglio ammissibile basso: {rapporto_tau:.1%} di compressione (tipico: 10-15%)")
-    elif rapporto_tau > 0.20:
-        avvisi.append(f"⚠ Taglio ammissibile alto: {rapporto_tau:.1%} di compressione (tipico: 10-15%)")
-    
+    ("rapporto_tau", 0.08, 0.20,
+     CodiceAvviso.CLS_TAU_BASSO, CodiceAvviso.CLS_TAU_ALTO),
     # 3. Formula Santarella: Ec = 550000 * sigma_c / (sigma_c + 200)
-    ec_atteso = 550000 * sigma_c / (sigma_c + 200) if sigma_c > 0 else 0
-    errore_ec = abs(ec - ec_atteso) / ec_atteso if ec_atteso > 0 else 0
-    if errore_ec > 0.20:
-        avvisi.append(f"⚠ Modulo elastico anomalo: {ec:.0f} vs atteso {ec_atteso:.0f} (errore {errore_ec:.1%})")
-    
+    ("errore_ec", -math.inf, 0.20,
+     None, CodiceAvviso.CLS_EC_ANOMALO),
     # 4. Coefficiente omogenizzazione: n = Es / Ec (Es = 2,000,000 Kg/cm²)
-    es = 2000000
-    n_atteso = es / ec if ec > 0 else 0
-    errore_n = abs(n - n_atteso) / n_atteso if n_atteso > 0 else 0
-    if errore_n > 0.15:
-        avvisi.append(f"⚠ Coefficiente omogeneizzazione anomalo: {n:.2f} vs atteso {n_atteso:.2f} (errore {errore_n:.1%})")
-    
+    ("errore_n", -math.inf, 0.15,
+     None, CodiceAvviso.CLS_N_ANOMALO),
     # 5. Range generali storici
-    if sigma_c < 100 or sigma_c > 500:
-        avvisi.append(f"⚠ Resistenza fuori range storico: {sigma_c} Kg/cm² (storico: 100-500)")
+    ("sigma_c", 100, 500,
+     CodiceAvviso.CLS_SIGMA_FUORI_RANGE, CodiceAvviso.CLS_SIGMA_FUORI_RANGE),
+)
+
+_CONTROLLI_ACCIAIO = (
+    # 1. Rapporto sigma_amm / sigma_y (tipicamente 40-50%)
+    ("rapporto", 0.35, 0.60,
+     CodiceAvviso.ACC_RAPPORTO_BASSO, CodiceAvviso.ACC_RAPPORTO_ALTO),
+    # 2. Modulo elastico (Es tipicamente 200,000-210,000 Kg/cm²)
+    ("es", 190000, 220000,
+     CodiceAvviso.ACC_ES_ANOMALO, CodiceAvviso.ACC_ES_ANOMALO),
+    # 3. Range generali storici
+    ("sigma_y", 300, 1000,
+     CodiceAvviso.ACC_SIGMA_FUORI_RANGE, CodiceAvviso.ACC_SIGMA_FUORI_RANGE),
+)
+
+# Avviso non ancora formattato: (codice, grandezze per il messaggio)
+Avviso = Tuple[CodiceAvviso, Mapping[str, float]]
+
+
+def _applica_controlli(controlli: Tuple, valori: Dict[str, float]) -> Tuple[Avviso, ...]:
+    """Confronta i valori con le soglie e restituisce i codici dei controlli superati."""
+    grandezze = MappingProxyType(valori)
+    avvisi = []
+    for chiave, minimo, massimo, codice_sotto, codice_sopra in controlli:
+        valore = valori[chiave]
+        if valore < minimo:
+            avvisi.append((codice_sotto, grandezze))
+        elif valore > massimo:
+            avvisi.append((codice_sopra, grandezze))
+    return tuple(avvisi)
+
+
+def format_avvisi(avvisi: Tuple[Avviso, ...]) -> List[str]:
+    """
+    Converte gli avvisi codificati nei messaggi testuali.
+    
+    Args:
+        avvisi: Sequenza di (codice, grandezze) restituita da valida_*(formatta=False)
+    
+    Returns:
+        Lista dei messaggi, nello stesso ordine
+    """
+    return [_MESSAGGI_AVVISI[codice].format_map(grandezze) for codice, grandezze in avvisi]
+
+
+def _grandezze_santarella(sigma_c: float, sigma_amm: float, tau_amm: float,
+                          ec: float, n: float) -> Tuple[float, float, float, float, float, float]:
+    """
+    Grandezze numeriche dei controlli sul calcestruzzo.
+    
+    Returns:
+        (rapporto, rapporto_tau, ec_atteso, errore_ec, n_atteso, errore_n)
+    """
+    # Un solo controllo per denominatore: ec_atteso > 0 se e solo se sigma_c > 0,
+    # n_atteso > 0 se e solo se Ec è positivo e finito
+    rapporto = ec_atteso = errore_ec = 0.0
+    if sigma_c > 0:
+        rapporto = sigma_amm / sigma_c
+        # Formula Santarella: Ec = 550000 * sigma_c / (sigma_c + 200)
+        ec_atteso = 550000 * sigma_c / (sigma_c + 200)
+        errore_ec = abs(ec - ec_atteso) / ec_atteso
+    
+    rapporto_tau = tau_amm / sigma_amm if sigma_amm > 0 else 0.0
+    
+    n_atteso = errore_n = 0.0
+    if 0 < ec < math.inf:  # con Ec infinito n_atteso sarebbe nullo
+        # n = Es / Ec (Es = 2,000,000 Kg/cm²)
+        n_atteso = 2000000 / ec
+        errore_n = abs(n - n_atteso) / n_atteso
+    
+    return rapporto, rapporto_tau, ec_atteso, errore_ec, n_atteso, errore_n
+
+
+@lru_cache(maxsize=1024)
+def _valida_calcestruzzo_cache(sigma_c: float, sigma_amm: float, tau_amm: float,
+                               ec: float, n: float) -> Tuple[bool, Tuple[Avviso, ...]]:
+    """Validazione calcestruzzo memoizzata: restituisce gli avvisi codificati (non formattati)."""
+    rapporto, rapporto_tau, ec_atteso, errore_ec, n_atteso, errore_n = _grandezze_santarella(
+        float(sigma_c), float(sigma_amm), float(tau_amm), float(ec), float(n)
+    )
+    valori = {
+        'sigma_c': sigma_c,
+        'ec': ec,
+        'n': n,
+        'ec_atteso': ec_atteso,
+        'n_atteso': n_atteso,
+        'rapporto': rapporto,
+        'rapporto_tau': rapporto_tau,
+        'errore_ec': errore_ec,
+        'errore_n': errore_n,
+    }
+    avvisi = _applica_controlli(_CONTROLLI_CALCESTRUZZO, valori)
     
     # È valido se non ha avvisi gravi (sigma_amm = 0 è grave)
     è_valido = sigma_amm > 0 and tau_amm > 0 and ec > 0
@@ -499,34 +720,125 @@ def valida_calcestruzzo(sigma_c: float, sigma_amm: float, tau_amm: float,
     return è_valido, avvisi
 
 
-def valida_acciaio(sigma_y: float, sigma_amm: float, es: float) -> Tuple[bool, List[str]]:
+@lru_cache(maxsize=1024)
+def _valida_acciaio_cache(sigma_y: float, sigma_amm: float,
+                          es: float) -> Tuple[bool, Tuple[Avviso, ...]]:
+    """Validazione acciaio memoizzata: restituisce gli avvisi codificati (non formattati)."""
+    valori = {
+        'sigma_y': sigma_y,
+        'es': es,
+        'rapporto': sigma_amm / sigma_y if sigma_y > 0 else 0,
+    }
+    avvisi = _applica_controlli(_CONTROLLI_ACCIAIO, valori)
+    
+    # È valido
+    è_valido = sigma_y > 0 and sigma_amm > 0 and es > 0
+    
+    return è_valido, avvisi
+
+
+def valida_calcestruzzo(sigma_c: float, sigma_amm: float, tau_amm: float, 
+                        ec: float, n: float, formatta: bool = True) -> Tuple[bool, List]:
     """
-    Valida i parametri di un acciaio secondo le norme RD 2229/1939.
+    Valida i parametri di un calcestruzzo secondo le formule di Santarella.
+    
+    Args:
+        formatta: Se False gli avvisi restano codificati come (CodiceAvviso, grandezze),
+            da convertire in testo con format_avvisi solo se servono
     
     Returns:
         (è_valido, lista_avvisi)
     """
-    avvisi = []
-    
-    # 1. Rapporto sigma_amm / sigma_y (tipicamente 40-50%)
-    rapporto = sigma_amm / sigma_y if sigma_y > 0 else 0
-    if rapporto < 0.35:
-        avvisi.append(f"⚠ Carico ammissibile basso: {rapporto:.1%} di snervamento (tipico: 40-50%)")
-    elif rapporto > 0.60:
-        avvisi.append(f"⚠ Carico ammissibile alto: {rapporto:.1%} di snervamento (tipico: 40-50%)")
+    è_valido, avvisi = _valida_calcestruzzo_cache(sigma_c, sigma_amm, tau_amm, ec, n)
+    return è_valido, format_avvisi(avvisi) if formatta else list(avvisi)
+
+
+def valida_acciaio(sigma_y: float, sigma_amm: float, es: float,
+                   formatta: bool = True) -> Tuple[bool, List]:
+    """
+    Valida i parametri di un acciaio secondo le norme RD 2229/1939.
     
-    # 2. Modulo elastico (Es tipicamente 200,000-210,000 Kg/cm²)
-    if es < 190000 or es > 220000:
-        avvisi.append(f"⚠ Modulo elastico anomalo: {es:.0f} Kg/cm² (storico: 200,000-210,000)")
+    Args:
+        formatta: Se False gli avvisi restano codificati come (CodiceAvviso, grandezze),
+            da convertire in testo con format_avvisi solo se servono
     
-    # 3. Range generali storici
-    if sigma_y < 300 or sigma_y > 1000:
-        avvisi.append(f"⚠ Snervamento fuori range storico: {sigma_y} Kg/cm² (storico: 300-1000)")
+    Returns:
+        (è_valido, lista_avvisi)
+    """
+    è_valido, avvisi = _valida_acciaio_cache(sigma_y, sigma_amm, es)
+    return è_valido, format_avvisi(avvisi) if formatta else list(avvisi)
+
+
+def _esiti_controlli(controlli: Tuple, valori: Dict[str, np.ndarray]) -> np.ndarray:
+    """Matrice (N, K) degli esiti dei controlli: -1 sotto soglia, +1 sopra soglia, 0 nel range."""
+    esiti = np.zeros((len(next(iter(valori.values()))), len(controlli)), dtype=np.int8)
+    for k, (chiave, minimo, massimo, _, _) in enumerate(controlli):
+        valore = valori[chiave]
+        esiti[valore < minimo, k] = -1
+        esiti[valore > massimo, k] = 1
+    return esiti
+
+
+def valida_calcestruzzi_batch(sigma_c: np.ndarray, sigma_amm: np.ndarray, tau_amm: np.ndarray,
+                              ec: np.ndarray, n: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Valida in blocco N calcestruzzi (versione vettoriale di valida_calcestruzzo).
     
-    # È valido
-    è_valido = sigma_y > 0 and sigma_amm > 0 and es > 0
+    Returns:
+        (validi, esiti): vettore booleano (N,) e matrice int8 (N, K) con un esito
+        per controllo, nell'ordine di _CONTROLLI_CALCESTRUZZO
+        (-1 sotto soglia, +1 sopra soglia, 0 nel range)
+    """
+    sigma_c, sigma_amm, tau_amm, ec, n = (
+        np.atleast_1d(np.asarray(v, dtype=float)) for v in (sigma_c, sigma_amm, tau_amm, ec, n)
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ec_atteso = np.where(sigma_c > 0, 550000 * sigma_c / (sigma_c + 200), 0.0)
+        n_atteso = np.where(ec > 0, 2000000 / ec, 0.0)
+        valori = {
+            'sigma_c': sigma_c,
+            'rapporto': np.where(sigma_c > 0, sigma_amm / sigma_c, 0.0),
+            'rapporto_tau': np.where(sigma_amm > 0, tau_amm / sigma_amm, 0.0),
+            'errore_ec': np.where(ec_atteso > 0, np.abs(ec - ec_atteso) / ec_atteso, 0.0),
+            'errore_n': np.where(n_atteso > 0, np.abs(n - n_atteso) / n_atteso, 0.0),
+        }
+    
+    validi = (sigma_amm > 0) & (tau_amm > 0) & (ec > 0)
+    return validi, _esiti_controlli(_CONTROLLI_CALCESTRUZZO, valori)
+
+
+def valida_acciai_batch(sigma_y: np.ndarray, sigma_amm: np.ndarray,
+                        es: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Valida in blocco N acciai (versione vettoriale di valida_acciaio).
     
-    return è_valido, avvisi
+    Returns:
+        (validi, esiti): vettore booleano (N,) e matrice int8 (N, K) con un esito
+        per controllo, nell'ordine di _CONTROLLI_ACCIAIO
+        (-1 sotto soglia, +1 sopra soglia, 0 nel range)
+    """
+    sigma_y, sigma_amm, es = (
+        np.atleast_1d(np.asarray(v, dtype=float)) for v in (sigma_y, sigma_amm, es)
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valori = {
+            'sigma_y': sigma_y,
+            'es': es,
+            'rapporto': np.where(sigma_y > 0, sigma_amm / sigma_y, 0.0),
+        }
+    
+    validi = (sigma_y > 0) & (sigma_amm > 0) & (es > 0)
+    return validi, _esiti_controlli(_CONTROLLI_ACCIAIO, valori)
+
+
+# Formati della tabella comparativa (calcolati una sola volta)
+_LINEA_TABELLA_COMPARATIVA = "=" * 140
+_INTESTAZIONE_TABELLA_COMPARATIVA = (
+    f"{'Nome':<20} {'Tipo':<12} {'Sigma [Kg/cm²]':<15} {'Sigma Amm [Kg/cm²]':<18} "
+    f"{'Tau/Sigma [%]':<15} {'Ec [Kg/cm²]':<15} {'n':<8} {'Aderenza':<10}"
+)
+_FORMATO_RIGA_CALCESTRUZZO = "{:<20} {:<12} {:<15.0f} {:<18.1f} {:<15.1f} {:<15.0f} {:<8.2f} {:<10}"
+_FORMATO_RIGA_ACCIAIO = "{:<20} {:<12} {:<15.0f} {:<18.1f} {:<15.1f} {:<15.0f} {:<8} {:<10}"
 
 
 def crea_tabella_comparativa(materiali: List[Dict]) -> str:
@@ -534,40 +846,55 @@ def crea_tabella_comparativa(materiali: List[Dict]) -> str:
     if not materiali:
         return "Nessun materiale disponibile."
     
-    linea = "=" * 140
-    header = f"{'Nome':<20} {'Tipo':<12} {'Sigma [Kg/cm²]':<15} {'Sigma Amm [Kg/cm²]':<18} {'Tau/Sigma [%]':<15} {'Ec [Kg/cm²]':<15} {'n':<8} {'Aderenza':<10}"
-    
-    tabella = linea + "\n" + header + "\n" + linea + "\n"
-    
-    for mat in materiali:
-        if mat.get('tipo_mat') == 'calcestruzzo':
-            aderenza = ""
-            rapporto_tau = (mat['tau_ammissibile_kgcm2'] / mat['sigma_c_ammissibile_kgcm2'] * 100) if mat['sigma_c_ammissibile_kgcm2'] > 0 else 0
-            row = (f"{mat['nome']:<20} {'CLS':<12} {mat['sigma_c_kgcm2']:<15.0f} "
-                  f"{mat['sigma_c_ammissibile_kgcm2']:<18.1f} {rapporto_tau:<15.1f} "
-                  f"{mat['modulo_elastico_kgcm2']:<15.0f} {mat['coefficiente_omogeneo']:<8.2f} {aderenza:<10}")
-        else:
-            aderenza = "Si" if mat['aderenza_migliorata'] else "No"
-            rapporto_amm = (mat['sigma_ammissibile_kgcm2'] / mat['sigma_y_kgcm2'] * 100) if mat['sigma_y_kgcm2'] > 0 else 0
-            row = (f"{mat['nome']:<20} {mat['tipo']:<12} {mat['sigma_y_kgcm2']:<15.0f} "
-                  f"{mat['sigma_ammissibile_kgcm2']:<18.1f} {rapporto_amm:<15.1f} "
-                  f"{mat['modulo_elastico_kgcm2']:<15.0f} {'':<8} {aderenza:<10}")
-        
-        tabella += row + "\n"
+    linea = _LINEA_TABELLA_COMPARATIVA
+    formato_calcestruzzo = _FORMATO_RIGA_CALCESTRUZZO.format
+    formato_acciaio = _FORMATO_RIGA_ACCIAIO.format
+    
+    # Ripartizione unica per tipo; le posizioni originali conservano l'ordine delle righe
+    calcestruzzi = []
+    acciai = []
+    for i, mat in enumerate(materiali):
+        (calcestruzzi if mat.get('tipo_mat') == 'calcestruzzo' else acciai).append((i, mat))
+    
+    corpo = [""] * len(materiali)
+    
+    for i, mat in calcestruzzi:
+        sigma_amm = mat['sigma_c_ammissibile_kgcm2']
+        rapporto = mat['tau_ammissibile_kgcm2'] / sigma_amm * 100 if sigma_amm > 0 else 0
+        corpo[i] = formato_calcestruzzo(mat['nome'], 'CLS', mat['sigma_c_kgcm2'], sigma_amm,
+                                        rapporto, mat['modulo_elastico_kgcm2'],
+                                        mat['coefficiente_omogeneo'], "")
+    
+    for i, mat in acciai:
+        sigma = mat['sigma_y_kgcm2']
+        sigma_amm = mat['sigma_ammissibile_kgcm2']
+        rapporto = sigma_amm / sigma * 100 if sigma > 0 else 0
+        corpo[i] = formato_acciaio(mat['nome'], mat['tipo'], sigma, sigma_amm, rapporto,
+                                   mat['modulo_elastico_kgcm2'], "",
+                                   "Si" if mat['aderenza_migliorata'] else "No")
+    
+    return "\n".join([linea, _INTESTAZIONE_TABELLA_COMPARATIVA, linea, *corpo, linea])
+
+
+@lru_cache(maxsize=None)
+def tabella_comparativa_acciai_testo() -> str:
+    """
+    Tabella comparativa degli acciai storici.
     
-    tabella += linea
-    return tabella
+    I dati sono statici: il testo è generato una volta sola e poi riutilizzato.
+    """
+    return crea_tabella_comparativa(elenca_acciai_dict())
 
 
-def elenca_calcestruzzi_dict() -> List[Dict]:
-    """Elenca calcestruzzi come dizionari."""
-    result = []
-    for c in CALCESTRUZZI_STORICI:
-        result.append({
+@lru_cache(maxsize=None)
+def _elenco_calcestruzzi() -> Tuple[Mapping, ...]:
+    """Elenco calcestruzzi materializzato una volta, in sola lettura."""
+    return tuple(
+        MappingProxyType({
             'tipo_mat': 'calcestruzzo',
             'nome': c.nome,
             'sigma_c_kgcm2': c.sigma_c_kgcm2,
-            'sigma_c_ammissibile_kgcm2': c.sigma_c_ammissibile_kgcm2,
+            'sigma_c_ammissibile_kgcm2': c.sigma_c_inflessa_kgcm2,
             'tau_ammissibile_kgcm2': c.tau_ammissibile_kgcm2,
             'modulo_elastico_kgcm2': c.modulo_elastico_kgcm2,
             'coefficiente_omogeneo': c.coefficiente_omogeneo,
@@ -575,21 +902,42 @@ def elenca_calcestruzzi_dict() -> List[Dict]:
             'rapporto_ac': c.rapporto_ac,
             'note': c.note
         })
-    return result
+        for c in CALCESTRUZZI_COMPLETI
+    )
 
 
-def elenca_acciai_dict() -> List[Dict]:
-    """Elenca acciai come dizionari."""
-    result = []
-    for a in ACCIAI_STORICI:
-        result.append({
+@lru_cache(maxsize=None)
+def _elenco_acciai() -> Tuple[Mapping, ...]:
+    """Elenco acciai materializzato una volta dall'archivio colonnare, in sola lettura."""
+    col = ACCIAI_COLONNE
+    return tuple(
+        MappingProxyType({
             'tipo_mat': 'acciaio',
-            'nome': a.nome,
-            'tipo': a.tipo,
-            'sigma_y_kgcm2': a.sigma_y_kgcm2,
-            'sigma_ammissibile_kgcm2': a.sigma_ammissibile_kgcm2,
-            'modulo_elastico_kgcm2': a.modulo_elastico_kgcm2,
-            'aderenza_migliorata': a.aderenza_migliorata,
-            'note': a.note
+            'nome': nome,
+            'tipo': tipo,
+            'sigma_y_kgcm2': sigma_y,
+            'sigma_ammissibile_kgcm2': sigma_amm,
+            'modulo_elastico_kgcm2': es,
+            'aderenza_migliorata': aderenza,
+            'note': note
         })
-    return result
+        for nome, tipo, sigma_y, sigma_amm, es, aderenza, note in zip(
+            col['nome'],
+            col['tipo'],
+            col['sigma_y_kgcm2'].tolist(),
+            col['sigma_ammissibile_traczione_kgcm2'].tolist(),
+            col['modulo_elastico_kgcm2'].tolist(),
+            col['aderenza_migliorata'].tolist(),
+            col['note'],
+        )
+    )
+
+
+def elenca_calcestruzzi_dict() -> List[Dict]:
+    """Elenca calcestruzzi come dizionari (copie modificabili dall'elenco in cache)."""
+    return [dict(c) for c in _elenco_calcestruzzi()]
+
+
+def elenca_acciai_dict() -> List[Dict]:
+    """Elenca acciai come dizionari (copie modificabili dall'elenco in cache)."""
+    return [dict(a) for a in _elenco_acciai()]
@@ -12,11 +12,18 @@ Contiene:
 - Percentuali umidità (quando disponibili)
 """
 
-from typing import Dict, Optional, Tuple
+import io
+from bisect import bisect_left
+from typing import Dict, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
+import numpy as np
 
-@dataclass
+from verifiche_dm1939.core.compat import DATACLASS_SLOTS
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DosaturaMalta:
     """Dosatura malta per 1 m³."""
     
@@ -28,6 +35,23 @@ class DosaturaMalta:
     umidita_percentuale: Optional[float] = None  # %
 
 
+class DosaturaInterpolata(NamedTuple):
+    """Dosatura per 1 m³ interpolata dalla Tabella III."""
+    
+    cemento_kg: float                  # kg/m³
+    sabbia_kg: float                   # kg/m³
+    peso_specifico_apparente: float    # kg/m³
+
+
+class QuantitativiMalta(NamedTuple):
+    """Quantitativi malta per un volume dato."""
+    
+    cemento_kg: float                  # kg
+    sabbia_kg: float                   # kg
+    peso_specifico_apparente: float    # kg/m³
+    peso_totale_malta: float           # kg
+
+
 # ============================================================================
 # TABELLA III - DOSATURA MALTA PER 1 M³
 # Da pag. 6-7 del documento RD 2229 (Santarella)
@@ -86,18 +110,37 @@ TABELLA_III_MALTA = [
 
 
 # ============================================================================
-# DIZIONARIO ACCESSO VELOCE
+# ARCHIVIO INDICIZZATO (unico per tutte le ricerche)
 # ============================================================================
 
-MALTA_PER_RAPPORTO: Dict[str, DosaturaMalta] = {
-    dosatura.rapporto_ac: dosatura
-    for dosatura in TABELLA_III_MALTA
+# Righe ordinate per rapporto A/C e colonne parallele per ricerca e interpolazione
+_DOSATURE_ORDINATE: Tuple[DosaturaMalta, ...] = tuple(
+    sorted(TABELLA_III_MALTA, key=lambda d: d.rapporto_ac_numerico)
+)
+_RAPPORTI_ORDINATI: Tuple[float, ...] = tuple(d.rapporto_ac_numerico for d in _DOSATURE_ORDINATE)
+# Una riga per rapporto: [cemento_kg, sabbia_kg, peso_specifico_apparente]
+_QUANTITATIVI = np.array(
+    [[d.cemento_kg, d.sabbia_kg, d.peso_specifico_apparente] for d in _DOSATURE_ORDINATE],
+    dtype=float,
+)
+# Rapporto in formato stringa (es. "1:1.40") -> posizione nell'archivio
+_INDICE_PER_RAPPORTO: Dict[str, int] = {
+    d.rapporto_ac: i for i, d in enumerate(_DOSATURE_ORDINATE)
 }
 
-MALTA_PER_RAPPORTO_NUMERICO: Dict[float, DosaturaMalta] = {
-    dosatura.rapporto_ac_numerico: dosatura
-    for dosatura in TABELLA_III_MALTA
-}
+
+def __getattr__(nome: str):
+    # Dizionari di accesso storici, costruiti dall'archivio al primo accesso:
+    # MALTA_PER_RAPPORTO (Dict[str, DosaturaMalta]) e
+    # MALTA_PER_RAPPORTO_NUMERICO (Dict[float, DosaturaMalta])
+    if nome == "MALTA_PER_RAPPORTO":
+        dizionario = {d.rapporto_ac: d for d in _DOSATURE_ORDINATE}
+    elif nome == "MALTA_PER_RAPPORTO_NUMERICO":
+        dizionario = {d.rapporto_ac_numerico: d for d in _DOSATURE_ORDINATE}
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    globals()[nome] = dizionario
+    return dizionario
 
 
 # ============================================================================
@@ -114,7 +157,8 @@ def get_malta_da_rapporto(rapporto_ac: str) -> Optional[DosaturaMalta]:
     Returns:
         Oggetto DosaturaMalta o None se non trovato
     """
-    return MALTA_PER_RAPPORTO.get(rapporto_ac)
+    i = _INDICE_PER_RAPPORTO.get(rapporto_ac)
+    return None if i is None else _DOSATURE_ORDINATE[i]
 
 
 def get_malta_da_rapporto_numerico(rapporto: float) -> Optional[DosaturaMalta]:
@@ -127,14 +171,58 @@ def get_malta_da_rapporto_numerico(rapporto: float) -> Optional[DosaturaMalta]:
     Returns:
         Oggetto DosaturaMalta o None se non trovato
     """
-    # Cerca il valore esatto o il più vicino
-    for rap_nominale, dosatura in sorted(MALTA_PER_RAPPORTO_NUMERICO.items()):
-        if abs(rap_nominale - rapporto) < 0.1:
-            return dosatura
+    # Cerca il valore esatto o il più vicino tra i due tabulati adiacenti
+    i = bisect_left(_RAPPORTI_ORDINATI, rapporto)
+    for j in (i - 1, i):
+        if 0 <= j < len(_RAPPORTI_ORDINATI) and abs(_RAPPORTI_ORDINATI[j] - rapporto) < 0.1:
+            return _DOSATURE_ORDINATE[j]
     
     return None
 
 
+@lru_cache(maxsize=128)
+def _interpola_dosatura_cache(rapporto_ac: float) -> Optional[DosaturaInterpolata]:
+    """Interpolazione memoizzata della dosatura per 1 m³."""
+    rapporti = _RAPPORTI_ORDINATI
+    i = bisect_left(rapporti, rapporto_ac)
+    
+    # Verifica se è un valore tabulato (tra i due adiacenti)
+    for j in (i - 1, i):
+        if 0 <= j < len(rapporti) and abs(rapporti[j] - rapporto_ac) < 0.05:
+            dosatura = _DOSATURE_ORDINATE[j]
+            return DosaturaInterpolata(
+                dosatura.cemento_kg, dosatura.sabbia_kg, dosatura.peso_specifico_apparente
+            )
+    
+    # Fuori dal campo tabulato (anche NaN): nessuna estrapolazione
+    if not (rapporti[0] <= rapporto_ac <= rapporti[-1]):
+        return None
+    
+    # Interpolazione lineare tra i due valori che racchiudono rapporto_ac
+    i = min(max(i, 1), len(rapporti) - 1)
+    peso = (rapporto_ac - rapporti[i - 1]) / (rapporti[i] - rapporti[i - 1])
+    
+    return DosaturaInterpolata._make(
+        (_QUANTITATIVI[i - 1] + peso * (_QUANTITATIVI[i] - _QUANTITATIVI[i - 1])).tolist()
+    )
+
+
+@lru_cache(maxsize=256)
+def _calcola_malta_cache(rapporto_ac: float, volume_m3: float) -> Optional[QuantitativiMalta]:
+    """Quantitativi malta memoizzati per un volume dato."""
+    dosatura = _interpola_dosatura_cache(rapporto_ac)
+    
+    if dosatura is None:
+        return None
+    
+    return QuantitativiMalta(
+        dosatura.cemento_kg * volume_m3,
+        dosatura.sabbia_kg * volume_m3,
+        dosatura.peso_specifico_apparente,
+        dosatura.peso_specifico_apparente * volume_m3,
+    )
+
+
 def interpola_dosatura_malta(rapporto_ac: float) -> Optional[Dict[str, float]]:
     """
     Interpola linealmente dosatura per rapporti A/C intermedi.
@@ -145,41 +233,8 @@ def interpola_dosatura_malta(rapporto_ac: float) -> Optional[Dict[str, float]]:
     Returns:
         Dizionario con cemento_kg, sabbia_kg, peso_specifico_apparente
     """
-    rapporti_ordinati = sorted(MALTA_PER_RAPPORTO_NUMERICO.keys())
-    
-    # Verifica se è un valore tabulato
-    for rap in rapporti_ordinati:
-        if abs(rap - rapporto_ac) < 0.05:
-            dosatura = MALTA_PER_RAPPORTO_NUMERICO[rap]
-            return {
-                "cemento_kg": dosatura.cemento_kg,
-                "sabbia_kg": dosatura.sabbia_kg,
-                "peso_specifico_apparente": dosatura.peso_specifico_apparente,
-            }
-    
-    # Interpolazione lineare tra due valori
-    for i in range(len(rapporti_ordinati) - 1):
-        rap1 = rapporti_ordinati[i]
-        rap2 = rapporti_ordinati[i + 1]
-        
-        if rap1 <= rapporto_ac <= rap2:
-            dosatura1 = MALTA_PER_RAPPORTO_NUMERICO[rap1]
-            dosatura2 = MALTA_PER_RAPPORTO_NUMERICO[rap2]
-            
-            # Peso interpolazione
-            peso = (rapporto_ac - rap1) / (rap2 - rap1)
-            
-            cemento_interp = dosatura1.cemento_kg + peso * (dosatura2.cemento_kg - dosatura1.cemento_kg)
-            sabbia_interp = dosatura1.sabbia_kg + peso * (dosatura2.sabbia_kg - dosatura1.sabbia_kg)
-            peso_spec_interp = dosatura1.peso_specifico_apparente + peso * (dosatura2.peso_specifico_apparente - dosatura1.peso_specifico_apparente)
-            
-            return {
-                "cemento_kg": cemento_interp,
-                "sabbia_kg": sabbia_interp,
-                "peso_specifico_apparente": peso_spec_interp,
-            }
-    
-    return None
+    dosatura = _interpola_dosatura_cache(rapporto_ac)
+    return None if dosatura is None else dosatura._asdict()
 
 
 def calcola_malta_per_volume(rapporto_ac: float, volume_m3: float) -> Optional[Dict[str, float]]:
@@ -193,23 +248,17 @@ def calcola_malta_per_volume(rapporto_ac: float, volume_m3: float) -> Optional[D
     Returns:
         Dizionario con quantitativi in kg
     """
-    dosatura = interpola_dosatura_malta(rapporto_ac)
-    
-    if dosatura is None:
-        return None
-    
-    return {
-        "cemento_kg": dosatura["cemento_kg"] * volume_m3,
-        "sabbia_kg": dosatura["sabbia_kg"] * volume_m3,
-        "peso_specifico_apparente": dosatura["peso_specifico_apparente"],
-        "peso_totale_malta": dosatura["peso_specifico_apparente"] * volume_m3,
-    }
+    quantitativi = _calcola_malta_cache(rapporto_ac, volume_m3)
+    return None if quantitativi is None else quantitativi._asdict()
 
 
+@lru_cache(maxsize=None)
 def genera_tabella_malta_testo() -> str:
     """
     Genera rappresentazione testuale della Tabella III.
     
+    La tabella è statica: il testo è generato una volta sola e poi riutilizzato.
+    
     Returns:
         Stringa formattata della tabella
     """
@@ -235,30 +284,34 @@ def genera_tabella_malta_testo() -> str:
     return "\n".join(output)
 
 
+@lru_cache(maxsize=None)
 def genera_tabella_malta_html() -> str:
     """
     Genera rappresentazione HTML della Tabella III.
     
+    La tabella è statica: l'HTML è generato una volta sola e poi riutilizzato.
+    
     Returns:
         String HTML
     """
-    html = []
-    html.append('<div class="tabella-malta">')
-    html.append('<h3>Tabella III - Quantitativi Cemento e Sabbia per 1 m³ Malta</h3>')
-    html.append('<table border="1" cellpadding="8">')
-    html.append('<tr><th>Rapporto A/C</th><th>Cemento (kg/m³)</th><th>Sabbia (kg/m³)</th><th>Peso spec. app. (kg/m³)</th></tr>')
+    buffer = io.StringIO()
+    w = buffer.write
+    w('<div class="tabella-malta">\n')
+    w('<h3>Tabella III - Quantitativi Cemento e Sabbia per 1 m³ Malta</h3>\n')
+    w('<table border="1" cellpadding="8">\n')
+    w('<tr><th>Rapporto A/C</th><th>Cemento (kg/m³)</th><th>Sabbia (kg/m³)</th><th>Peso spec. app. (kg/m³)</th></tr>\n')
     
     for dosatura in TABELLA_III_MALTA:
-        html.append(
+        w(
             f'<tr>'
             f'<td>{dosatura.rapporto_ac}</td>'
             f'<td>{dosatura.cemento_kg:.0f}</td>'
             f'<td>{dosatura.sabbia_kg:.0f}</td>'
             f'<td>{dosatura.peso_specifico_apparente:.0f}</td>'
-            f'</tr>'
+            f'</tr>\n'
         )
     
-    html.append('</table>')
-    html.append('</div>')
+    w('</table>\n')
+    w('</div>')
     
-    return "\n".join(html)
+    return buffer.getvalue()
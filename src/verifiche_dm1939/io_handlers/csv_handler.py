@@ -5,16 +5,176 @@ Supporta caricamento bulk di dati per verifiche strutturali
 con intestazioni personalizzate.
 """
 
+from dataclasses import dataclass, fields
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
 import csv
+import math
+import os
+import re
+import numpy as np
 import pandas as pd
 
+from verifiche_dm1939.core.compat import PYARROW_DISPONIBILE
 from verifiche_dm1939.materials.calcestruzzo import Calcestruzzo
 from verifiche_dm1939.materials.acciaio import Acciaio
 from verifiche_dm1939.sections.sezione_rettangolare import SezioneRettangolare
 
 
+def _indicizza_alias(intestazioni: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Inverte la tabella delle intestazioni: alias in minuscolo -> chiavi standard.
+    
+    Uno stesso alias può valere per più chiavi (es. "Mx" per momento e momento_x),
+    quindi ogni alias rimanda a una tupla di chiavi, nell'ordine della tabella.
+    """
+    indice: Dict[str, Tuple[str, ...]] = {}
+    for chiave, possibili in intestazioni.items():
+        for alias in possibili:
+            alias = alias.lower()
+            if chiave not in indice.get(alias, ()):
+                indice[alias] = indice.get(alias, ()) + (chiave,)
+    return indice
+
+
+# Valori letti come mancanti (come i na_values predefiniti di pandas)
+_VALORI_MANCANTI = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND",
+    "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+_VALORI_BOOLEANI = {"True": True, "TRUE": True, "true": True,
+                    "False": False, "FALSE": False, "false": False}
+_RE_INTERO = re.compile(r"\s*[+-]?[0-9]+\s*\Z")
+_RE_REALE = re.compile(
+    r"\s*[+-]?(?:(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|inf|infinity)\s*\Z",
+    re.IGNORECASE,
+)
+
+
+def _interpreta_colonna(valori: List[str]) -> List[Any]:
+    """
+    Interpreta i testi di una colonna come farebbe pandas.read_csv.
+    
+    Il tipo è dedotto sull'intera colonna: interi (reali se ci sono valori
+    mancanti), reali, booleani o testo; i valori mancanti diventano NaN.
+    """
+    mancanti = [v in _VALORI_MANCANTI for v in valori]
+    presenti = [v for v, mancante in zip(valori, mancanti) if not mancante]
+    
+    if all(_RE_INTERO.match(v) for v in presenti) and not any(mancanti):
+        return [int(v) for v in valori]
+    if all(_RE_REALE.match(v) for v in presenti):
+        return [math.nan if mancante else float(v) for v, mancante in zip(valori, mancanti)]
+    if all(v in _VALORI_BOOLEANI for v in presenti):
+        return [math.nan if mancante else _VALORI_BOOLEANI[v] for v, mancante in zip(valori, mancanti)]
+    return [math.nan if mancante else v for v, mancante in zip(valori, mancanti)]
+
+
+def _componi_record(chiavi: List[str], colonne: List[List[Any]], n_righe: int) -> List[Dict[str, Any]]:
+    """Record per riga dalle colonne (un dizionario vuoto per riga se non ci sono campi)."""
+    if not chiavi:
+        return [{} for _ in range(n_righe)]
+    return [dict(zip(chiavi, riga)) for riga in zip(*colonne)]
+
+
+@dataclass
+class LottoSezioni:
+    """
+    Dati di N sezioni importate, memorizzati per colonne (un array per campo).
+    
+    Ogni campo è un array NumPy di lunghezza n_sezioni, o None se la colonna
+    non è presente nel file: i calcoli su tutte le sezioni si scrivono
+    direttamente sugli array (es. lotto.base * lotto.altezza).
+    
+    Attributes:
+        n_sezioni: Numero di sezioni (righe del file)
+    """
+    
+    n_sezioni: int = 0
+    
+    # Geometria [mm]
+    base: Optional[np.ndarray] = None
+    altezza: Optional[np.ndarray] = None
+    copriferro: Optional[np.ndarray] = None
+    
+    # Materiali
+    rck: Optional[np.ndarray] = None
+    classe_cls: Optional[np.ndarray] = None
+    tipo_acciaio: Optional[np.ndarray] = None
+    fyk: Optional[np.ndarray] = None
+    
+    # Sollecitazioni
+    momento: Optional[np.ndarray] = None
+    momento_x: Optional[np.ndarray] = None
+    momento_y: Optional[np.ndarray] = None
+    sforzo_normale: Optional[np.ndarray] = None
+    taglio: Optional[np.ndarray] = None
+    
+    # Armatura longitudinale
+    diametro_inf: Optional[np.ndarray] = None
+    numero_inf: Optional[np.ndarray] = None
+    diametro_sup: Optional[np.ndarray] = None
+    numero_sup: Optional[np.ndarray] = None
+    
+    # Armatura trasversale
+    diametro_staffe: Optional[np.ndarray] = None
+    passo_staffe: Optional[np.ndarray] = None
+    bracci_staffe: Optional[np.ndarray] = None
+    
+    # Ferri piegati
+    diametro_piegati: Optional[np.ndarray] = None
+    numero_piegati: Optional[np.ndarray] = None
+    inclinazione_piegati: Optional[np.ndarray] = None
+    
+    # Tipo elemento
+    tipo: Optional[np.ndarray] = None
+    
+    def campi_presenti(self) -> List[str]:
+        """Nomi dei campi presenti nel file, nell'ordine dei record di importa_sezioni."""
+        return [
+            campo.name for campo in fields(self)
+            if campo.name != "n_sezioni" and getattr(self, campo.name) is not None
+        ]
+    
+    def matrice(self, campi: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Matrice (n_sezioni, k) dei campi numerici, in ordine Fortran.
+        
+        Ogni colonna è contigua in memoria: le operazioni per colonna
+        (es. matrice.sum(axis=0)) scorrono dati consecutivi.
+        
+        Args:
+            campi: Campi da includere (default: tutti i campi numerici presenti)
+        
+        Returns:
+            Array float64 con una colonna per campo
+        """
+        if campi is None:
+            campi = [c for c in self.campi_presenti() if getattr(self, c).dtype != object]
+        
+        matrice = np.empty((self.n_sezioni, len(campi)), dtype=np.float64, order="F")
+        for k, campo in enumerate(campi):
+            matrice[:, k] = getattr(self, campo)
+        return matrice
+    
+    def iter_righe(self) -> Iterator[Dict[str, Any]]:
+        """
+        Itera le sezioni come dizionari (stesso formato di importa_sezioni).
+        
+        I dizionari sono creati solo su richiesta, uno per riga.
+        """
+        chiavi = self.campi_presenti()
+        if not chiavi:
+            for _ in range(self.n_sezioni):
+                yield {}
+            return
+        
+        colonne = [getattr(self, chiave).tolist() for chiave in chiavi]
+        for riga in zip(*colonne):
+            yield dict(zip(chiavi, riga))
+
+
 class CSVHandler:
     """
     Gestore import/export dati da CSV.
@@ -64,6 +224,70 @@ class CSVHandler:
         "inclinazione_piegati": ["inclinazione_piegati", "alpha", "angolo"],
     }
     
+    # Indice inverso per la mappatura: alias in minuscolo -> chiavi standard
+    CHIAVI_PER_ALIAS = _indicizza_alias(INTESTAZIONI_STANDARD)
+    
+    # Campi importati per ogni sezione, nell'ordine del dizionario restituito.
+    # Ogni voce elenca le alternative (chiave_standard, tipo): si usa la prima presente.
+    CAMPI_SEZIONE = (
+        # Geometria
+        (("base", float),),
+        (("altezza", float),),
+        (("copriferro", float),),
+        
+        # Materiali
+        (("rck", float), ("classe_cls", str)),
+        (("tipo_acciaio", str), ("fyk", float)),
+        
+        # Sollecitazioni
+        (("momento", float),),
+        (("momento_x", float),),
+        (("momento_y", float),),
+        (("sforzo_normale", float),),
+        (("taglio", float),),
+        
+        # Armatura longitudinale
+        (("diametro_inf", float),),
+        (("numero_inf", int),),
+        (("diametro_sup", float),),
+        (("numero_sup", int),),
+        
+        # Armatura trasversale
+        (("diametro_staffe", float),),
+        (("passo_staffe", float),),
+        (("bracci_staffe", int),),
+        
+        # Ferri piegati
+        (("diametro_piegati", float),),
+        (("numero_piegati", int),),
+        (("inclinazione_piegati", float),),
+        
+        # Tipo elemento
+        (("tipo", str),),
+    )
+    
+    # Campi usati per costruire la sezione, nell'ordine degli argomenti di _componi_sezione
+    CAMPI_COSTRUZIONE = (
+        "base", "altezza", "copriferro",
+        "diametro_inf", "numero_inf", "diametro_sup", "numero_sup",
+        "diametro_staffe", "passo_staffe", "bracci_staffe",
+        "diametro_piegati", "numero_piegati", "inclinazione_piegati",
+    )
+    
+    # dtype pandas delle colonne numeriche
+    DTYPE_CAMPI = {float: "float64", int: "int64"}
+    # Con precisione ridotta: metà memoria (geometrie in mm e numeri di barre
+    # restano ben dentro i limiti di float32/int32)
+    DTYPE_CAMPI_RIDOTTI = {float: "float32", int: "int32"}
+    
+    # Sotto questa dimensione [byte] i file sono letti con il modulo csv, senza DataFrame
+    SOGLIA_LETTURA_DIRETTA = 1_000_000
+    
+    # Buffer dei file in scrittura [byte] e righe per blocco nell'export CSV
+    BUFFER_SCRITTURA = 1 << 20
+    RIGHE_PER_BLOCCO = 100_000
+    RIGHE_PER_LOTTO_ARROW = 65_536
+    
     @staticmethod
     def trova_intestazione(header: str, possibili: List[str]) -> bool:
         """
@@ -79,28 +303,63 @@ class CSVHandler:
         header_lower = header.lower().strip()
         return header_lower in [p.lower() for p in possibili]
     
+    @staticmethod
+    def _read_csv(
+        filepath: Union[str, Path],
+        encoding: str,
+        delimiter: str,
+        dtype: Optional[Dict[str, str]] = None,
+    ) -> pd.DataFrame:
+        """Lettura con il motore pyarrow se disponibile, altrimenti con il parser C."""
+        if PYARROW_DISPONIBILE:
+            try:
+                df = pd.read_csv(
+                    filepath, encoding=encoding, delimiter=delimiter, dtype=dtype, engine="pyarrow"
+                )
+            except ValueError:  # ArrowInvalid: formato non gestito da pyarrow
+                df = None
+            
+            # pyarrow restituisce come bytes il testo non decodificabile: in quel caso
+            # si ripiega sul parser C, che solleva UnicodeDecodeError
+            if df is not None and not any(
+                isinstance(valore, bytes)
+                for _, serie in df.items() if serie.dtype == object
+                for valore in serie.dropna().head(1)
+            ):
+                return df
+        
+        return pd.read_csv(
+            filepath, encoding=encoding, delimiter=delimiter, dtype=dtype,
+            engine="c", low_memory=False,
+        )
+    
     @staticmethod
     def leggi_csv(
         filepath: Union[str, Path],
         encoding: str = "utf-8",
         delimiter: str = ",",
+        dtype: Optional[Dict[str, str]] = None,
     ) -> pd.DataFrame:
         """
         Legge un file CSV e restituisce un DataFrame.
         
+        Usa il motore pyarrow (multithread) se installato (extra ``arrow``).
+        
         Args:
             filepath: Percorso del file CSV
             encoding: Codifica del file
             delimiter: Delimitatore (default: virgola)
+            dtype: Tipi delle colonne noti in anticipo (nomi come nel file)
             
         Returns:
             DataFrame pandas con i dati
         """
+        filepath = os.fspath(filepath)
         try:
-            df = pd.read_csv(filepath, encoding=encoding, delimiter=delimiter)
+            df = CSVHandler._read_csv(filepath, encoding, delimiter, dtype)
         except UnicodeDecodeError:
             # Prova con encoding alternativo
-            df = pd.read_csv(filepath, encoding="latin-1", delimiter=delimiter)
+            df = CSVHandler._read_csv(filepath, "latin-1", delimiter, dtype)
         
         # Pulisci nomi colonne
         df.columns = df.columns.str.strip()
@@ -118,15 +377,29 @@ class CSVHandler:
         Returns:
             Dizionario {chiave_standard: nome_colonna_csv}
         """
-        mapping = {}
-        
-        for chiave, possibili in CSVHandler.INTESTAZIONI_STANDARD.items():
-            for col in df.columns:
-                if CSVHandler.trova_intestazione(col, possibili):
-                    mapping[chiave] = col
-                    break
+        # La mappatura resta memorizzata nel DataFrame finché le colonne non cambiano
+        colonne = tuple(df.columns)
+        memorizzata = df.attrs.get("_mappa_colonne")
+        if memorizzata is None or memorizzata[0] != colonne:
+            memorizzata = (colonne, CSVHandler._mappa_intestazioni(colonne))
+            df.attrs["_mappa_colonne"] = memorizzata
+        return dict(memorizzata[1])
+    
+    @staticmethod
+    def _mappa_intestazioni(intestazioni: Iterable[str]) -> Dict[str, str]:
+        """Mappa una sequenza di intestazioni alle chiavi standard (vedi mappa_colonne)."""
+        # Una sola ricerca nell'indice per colonna; per ogni chiave vale la prima colonna
+        trovate: Dict[str, str] = {}
+        for col in intestazioni:
+            for chiave in CSVHandler.CHIAVI_PER_ALIAS.get(col.lower().strip(), ()):
+                trovate.setdefault(chiave, col)
         
-        return mapping
+        # Chiavi nell'ordine di INTESTAZIONI_STANDARD
+        return {
+            chiave: trovate[chiave]
+            for chiave in CSVHandler.INTESTAZIONI_STANDARD
+            if chiave in trovate
+        }
     
     @classmethod
     def importa_sezioni(
@@ -144,77 +417,199 @@ class CSVHandler:
         Returns:
             Lista di dizionari con dati sezioni
         """
-        df = cls.leggi_csv(filepath, **kwargs)
-        mapping = cls.mappa_colonne(df)
+        # Percorso come stringa una volta sola, per tutte le letture successive
+        filepath = os.fspath(filepath)
         
-        sezioni = []
-        for _, row in df.iterrows():
-            dati_sezione = {}
-            
-            # Geometria
-            if "base" in mapping:
-                dati_sezione["base"] = float(row[mapping["base"]])
-            if "altezza" in mapping:
-                dati_sezione["altezza"] = float(row[mapping["altezza"]])
-            if "copriferro" in mapping:
-                dati_sezione["copriferro"] = float(row[mapping["copriferro"]])
-            
-            # Materiali
-            if "rck" in mapping:
-                dati_sezione["rck"] = float(row[mapping["rck"]])
-            elif "classe_cls" in mapping:
-                dati_sezione["classe_cls"] = str(row[mapping["classe_cls"]])
-            
-            if "tipo_acciaio" in mapping:
-                dati_sezione["tipo_acciaio"] = str(row[mapping["tipo_acciaio"]])
-            elif "fyk" in mapping:
-                dati_sezione["fyk"] = float(row[mapping["fyk"]])
-            
-            # Sollecitazioni
-            if "momento" in mapping:
-                dati_sezione["momento"] = float(row[mapping["momento"]])
-            if "momento_x" in mapping:
-                dati_sezione["momento_x"] = float(row[mapping["momento_x"]])
-            if "momento_y" in mapping:
-                dati_sezione["momento_y"] = float(row[mapping["momento_y"]])
-            if "sforzo_normale" in mapping:
-                dati_sezione["sforzo_normale"] = float(row[mapping["sforzo_normale"]])
-            if "taglio" in mapping:
-                dati_sezione["taglio"] = float(row[mapping["taglio"]])
-            
-            # Armatura longitudinale
-            if "diametro_inf" in mapping:
-                dati_sezione["diametro_inf"] = float(row[mapping["diametro_inf"]])
-            if "numero_inf" in mapping:
-                dati_sezione["numero_inf"] = int(row[mapping["numero_inf"]])
-            if "diametro_sup" in mapping:
-                dati_sezione["diametro_sup"] = float(row[mapping["diametro_sup"]])
-            if "numero_sup" in mapping:
-                dati_sezione["numero_sup"] = int(row[mapping["numero_sup"]])
-            
-            # Armatura trasversale
-            if "diametro_staffe" in mapping:
-                dati_sezione["diametro_staffe"] = float(row[mapping["diametro_staffe"]])
-            if "passo_staffe" in mapping:
-                dati_sezione["passo_staffe"] = float(row[mapping["passo_staffe"]])
-            if "bracci_staffe" in mapping:
-                dati_sezione["bracci_staffe"] = int(row[mapping["bracci_staffe"]])
-            
-            # Ferri piegati
-            if "diametro_piegati" in mapping:
-                dati_sezione["diametro_piegati"] = float(row[mapping["diametro_piegati"]])
-            if "numero_piegati" in mapping:
-                dati_sezione["numero_piegati"] = int(row[mapping["numero_piegati"]])
-            if "inclinazione_piegati" in mapping:
-                dati_sezione["inclinazione_piegati"] = float(row[mapping["inclinazione_piegati"]])
+        if os.path.getsize(filepath) < cls.SOGLIA_LETTURA_DIRETTA:
+            sezioni = cls._importa_sezioni_diretto(filepath, **kwargs)
+            if sezioni is not None:
+                return sezioni
+        
+        df, mapping = cls._leggi_sezioni(filepath, **kwargs)
+        
+        # Una conversione vettoriale per colonna, nessun ciclo sulle righe
+        colonne = {}
+        for chiave, tipo in cls._campi_presenti(mapping):
+            colonna = df[mapping[chiave]]
+            if tipo is str:
+                # Valori mancanti resi come "nan" con ogni motore (pyarrow usa None)
+                colonne[chiave] = colonna.map(str).where(colonna.notna(), "nan")
+            else:
+                colonne[chiave] = colonna.astype(cls.DTYPE_CAMPI[tipo])
+        
+        return _componi_record(list(colonne), [c.tolist() for c in colonne.values()], len(df))
+    
+    @classmethod
+    def importa_sezioni_colonne(
+        cls,
+        filepath: Union[str, Path],
+        ridotta: bool = False,
+        **kwargs
+    ) -> LottoSezioni:
+        """
+        Importa dati di sezioni da CSV in formato colonnare.
+        
+        Args:
+            filepath: Percorso file CSV
+            ridotta: Se True i campi numerici sono float32/int32 invece di
+                float64/int64 (metà memoria, circa 7 cifre significative)
+            **kwargs: Parametri aggiuntivi per read_csv
             
-            # Tipo elemento
-            if "tipo" in mapping:
-                dati_sezione["tipo"] = str(row[mapping["tipo"]])
+        Returns:
+            LottoSezioni con un array per ogni campo presente
+        """
+        dtype_campi = cls.DTYPE_CAMPI_RIDOTTI if ridotta else cls.DTYPE_CAMPI
+        df, mapping = cls._leggi_sezioni(os.fspath(filepath), dtype_campi=dtype_campi, **kwargs)
+        
+        colonne = {}
+        for chiave, tipo in cls._campi_presenti(mapping):
+            colonna = df[mapping[chiave]]
+            if tipo is str:
+                colonne[chiave] = colonna.map(str).where(colonna.notna(), "nan").to_numpy(dtype=object)
+            else:
+                colonne[chiave] = colonna.astype(dtype_campi[tipo]).to_numpy()
+        
+        return LottoSezioni(n_sezioni=len(df), **colonne)
+    
+    @classmethod
+    def importa_sezioni_tabella(
+        cls,
+        filepath: Union[str, Path],
+        ridotta: bool = False,
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Importa dati di sezioni da CSV come DataFrame con le chiavi standard.
+        
+        Il DataFrame è costruito colonna per colonna (un blocco contiguo per campo).
+        
+        Args:
+            filepath: Percorso file CSV
+            ridotta: Campi numerici float32/int32 (vedi importa_sezioni_colonne)
+            **kwargs: Parametri aggiuntivi per read_csv
             
-            sezioni.append(dati_sezione)
+        Returns:
+            DataFrame con una colonna per campo presente
+        """
+        lotto = cls.importa_sezioni_colonne(filepath, ridotta=ridotta, **kwargs)
+        return pd.DataFrame(
+            {campo: getattr(lotto, campo) for campo in lotto.campi_presenti()},
+            index=pd.RangeIndex(lotto.n_sezioni),
+        )
+    
+    @classmethod
+    def _leggi_sezioni(
+        cls,
+        filepath: Union[str, Path],
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        dtype_campi: Optional[Dict[type, str]] = None,
+    ) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """
+        Legge il CSV delle sezioni dichiarando il tipo delle colonne dei campi reali
+        (float64, o quello di dtype_campi).
+        
+        Le intestazioni sono lette prima del file, così il parser produce già il
+        tipo finale. Se una colonna non è convertibile si rilegge senza tipi,
+        e la conversione (o l'errore) avviene come per le altre colonne.
+        
+        Returns:
+            (DataFrame, mapping {chiave_standard: nome_colonna_csv})
+        """
+        try:
+            intestazioni = cls._leggi_intestazioni(filepath, encoding, delimiter)
+        except UnicodeDecodeError:
+            intestazioni = cls._leggi_intestazioni(filepath, "latin-1", delimiter)
         
-        return sezioni
+        # Nome pulito -> nome nel file (prima occorrenza)
+        nomi_file: Dict[str, str] = {}
+        for col in intestazioni:
+            nomi_file.setdefault(col.strip(), col)
+        mapping = cls._mappa_intestazioni(nomi_file)
+        dtype_campi = dtype_campi or cls.DTYPE_CAMPI
+        dtype = {
+            nomi_file[mapping[chiave]]: dtype_campi[float]
+            for chiave, tipo in cls._campi_presenti(mapping) if tipo is float
+        }
+        
+        try:
+            df = cls.leggi_csv(filepath, encoding, delimiter, dtype=dtype or None)
+        except ValueError:
+            df = cls.leggi_csv(filepath, encoding, delimiter)
+        return df, cls.mappa_colonne(df)
+    
+    @staticmethod
+    def _leggi_intestazioni(filepath: Union[str, Path], encoding: str, delimiter: str) -> List[str]:
+        """Legge solo la riga delle intestazioni, con i nomi come nel file."""
+        # utf-8-sig scarta l'eventuale BOM iniziale, come pandas
+        if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+            encoding = "utf-8-sig"
+        with open(filepath, newline="", encoding=encoding) as f:
+            return next(csv.reader(f, delimiter=delimiter), [])
+    
+    @classmethod
+    def _campi_presenti(cls, mapping: Dict[str, str]) -> List[Tuple[str, type]]:
+        """Campi di CAMPI_SEZIONE presenti nel file (per le alternative, il primo trovato)."""
+        campi = []
+        for alternative in cls.CAMPI_SEZIONE:
+            for chiave, tipo in alternative:
+                if chiave in mapping:
+                    campi.append((chiave, tipo))
+                    break
+        return campi
+    
+    @staticmethod
+    def _leggi_righe(
+        filepath: Union[str, Path],
+        encoding: str,
+        delimiter: str,
+    ) -> Tuple[List[str], List[List[str]]]:
+        """Legge intestazioni e righe non vuote con il modulo csv."""
+        # utf-8-sig scarta l'eventuale BOM iniziale, come pandas
+        if encoding.lower().replace("_", "-") in ("utf-8", "utf8"):
+            encoding = "utf-8-sig"
+        with open(filepath, newline="", encoding=encoding) as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            intestazioni = [col.strip() for col in next(reader, [])]
+            righe = [riga for riga in reader if riga]
+        return intestazioni, righe
+    
+    @classmethod
+    def _importa_sezioni_diretto(
+        cls,
+        filepath: Union[str, Path],
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Importa sezioni da un file piccolo senza costruire un DataFrame.
+        
+        Returns:
+            Lista di dizionari come importa_sezioni, o None se il file richiede
+            il parser di pandas (file senza intestazioni o righe più lunghe di esse)
+        """
+        try:
+            intestazioni, righe = cls._leggi_righe(filepath, encoding, delimiter)
+        except UnicodeDecodeError:
+            # Prova con encoding alternativo
+            intestazioni, righe = cls._leggi_righe(filepath, "latin-1", delimiter)
+        
+        if not intestazioni or any(len(riga) > len(intestazioni) for riga in righe):
+            return None
+        
+        # Posizione della prima colonna con ciascun nome
+        posizioni: Dict[str, int] = {}
+        for j, col in enumerate(intestazioni):
+            posizioni.setdefault(col, j)
+        mapping = cls._mappa_intestazioni(posizioni)
+        
+        colonne = []
+        for chiave, tipo in cls._campi_presenti(mapping):
+            j = posizioni[mapping[chiave]]
+            valori = _interpreta_colonna([riga[j] if j < len(riga) else "" for riga in righe])
+            colonne.append((chiave, [tipo(v) for v in valori]))
+        
+        return _componi_record([c for c, _ in colonne], [v for _, v in colonne], len(righe))
     
     @classmethod
     def crea_sezione_da_dati(cls, dati: Dict[str, Any]) -> SezioneRettangolare:
@@ -227,64 +622,156 @@ class CSVHandler:
         Returns:
             Oggetto SezioneRettangolare configurato
         """
+        return cls._componi_sezione(*(dati.get(campo) for campo in cls.CAMPI_COSTRUZIONE))
+    
+    @staticmethod
+    def _componi_sezione(
+        base, altezza, copriferro,
+        diametro_inf, numero_inf, diametro_sup, numero_sup,
+        diametro_staffe, passo_staffe, bracci_staffe,
+        diametro_piegati, numero_piegati, inclinazione_piegati,
+    ) -> SezioneRettangolare:
+        """Costruisce la sezione dai singoli campi (None = campo assente)."""
         # Crea sezione base
         sezione = SezioneRettangolare(
-            base=dati.get("base", 300),
-            altezza=dati.get("altezza", 500),
-            copriferro=dati.get("copriferro", 30),
+            base=300 if base is None else base,
+            altezza=500 if altezza is None else altezza,
+            copriferro=30 if copriferro is None else copriferro,
         )
         
         # Aggiungi armatura inferiore
-        if "diametro_inf" in dati and "numero_inf" in dati:
+        if diametro_inf is not None and numero_inf is not None:
             sezione.aggiungi_armatura_inferiore(
-                diametro=dati["diametro_inf"],
-                numero_barre=dati["numero_inf"],
+                diametro=diametro_inf,
+                numero_barre=numero_inf,
             )
         
         # Aggiungi armatura superiore
-        if "diametro_sup" in dati and "numero_sup" in dati:
+        if diametro_sup is not None and numero_sup is not None:
             sezione.aggiungi_armatura_superiore(
-                diametro=dati["diametro_sup"],
-                numero_barre=dati["numero_sup"],
+                diametro=diametro_sup,
+                numero_barre=numero_sup,
             )
         
         # Aggiungi staffe
-        if "diametro_staffe" in dati and "passo_staffe" in dati:
+        if diametro_staffe is not None and passo_staffe is not None:
             sezione.aggiungi_staffe(
-                diametro=dati["diametro_staffe"],
-                passo=dati["passo_staffe"],
-                numero_bracci=dati.get("bracci_staffe", 2),
+                diametro=diametro_staffe,
+                passo=passo_staffe,
+                numero_bracci=2 if bracci_staffe is None else bracci_staffe,
             )
         
         # Aggiungi ferri piegati
-        if "diametro_piegati" in dati and "numero_piegati" in dati:
+        if diametro_piegati is not None and numero_piegati is not None:
             sezione.aggiungi_ferri_piegati(
-                diametro=dati["diametro_piegati"],
-                numero=dati["numero_piegati"],
-                inclinazione=dati.get("inclinazione_piegati", 45.0),
+                diametro=diametro_piegati,
+                numero=numero_piegati,
+                inclinazione=45.0 if inclinazione_piegati is None else inclinazione_piegati,
             )
         
         return sezione
     
+    @classmethod
+    def importa_e_crea_sezioni(
+        cls,
+        filepath: Union[str, Path],
+        **kwargs
+    ) -> Iterator[SezioneRettangolare]:
+        """
+        Importa le sezioni da CSV e le crea una alla volta.
+        
+        Equivale a chiamare crea_sezione_da_dati su ogni record di
+        importa_sezioni, ma senza costruire la lista dei dizionari:
+        i campi di ogni riga sono letti direttamente dalle colonne.
+        
+        Args:
+            filepath: Percorso file CSV
+            **kwargs: Parametri aggiuntivi per read_csv
+            
+        Yields:
+            Oggetti SezioneRettangolare, nell'ordine delle righe del file
+        """
+        lotto = cls.importa_sezioni_colonne(filepath, **kwargs)
+        
+        # Colonne assenti -> None ripetuto, così ogni riga ha tutti gli argomenti
+        colonne = []
+        for campo in cls.CAMPI_COSTRUZIONE:
+            valori = getattr(lotto, campo)
+            colonne.append(repeat(None, lotto.n_sezioni) if valori is None else valori.tolist())
+        
+        for riga in zip(*colonne):
+            yield cls._componi_sezione(*riga)
+    
+    @staticmethod
+    def _colonne_da_record(risultati: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Converte una lista di record in colonne (chiave -> lista di valori).
+        
+        Le colonne seguono l'ordine di prima comparsa delle chiavi; i valori
+        mancanti in un record sono NaN, come in pd.DataFrame(risultati).
+        """
+        colonne: Dict[str, List[Any]] = {}
+        for i, record in enumerate(risultati):
+            for chiave, valore in record.items():
+                colonna = colonne.get(chiave)
+                if colonna is None:
+                    colonna = colonne[chiave] = [math.nan] * i
+                colonna.append(valore)
+            for colonna in colonne.values():
+                if len(colonna) == i:
+                    colonna.append(math.nan)
+        return colonne
+    
     @staticmethod
     def esporta_risultati(
-        risultati: List[Dict[str, Any]],
+        risultati: Union[List[Dict[str, Any]], Dict[str, Any]],
         filepath: Union[str, Path],
         formato: str = "csv",
+        motore: str = "pandas",
     ) -> None:
         """
         Esporta risultati delle verifiche su file.
         
         Args:
-            risultati: Lista di dizionari con risultati
+            risultati: Lista di dizionari con risultati, oppure risultati già
+                per colonne (dizionario chiave -> sequenza di valori)
             filepath: Percorso file output
             formato: "csv" o "excel"
+            motore: "pandas" o "pyarrow" (CSV scritto in parallelo, extra ``arrow``;
+                formattazione di pyarrow, es. booleani true/false e testi tra
+                virgolette). Senza pyarrow installato si usa pandas
         """
-        df = pd.DataFrame(risultati)
+        filepath = os.fspath(filepath)
+        formato_file = formato.lower()
+        
+        if formato_file == "csv" and motore == "pyarrow" and PYARROW_DISPONIBILE:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            tabella = (
+                pa.Table.from_pydict(dict(risultati)) if isinstance(risultati, dict)
+                else pa.Table.from_pylist(risultati)
+            )
+            pa_csv.write_csv(
+                tabella,
+                filepath,
+                write_options=pa_csv.WriteOptions(batch_size=CSVHandler.RIGHE_PER_LOTTO_ARROW),
+            )
+            return
+        
+        # DataFrame costruito per colonne: niente conversione intermedia record per record
+        if isinstance(risultati, dict):
+            df = pd.DataFrame(risultati)
+        else:
+            df = pd.DataFrame(
+                CSVHandler._colonne_da_record(risultati), index=pd.RangeIndex(len(risultati))
+            )
         
-        if formato.lower() == "csv":
-            df.to_csv(filepath, index=False, encoding="utf-8")
-        elif formato.lower() in ["excel", "xlsx"]:
+        if formato_file == "csv":
+            with open(filepath, "w", newline="", encoding="utf-8",
+                      buffering=CSVHandler.BUFFER_SCRITTURA) as f:
+                df.to_csv(f, index=False, chunksize=CSVHandler.RIGHE_PER_BLOCCO)
+        elif formato_file in ["excel", "xlsx"]:
             df.to_excel(filepath, index=False, engine="openpyxl")
         else:
             raise ValueError(f"Formato non supportato: {formato}")
@@ -346,7 +833,8 @@ class CSVHandler:
                 16, 4,
             ]
         
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
+        with open(filepath, "w", newline="", encoding="utf-8",
+                  buffering=CSVHandler.BUFFER_SCRITTURA) as f:
             writer = csv.writer(f)
             writer.writerow(headers)
             writer.writerow(esempio)
@@ -9,9 +9,14 @@ Tabelle da scansioni storiche RD 2229 (1939).
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict
 from enum import Enum
 
+import numpy as np
+
+from verifiche_dm1939.core.compat import DATACLASS_SLOTS
+
 
 class TipoAcciaio(str, Enum):
     """Tipi di acciaio da armatura secondo normativa epoca."""
@@ -24,13 +29,32 @@ class TipoAcciaio(str, Enum):
     TONDO = "Tondo"    # Tondo liscio
 
 
-@dataclass
+# Acciai dolci (coefficiente di sicurezza 2.3)
+_ACCIAI_DOLCI = frozenset({"FeB24k", "FeB32k", "Liscio", "Tondo"})
+
+
+def coefficiente_sicurezza_acciaio(tipo: str) -> float:
+    """
+    Coefficiente di sicurezza su fyk secondo normativa epoca.
+    
+    Args:
+        tipo: Tipo di acciaio
+        
+    Returns:
+        2.3 per acciai dolci (FeB24k, FeB32k, lisci), 2.5 per acciai duri
+    """
+    if tipo in _ACCIAI_DOLCI:
+        return 2.3
+    return 2.5  # FeB38k, FeB44k
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Acciaio:
     """
     Classe per la gestione delle proprietà dell'acciaio da armatura.
     
     Implementa le caratteristiche meccaniche e le tensioni ammissibili
-    secondo il DM 2229/1939.
+    secondo il DM 2229/1939. Le istanze sono immutabili (e hashable).
     
     Attributes:
         tipo: Tipo di acciaio (FeB24k, FeB32k, FeB38k, FeB44k)
@@ -63,13 +87,17 @@ class Acciaio:
         - Per acciai duri (FeB38k, FeB44k): σs,amm = fyk / 2.5
         """
         if self.tensione_ammissibile is None:
-            # Coefficiente di sicurezza secondo normativa epoca
-            if self.tipo in ["FeB24k", "FeB32k", "Liscio", "Tondo"]:
-                coefficiente_sicurezza = 2.3
-            else:  # FeB38k, FeB44k
-                coefficiente_sicurezza = 2.5
+            # Acciaio tipico con fyk di tabella: valore precalcolato in ACCIAI_TIPICI
+            dati = ACCIAI_TIPICI.get(self.tipo)
+            if dati is not None and dati["fyk"] == self.tensione_snervamento:
+                tensione_ammissibile = dati["tensione_ammissibile"]
+            else:
+                tensione_ammissibile = (
+                    self.tensione_snervamento / coefficiente_sicurezza_acciaio(self.tipo)
+                )
             
-            self.tensione_ammissibile = self.tensione_snervamento / coefficiente_sicurezza
+            # Istanza frozen: il valore derivato si imposta solo in costruzione
+            object.__setattr__(self, "tensione_ammissibile", tensione_ammissibile)
     
     def _valida_parametri(self) -> None:
         """Valida i parametri dell'acciaio."""
@@ -95,13 +123,20 @@ class Acciaio:
             calcola_auto: Se True calcola automaticamente i parametri
             
         Returns:
-            Oggetto Acciaio
+            Oggetto Acciaio, condiviso tra le chiamate con gli stessi argomenti
+            (da non modificare)
             
         Example:
             >>> acc = Acciaio.da_tipo("FeB32k")
             >>> acc.tensione_snervamento
             320.0
         """
+        return cls._da_tipo_cache(tipo, calcola_auto)
+    
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _da_tipo_cache(cls, tipo: str, calcola_auto: bool) -> "Acciaio":
+        """Costruzione memoizzata degli acciai tipici (pochi tipi distinti)."""
         if tipo not in ACCIAI_TIPICI:
             raise ValueError(f"Tipo di acciaio non riconosciuto: {tipo}")
         
@@ -212,6 +247,43 @@ class Acciaio:
         
         return max(lunghezza, lunghezza_minima)
     
+    def tensione_aderenza_ammissibile_batch(self, diametri: np.ndarray) -> np.ndarray:
+        """
+        Versione vettoriale di tensione_aderenza_ammissibile per N diametri.
+        
+        Args:
+            diametri: Array dei diametri barra in mm
+            
+        Returns:
+            Array delle tensioni di aderenza in MPa
+        """
+        diametri = np.asarray(diametri, dtype=float)
+        tau_adm_base = 1.5 if self.aderenza_migliorata else 0.5  # MPa
+        
+        # Riduzione per diametri maggiori, senza diramazioni per elemento
+        with np.errstate(divide="ignore"):
+            return np.where(diametri > 20, tau_adm_base * (20.0 / diametri), tau_adm_base)
+    
+    def lunghezza_ancoraggio_base_batch(self, diametri: np.ndarray) -> np.ndarray:
+        """
+        Versione vettoriale di lunghezza_ancoraggio_base per N diametri.
+        
+        Args:
+            diametri: Array dei diametri barra in mm
+            
+        Returns:
+            Array delle lunghezze di ancoraggio in mm
+        """
+        if self.tensione_ammissibile is None:
+            raise ValueError("Tensione ammissibile non definita")
+        
+        diametri = np.asarray(diametri, dtype=float)
+        tau_adm = self.tensione_aderenza_ammissibile_batch(diametri)
+        
+        # Lb = (σs,amm * φ) / (4 * τadm), con minimo di 20 diametri
+        lunghezza = (self.tensione_ammissibile * diametri) / (4.0 * tau_adm)
+        return np.maximum(lunghezza, 20 * diametri)
+    
     def to_dict(self) -> dict:
         """Converte l'oggetto in dizionario."""
         return {
@@ -264,3 +336,8 @@ ACCIAI_TIPICI: Dict[str, Dict] = {
         "descrizione": "Tondo liscio",
     },
 }
+
+# σs,amm = fyk / coefficiente, calcolata una volta per gli acciai tipici
+for _tipo, _dati in ACCIAI_TIPICI.items():
+    _dati["tensione_ammissibile"] = _dati["fyk"] / coefficiente_sicurezza_acciaio(_tipo)
+del _tipo, _dati
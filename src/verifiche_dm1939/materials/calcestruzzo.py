@@ -9,24 +9,52 @@ Tabelle da scansioni storiche RD 2229 (1939).
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
+from math import sqrt
+import re
 from typing import Optional, Tuple
+import warnings
 import numpy as np
 
+from verifiche_dm1939.core.conversioni_unita import kgcm2_to_mpa, mpa_to_kgcm2
 from verifiche_dm1939.core.dati_storici_rd2229 import (
     modulo_elasticita_calcestruzzo_mpa,
     CarichUnitariSicurezza,
-    interpola_resistenza_calcestruzzo,
     MODULO_ELASTICITA_ACCIAIO_MPA,
 )
 
 
-@dataclass
+# Prefisso della classe di resistenza (es. "Rck25"), rimosso in un'unica passata
+_RE_PREFISSO_RCK = re.compile(r"Rck|rck|RCK")
+
+# (σc,amm, τc,amm) in MPa dai carichi di sicurezza RD 2229, per tipo di cemento;
+# i tipi non elencati seguono il cemento normale. Conversione fatta una volta sola.
+_TENSIONI_AMMISSIBILI_STORICHE = {
+    "normale": (
+        kgcm2_to_mpa(CarichUnitariSicurezza.SIGMA_C_COMPRESSIONE_INFLESSA_NORM),
+        kgcm2_to_mpa(CarichUnitariSicurezza.TAU_TAGLIO_NORMALE),
+    ),
+    "alta_resistenza": (
+        kgcm2_to_mpa(CarichUnitariSicurezza.SIGMA_C_COMPRESSIONE_INFLESSA_ALT),
+        kgcm2_to_mpa(CarichUnitariSicurezza.TAU_TAGLIO_ALTA_RESISTENZA),
+    ),
+    "alluminoso": (
+        kgcm2_to_mpa(CarichUnitariSicurezza.SIGMA_C_COMPRESSIONE_INFLESSA_NORM),
+        kgcm2_to_mpa(CarichUnitariSicurezza.TAU_TAGLIO_ALTA_RESISTENZA),
+    ),
+}
+
+
+# Niente __slots__ (DATACLASS_SLOTS): il campo da_tabella_storica ha lo stesso
+# nome del costruttore alternativo da_tabella_storica, e lo slot del campo
+# sostituirebbe il classmethod nella classe. Le istanze restano con __dict__.
+@dataclass(frozen=True)
 class Calcestruzzo:
     """
     Classe per la gestione delle proprietà del calcestruzzo.
     
     Implementa le caratteristiche meccaniche e le tensioni ammissibili
-    secondo il DM 2229/1939.
+    secondo il DM 2229/1939. Le istanze sono immutabili (e hashable).
     
     Attributes:
         resistenza_caratteristica: Rck in MPa (es: 15, 20, 25, 30 MPa)
@@ -52,12 +80,31 @@ class Calcestruzzo:
     
     def __post_init__(self) -> None:
         """Inizializza e calcola i parametri se necessario."""
+        # Istanza frozen: i valori derivati si impostano con object.__setattr__
         if self.calcola_auto:
             if self.da_tabella_storica:
                 self._calcola_parametri_storici()
             else:
                 self._calcola_parametri()
         self._valida_parametri()
+        
+        # Grandezze derivate usate nelle verifiche, calcolate una volta sola
+        sigma_c = self.tensione_ammissibile_compressione
+        object.__setattr__(
+            self, "_deformazione_ammissibile",
+            None if self.modulo_elastico is None else sigma_c / self.modulo_elastico,
+        )
+        object.__setattr__(self, "_tensione_omogeneizzata", self.coefficiente_omogeneizzazione * sigma_c)
+    
+    @property
+    def deformazione_ammissibile(self) -> Optional[float]:
+        """Deformazione del calcestruzzo alla tensione ammissibile: εc = σc,amm / Ec."""
+        return self._deformazione_ammissibile
+    
+    @property
+    def tensione_omogeneizzata(self) -> float:
+        """Tensione ammissibile omogeneizzata all'acciaio: n · σc,amm [MPa]."""
+        return self._tensione_omogeneizzata
     
     def _calcola_parametri_storici(self) -> None:
         """
@@ -69,37 +116,28 @@ class Calcestruzzo:
         - Tensione ammissibile compressione: da carico unitario sicurezza
         - Tensione ammissibile taglio: 4 Kg/cm² (normale), 6 (alta resistenza)
         """
-        from verifiche_dm1939.core.conversioni_unita import kgcm2_to_mpa, mpa_to_kgcm2
-        
-        # Converto Rck MPa → Kg/cm² per formule storiche
-        rck_kgcm2 = mpa_to_kgcm2(self.resistenza_caratteristica)
-        
         # Modulo elastico secondo formula storica
         if self.modulo_elastico is None:
-            ec_kgcm2 = modulo_elasticita_calcestruzzo_mpa(self.resistenza_caratteristica)
-            self.modulo_elastico = ec_kgcm2
+            object.__setattr__(
+                self, "modulo_elastico",
+                modulo_elasticita_calcestruzzo_mpa(self.resistenza_caratteristica),
+            )
         
-        # Coefficiente omogeneizzazione
+        # Coefficiente omogeneizzazione (Ec definito dal blocco precedente)
         if self.coefficiente_omogeneizzazione is None:
-            ec_kgcm2 = mpa_to_kgcm2(self.modulo_elastico)
-            self.coefficiente_omogeneizzazione = MODULO_ELASTICITA_ACCIAIO_MPA / (self.modulo_elastico or 30000)
+            object.__setattr__(
+                self, "coefficiente_omogeneizzazione",
+                MODULO_ELASTICITA_ACCIAIO_MPA / self.modulo_elastico,
+            )
         
-        # Tensione ammissibile compressione (se non fornita)
+        # Tensioni ammissibili (se non fornite) da carico unitario sicurezza RD 2229
+        sigma_c_amm, tau_c_amm = _TENSIONI_AMMISSIBILI_STORICHE.get(
+            self.tipo_cemento, _TENSIONI_AMMISSIBILI_STORICHE["normale"]
+        )
         if self.tensione_ammissibile_compressione is None:
-            # Usa carico unitario sicurezza da RD 2229
-            if self.tipo_cemento == "alta_resistenza":
-                sigma_c_amm_kgcm2 = CarichUnitariSicurezza.SIGMA_C_COMPRESSIONE_INFLESSA_ALT
-            else:
-                sigma_c_amm_kgcm2 = CarichUnitariSicurezza.SIGMA_C_COMPRESSIONE_INFLESSA_NORM
-            self.tensione_ammissibile_compressione = kgcm2_to_mpa(sigma_c_amm_kgcm2)
-        
-        # Tensione ammissibile taglio
+            object.__setattr__(self, "tensione_ammissibile_compressione", sigma_c_amm)
         if self.tensione_ammissibile_taglio is None:
-            if self.tipo_cemento in ("alta_resistenza", "alluminoso"):
-                tau_c_amm_kgcm2 = CarichUnitariSicurezza.TAU_TAGLIO_ALTA_RESISTENZA
-            else:
-                tau_c_amm_kgcm2 = CarichUnitariSicurezza.TAU_TAGLIO_NORMALE
-            self.tensione_ammissibile_taglio = kgcm2_to_mpa(tau_c_amm_kgcm2)
+            object.__setattr__(self, "tensione_ammissibile_taglio", tau_c_amm)
     
     def _calcola_parametri(self) -> None:
         """
@@ -112,22 +150,22 @@ class Calcestruzzo:
         """
         # Tensione ammissibile a compressione secondo DM 2229/1939
         if self.tensione_ammissibile_compressione is None:
-            self.tensione_ammissibile_compressione = self.resistenza_caratteristica / 3.0
+            object.__setattr__(self, "tensione_ammissibile_compressione", self.resistenza_caratteristica / 3.0)
         
         # Tensione tangenziale ammissibile secondo Santarella
         if self.tensione_ammissibile_taglio is None:
             # Formula empirica: τc,amm = 0.054 * Rck
-            self.tensione_ammissibile_taglio = 0.054 * self.resistenza_caratteristica
+            object.__setattr__(self, "tensione_ammissibile_taglio", 0.054 * self.resistenza_caratteristica)
         
         # Modulo elastico secondo formula empirica dell'epoca
         if self.modulo_elastico is None:
             # Ec = 5700 * sqrt(Rck) [MPa] per Rck in MPa
-            self.modulo_elastico = 5700.0 * np.sqrt(self.resistenza_caratteristica)
+            object.__setattr__(self, "modulo_elastico", 5700.0 * sqrt(self.resistenza_caratteristica))
         
         # Coefficiente omogeneizzazione (se non fornito)
         if self.coefficiente_omogeneizzazione is None:
             # n = Es / Ec, con Es = 200000 MPa, Ec calcolato
-            self.coefficiente_omogeneizzazione = 200000 / self.modulo_elastico
+            object.__setattr__(self, "coefficiente_omogeneizzazione", 200000 / self.modulo_elastico)
     
     def _valida_parametri(self) -> None:
         """Valida i parametri del calcestruzzo."""
@@ -135,17 +173,17 @@ class Calcestruzzo:
             raise ValueError("La resistenza caratteristica deve essere positiva")
         
         if self.resistenza_caratteristica < 10 or self.resistenza_caratteristica > 50:
-            import warnings
             warnings.warn(
                 f"Rck = {self.resistenza_caratteristica} MPa fuori dal range tipico "
                 f"per calcestruzzi dell'epoca (10-30 MPa)"
             )
         
-        if self.tensione_ammissibile_compressione is not None:
-            if self.tensione_ammissibile_compressione > self.resistenza_caratteristica:
-                raise ValueError(
-                    "La tensione ammissibile non può superare la resistenza caratteristica"
-                )
+        if self.tensione_ammissibile_compressione is None:
+            raise ValueError("Tensione ammissibile compressione non definita")
+        if self.tensione_ammissibile_compressione > self.resistenza_caratteristica:
+            raise ValueError(
+                "La tensione ammissibile non può superare la resistenza caratteristica"
+            )
         
         if self.coefficiente_omogeneizzazione <= 0:
             raise ValueError("Il coefficiente di omogeneizzazione deve essere positivo")
@@ -167,8 +205,14 @@ class Calcestruzzo:
             >>> cls.resistenza_caratteristica
             15.0
         """
+        return cls._da_classe_cache(classe, calcola_auto)
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _da_classe_cache(cls, classe: str, calcola_auto: bool) -> "Calcestruzzo":
+        """Costruzione memoizzata per classe di resistenza (poche classi distinte)."""
         # Estrai il valore numerico dalla classe
-        rck_str = classe.replace("Rck", "").replace("rck", "").replace("RCK", "")
+        rck_str = _RE_PREFISSO_RCK.sub("", classe)
         try:
             rck = float(rck_str)
         except ValueError:
@@ -200,8 +244,6 @@ class Calcestruzzo:
             >>> cls = Calcestruzzo.da_tabella_storica(resistenza_compressione_kgcm2=280)
             >>> cls.modulo_elastico  # Calcolato da formula storica
         """
-        from verifiche_dm1939.core.conversioni_unita import kgcm2_to_mpa
-        
         rck_mpa = kgcm2_to_mpa(resistenza_compressione_kgcm2)
         
         return cls(
@@ -212,6 +254,63 @@ class Calcestruzzo:
             calcola_auto=True
         )
     
+    @classmethod
+    def da_array(
+        cls,
+        rck: np.ndarray,
+        da_tabella_storica: bool = True,
+        tipo_cemento: str = "normale",
+    ) -> dict:
+        """
+        Parametri di N calcestruzzi calcolati per array, senza creare gli oggetti.
+        
+        Stesse formule di _calcola_parametri_storici (o di _calcola_parametri
+        se da_tabella_storica=False), applicate a tutte le resistenze insieme.
+        
+        Il default è quello effettivo del costruttore: il valore predefinito
+        del campo da_tabella_storica è oscurato dal classmethod omonimo, per
+        cui Calcestruzzo(resistenza_caratteristica=r) e CALCESTRUZZI_TIPICI
+        usano le formule storiche.
+        
+        Args:
+            rck: Array delle resistenze caratteristiche Rck in MPa
+            da_tabella_storica: Se True (default) usa le formule RD 2229/1939,
+                se False quelle con σc,amm = Rck/3
+            tipo_cemento: "normale", "alta_resistenza", "alluminoso" (solo formule storiche)
+            
+        Returns:
+            Dizionario con un array per ogni chiave di to_dict
+        """
+        rck = np.asarray(rck, dtype=float)
+        if np.any(rck <= 0):
+            raise ValueError("La resistenza caratteristica deve essere positiva")
+        
+        if da_tabella_storica:
+            # Ec = 550000·σc/(σc+200) [Kg/cm²], riportato in MPa
+            sigma_kgcm2 = mpa_to_kgcm2(rck)
+            modulo = kgcm2_to_mpa(550000 * sigma_kgcm2 / (sigma_kgcm2 + 200))
+            omogeneizzazione = MODULO_ELASTICITA_ACCIAIO_MPA / modulo
+            
+            sigma_c_amm, tau_c_amm = _TENSIONI_AMMISSIBILI_STORICHE.get(
+                tipo_cemento, _TENSIONI_AMMISSIBILI_STORICHE["normale"]
+            )
+            sigma_c_amm = np.full_like(rck, sigma_c_amm)
+            tau_c_amm = np.full_like(rck, tau_c_amm)
+        else:
+            # σc,amm = Rck/3, τc,amm = 0.054·Rck, Ec = 5700·√Rck, n = Es/Ec
+            sigma_c_amm = rck / 3.0
+            tau_c_amm = 0.054 * rck
+            modulo = 5700.0 * np.sqrt(rck)
+            omogeneizzazione = 200000 / modulo
+        
+        return {
+            "resistenza_caratteristica": rck,
+            "tensione_ammissibile_compressione": sigma_c_amm,
+            "tensione_ammissibile_taglio": tau_c_amm,
+            "coefficiente_omogeneizzazione": omogeneizzazione,
+            "modulo_elastico": modulo,
+        }
+    
     def coefficiente_riduzione_taglio(self, percentuale_armatura: float) -> float:
         """
         Calcola il coefficiente di riduzione per il taglio.
@@ -233,17 +332,31 @@ class Calcestruzzo:
         else:
             return 1.2
     
+    def coefficiente_riduzione_taglio_batch(self, percentuali_armatura: np.ndarray) -> np.ndarray:
+        """
+        Versione vettoriale di coefficiente_riduzione_taglio per N percentuali.
+        
+        Args:
+            percentuali_armatura: Array delle percentuali di armatura longitudinale (ρ%)
+            
+        Returns:
+            Array dei coefficienti moltiplicativi (1.0-1.2)
+        """
+        percentuali_armatura = np.asarray(percentuali_armatura, dtype=float)
+        
+        # 1.0 sotto 0.5%, lineare fino a 1.5%, poi costante 1.2: senza diramazioni
+        return 1.0 + 0.2 * np.clip(percentuali_armatura - 0.5, 0.0, 1.0)
+    
     def tensione_ammissibile_flessione(self) -> float:
         """
         Restituisce la tensione ammissibile per la flessione.
         
-        Per la flessione si usa la tensione ammissibile a compressione.
+        Per la flessione si usa la tensione ammissibile a compressione
+        (sempre definita: verificato alla creazione in _valida_parametri).
         
         Returns:
             Tensione ammissibile in MPa
         """
-        if self.tensione_ammissibile_compressione is None:
-            raise ValueError("Tensione ammissibile compressione non definita")
         return self.tensione_ammissibile_compressione
     
     def to_dict(self) -> dict:
@@ -265,11 +378,22 @@ class Calcestruzzo:
         )
 
 
+def _costruisci_calcestruzzi_tipici(rck: Tuple[float, ...]) -> dict:
+    """
+    Costruisce i calcestruzzi tipici calcolando i parametri in un'unica passata vettoriale.
+    
+    Le formule sono quelle storiche di _calcola_parametri_storici (cemento
+    normale), applicate a tutte le classi insieme con Calcestruzzo.da_array;
+    gli oggetti ricevono i parametri già calcolati.
+    """
+    parametri = Calcestruzzo.da_array(np.array(rck), da_tabella_storica=True)
+    
+    tipici = {}
+    for riga in zip(*(valori.tolist() for valori in parametri.values())):
+        campi = dict(zip(parametri, riga))
+        tipici[f"Rck{campi['resistenza_caratteristica']:g}"] = Calcestruzzo(**campi)
+    return tipici
+
+
 # Database calcestruzzi tipici dell'epoca
-CALCESTRUZZI_TIPICI = {
-    "Rck10": Calcestruzzo(resistenza_caratteristica=10.0),
-    "Rck15": Calcestruzzo(resistenza_caratteristica=15.0),
-    "Rck20": Calcestruzzo(resistenza_caratteristica=20.0),
-    "Rck25": Calcestruzzo(resistenza_caratteristica=25.0),
-    "Rck30": Calcestruzzo(resistenza_caratteristica=30.0),
-}
+CALCESTRUZZI_TIPICI = _costruisci_calcestruzzi_tipici((10.0, 15.0, 20.0, 25.0, 30.0))
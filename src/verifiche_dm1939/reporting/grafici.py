@@ -8,23 +8,181 @@ Crea grafici dettagliati di:
 - Sezioni con armature
 """
 
+import copy
+import sys
+from functools import lru_cache
+from io import BytesIO
+from types import SimpleNamespace
 from typing import Optional, Tuple, List
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib import rc_context, style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PatchCollection
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from matplotlib.lines import Line2D
 
 from verifiche_dm1939.sections.sezione_rettangolare import SezioneRettangolare, Barra
 
 
+# Prototipi degli elementi ricorrenti: ogni disegno ne usa una copia
+# (copy.copy) con le proprie coordinate, evitando di rieseguire il
+# costruttore completo dei patch. I prototipi non vengono mai aggiunti
+# a un grafico.
+_PROTO_CONTORNO = patches.Rectangle(
+    (0, 0), 1, 1,
+    linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.3
+)
+_PROTO_STAFFA = patches.Rectangle(
+    (0, 0), 1, 1,
+    linewidth=1, edgecolor='green', facecolor='none',
+    linestyle='--', alpha=0.5
+)
+_PROTO_BARRA = patches.Circle((0, 0), 1)
+
+# Voci fisse della legenda della sezione: la legenda ne disegna delle copie,
+# quindi possono essere condivise tra tutti i grafici
+_LEGENDA_TESA = Line2D(
+    [0], [0], marker='o', color='w', markerfacecolor='red',
+    markersize=10, label='Armatura tesa'
+)
+_LEGENDA_COMPRESSA = Line2D(
+    [0], [0], marker='o', color='w', markerfacecolor='blue',
+    markersize=10, label='Armatura compressa'
+)
+
+# Estensioni salvate da Agg come immagini: rasterizzare non cambia nulla
+_FORMATI_RASTER = frozenset({'.png', '.jpg', '.jpeg', '.tif', '.tiff', '.webp', '.raw', '.rgba'})
+
+
+def _rettangolo(prototipo: patches.Rectangle, x: float, y: float, larghezza: float, altezza: float) -> patches.Rectangle:
+    """Copia di un prototipo rettangolare con angolo (x, y) e dimensioni date."""
+    rettangolo = copy.copy(prototipo)
+    rettangolo.set_bounds(x, y, larghezza, altezza)
+    return rettangolo
+
+
+def _cerchio(x: float, y: float, raggio: float) -> patches.Circle:
+    """Copia del prototipo delle barre con centro (x, y) e raggio dato."""
+    cerchio = copy.copy(_PROTO_BARRA)
+    cerchio.set_center((x, y))
+    cerchio.set_radius(raggio)
+    return cerchio
+
+
+@lru_cache(maxsize=128)
+def _calcola_dominio(
+    base: float,
+    altezza: float,
+    area_armatura_inf: float,
+    area_armatura_sup: float,
+    sigma_c_amm: float,
+    sigma_s_amm: float,
+    copriferro: float,
+    n_punti: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Punti (M, N) del dominio di interazione, dalla trazione pura alla compressione centrata.
+    
+    Memorizzata: sezioni uguali nello stesso report riusano la spezzata già
+    calcolata. Si memorizzano array in sola lettura, non la figura; vanno
+    passati a matplotlib così come sono, senza conversioni.
+    
+    Returns:
+        Tupla (momenti in kNm, sforzi normali in kN), array di n_punti + 2 valori
+    """
+    d = altezza - copriferro - 15  # Altezza utile approssimata
+    d_prime = copriferro + 15
+    
+    # Punto 1: Trazione pura
+    N1 = -sigma_s_amm * (area_armatura_inf + area_armatura_sup) / 1000
+    M1 = 0
+    
+    # Punto 2-4: Flessione semplice e composta, per tutte le posizioni dell'asse neutro
+    x = altezza * np.linspace(0.1, 1.5, n_punti) / 3
+    parzializzata = x < altezza
+    
+    # Sezione parzialmente compressa
+    N_parz = (sigma_c_amm * base * x - sigma_s_amm * area_armatura_inf) / 1000  # kN
+    M_parz = (sigma_c_amm * base * x * (d - x/3) +
+              sigma_s_amm * area_armatura_sup * (d - d_prime)) / 1e6  # kNm
+    
+    # Sezione tutta compressa
+    N_comp = (sigma_c_amm * base * altezza +
+              sigma_s_amm * (area_armatura_inf + area_armatura_sup) * 0.5) / 1000
+    M_comp = (sigma_c_amm * base * altezza * (altezza/2 - altezza/2) +
+              sigma_s_amm * area_armatura_inf * (d - altezza/2)) / 1e6
+    
+    # Punto 5: Compressione centrata
+    N5 = (sigma_c_amm * base * altezza + 
+          sigma_s_amm * (area_armatura_inf + area_armatura_sup)) / 1000
+    M5 = 0
+    
+    momenti = np.empty(n_punti + 2)
+    sforzi_normali = np.empty_like(momenti)
+    momenti[0], sforzi_normali[0] = M1, N1
+    momenti[1:-1] = np.where(parzializzata, M_parz, M_comp)
+    sforzi_normali[1:-1] = np.where(parzializzata, N_parz, N_comp)
+    momenti[-1], sforzi_normali[-1] = M5, N5
+    
+    momenti.flags.writeable = False
+    sforzi_normali.flags.writeable = False
+    return momenti, sforzi_normali
+
+
+def _chiave_sezione(sezione: SezioneRettangolare) -> tuple:
+    """
+    Tupla (hashable) con tutti i dati della sezione che compaiono nel disegno.
+    """
+    def barre(gruppo):
+        return tuple((barra.posizione_x, barra.posizione_y, barra.diametro) for barra in gruppo)
+    
+    staffe = (sezione.staffe.diametro, sezione.staffe.passo) if sezione.staffe else None
+    return (
+        sezione.base, sezione.altezza, sezione.copriferro, sezione.altezza_utile,
+        barre(sezione.barre_inferiori), barre(sezione.barre_superiori), staffe,
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_sezione_png(
+    chiave: tuple,
+    asse_neutro: Optional[float],
+    mostra_quotature: bool,
+    titolo: str,
+    dpi: int,
+) -> bytes:
+    """
+    Immagine PNG della sezione descritta da chiave (vedi _chiave_sezione).
+    
+    Memorizzata: per la stessa geometria si restituiscono i byte già
+    prodotti, senza ridisegnare con matplotlib.
+    """
+    base, altezza, copriferro, altezza_utile, inferiori, superiori, staffe = chiave
+    
+    def barre(gruppo):
+        return [SimpleNamespace(posizione_x=x, posizione_y=y, diametro=diametro) for x, y, diametro in gruppo]
+    
+    sezione = SimpleNamespace(
+        base=base, altezza=altezza, copriferro=copriferro, altezza_utile=altezza_utile,
+        barre_inferiori=barre(inferiori), barre_superiori=barre(superiori),
+        staffe=SimpleNamespace(diametro=staffe[0], passo=staffe[1]) if staffe else None,
+    )
+    fig = GeneratoreGrafici.disegna_sezione(sezione, asse_neutro, mostra_quotature, titolo)
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
 class GeneratoreGrafici:
     """
     Generatore di grafici per verifiche strutturali.
     """
     
-    # Stile grafico professionale
+    # Stile grafico professionale, applicato solo durante la costruzione
+    # delle figure (rc_context), senza modificare i parametri globali
     STYLE_CONFIG = {
         "figure.figsize": (10, 8),
         "figure.dpi": 100,
@@ -44,11 +202,12 @@ class GeneratoreGrafici:
         Args:
             stile: Stile matplotlib ("default", "seaborn", "classic")
         """
-        plt.style.use(stile if stile != "default" else "default")
-        for key, value in self.STYLE_CONFIG.items():
-            plt.rcParams[key] = value
+        self.stile = stile
+        if stile != "default":
+            style.use(stile)
     
     @staticmethod
+    @rc_context(STYLE_CONFIG)
     def disegna_sezione(
         sezione: SezioneRettangolare,
         asse_neutro: Optional[float] = None,
@@ -67,18 +226,22 @@ class GeneratoreGrafici:
         Returns:
             Figura matplotlib
         """
-        fig, ax = plt.subplots(figsize=(8, 10))
+        fig = Figure(figsize=(8, 10))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
         b = sezione.base
         h = sezione.altezza
         c = sezione.copriferro
         
+        # Limiti noti dalla geometria: fissati subito, senza autoscala
+        # al variare degli elementi disegnati
+        margine = max(b, h) * 0.25
+        ax.set_xlim(-b/2 - margine, b/2 + margine)
+        ax.set_ylim(-h*0.2, h + margine)
+        
         # Contorno sezione calcestruzzo
-        rect = patches.Rectangle(
-            (-b/2, 0), b, h,
-            linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.3
-        )
-        ax.add_patch(rect)
+        ax.add_patch(_rettangolo(_PROTO_CONTORNO, -b/2, 0, b, h))
         
         # Asse neutro
         if asse_neutro is not None:
@@ -87,33 +250,24 @@ class GeneratoreGrafici:
                 'r--', linewidth=1.5, label=f'Asse neutro (x={asse_neutro:.1f} mm)'
             )
         
-        # Disegna barre inferiori
-        for barra in sezione.barre_inferiori:
-            circle = patches.Circle(
-                (barra.posizione_x, barra.posizione_y),
-                barra.diametro/2,
-                color='red', ec='darkred', linewidth=1.5
-            )
-            ax.add_patch(circle)
-        
-        # Disegna barre superiori
-        for barra in sezione.barre_superiori:
-            circle = patches.Circle(
-                (barra.posizione_x, barra.posizione_y),
-                barra.diametro/2,
-                color='blue', ec='darkblue', linewidth=1.5
-            )
-            ax.add_patch(circle)
+        # Barre inferiori e superiori: una collezione per gruppo, non un patch per barra
+        for barre, colore, bordo in (
+            (sezione.barre_inferiori, 'red', 'darkred'),
+            (sezione.barre_superiori, 'blue', 'darkblue'),
+        ):
+            if barre:
+                cerchi = [
+                    _cerchio(barra.posizione_x, barra.posizione_y, barra.diametro/2)
+                    for barra in barre
+                ]
+                ax.add_collection(PatchCollection(
+                    cerchi, facecolor=colore, edgecolor=bordo, linewidth=1.5
+                ), autolim=False)
         
         # Staffe (rappresentazione schematica)
         if sezione.staffe:
             # Staffa perimetrale
-            staffa_rect = patches.Rectangle(
-                (-b/2 + c, c), b - 2*c, h - 2*c,
-                linewidth=1, edgecolor='green', facecolor='none',
-                linestyle='--', alpha=0.5
-            )
-            ax.add_patch(staffa_rect)
+            ax.add_patch(_rettangolo(_PROTO_STAFFA, -b/2 + c, c, b - 2*c, h - 2*c))
         
         # Quotature
         if mostra_quotature:
@@ -134,9 +288,6 @@ class GeneratoreGrafici:
             ax.text(b/2 + b*0.12, d, f'd = {d:.0f} mm', va='center', fontsize=8)
         
         # Configurazione assi
-        margine = max(b, h) * 0.25
-        ax.set_xlim(-b/2 - margine, b/2 + margine)
-        ax.set_ylim(-h*0.2, h + margine)
         ax.set_aspect('equal')
         ax.grid(True, alpha=0.2)
         ax.set_xlabel('Larghezza (mm)')
@@ -144,13 +295,7 @@ class GeneratoreGrafici:
         ax.set_title(titolo, fontweight='bold')
         
         # Legenda
-        from matplotlib.lines import Line2D
-        legend_elements = [
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='red', 
-                  markersize=10, label='Armatura tesa'),
-            Line2D([0], [0], marker='o', color='w', markerfacecolor='blue', 
-                  markersize=10, label='Armatura compressa'),
-        ]
+        legend_elements = [_LEGENDA_TESA, _LEGENDA_COMPRESSA]
         if sezione.staffe:
             legend_elements.append(
                 Line2D([0], [0], color='green', linestyle='--', 
@@ -158,10 +303,39 @@ class GeneratoreGrafici:
             )
         ax.legend(handles=legend_elements, loc='upper right')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     @staticmethod
+    def disegna_sezione_png(
+        sezione: SezioneRettangolare,
+        asse_neutro: Optional[float] = None,
+        mostra_quotature: bool = True,
+        titolo: str = "Sezione Trasversale",
+        dpi: int = 300,
+    ) -> bytes:
+        """
+        Disegna la sezione come immagine PNG (vedi disegna_sezione).
+        
+        Per chi usa solo il file (es. i report): le immagini sono memorizzate
+        per geometria, quindi sezioni ripetute non vengono ridisegnate.
+        
+        Args:
+            sezione: Sezione da disegnare
+            asse_neutro: Posizione asse neutro dal lembo compresso (mm)
+            mostra_quotature: Se True mostra le quote
+            titolo: Titolo del grafico
+            dpi: Risoluzione in DPI
+            
+        Returns:
+            Contenuto del file PNG
+        """
+        return _render_sezione_png(
+            _chiave_sezione(sezione), asse_neutro, mostra_quotature, titolo, dpi
+        )
+    
+    @staticmethod
+    @rc_context(STYLE_CONFIG)
     def diagramma_tensioni_flessione(
         sezione: SezioneRettangolare,
         sigma_c: float,
@@ -184,19 +358,23 @@ class GeneratoreGrafici:
         Returns:
             Figura matplotlib
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig = Figure(figsize=(14, 6))
+        FigureCanvasAgg(fig)
+        ax1, ax2 = fig.subplots(1, 2)
         
         h = sezione.altezza
         d = sezione.altezza_utile
         b = sezione.base
         
+        # Limiti noti dalla geometria: fissati subito (per le tensioni solo
+        # in altezza, la scala orizzontale segue i valori)
+        ax1.set_ylim(-h*0.1, h*1.1)
+        ax1.set_xlim(-b/10, b/4)
+        ax2.set_ylim(-h*0.1, h*1.1)
+        
         # GRAFICO 1: Sezione con asse neutro
         # Contorno sezione
-        rect = patches.Rectangle(
-            (0, 0), b/5, h,
-            linewidth=2, edgecolor='black', facecolor='lightgray', alpha=0.3
-        )
-        ax1.add_patch(rect)
+        ax1.add_patch(_rettangolo(_PROTO_CONTORNO, 0, 0, b/5, h))
         
         # Asse neutro
         ax1.plot([0, b/5], [x, x], 'r-', linewidth=2, label=f'Asse neutro (x={x:.1f} mm)')
@@ -207,8 +385,6 @@ class GeneratoreGrafici:
         for barra in sezione.barre_superiori:
             ax1.plot(b/10, barra.posizione_y, 'bo', markersize=8)
         
-        ax1.set_ylim(-h*0.1, h*1.1)
-        ax1.set_xlim(-b/10, b/4)
         ax1.set_aspect('equal')
         ax1.set_ylabel('Altezza (mm)')
         ax1.set_title('Sezione')
@@ -234,7 +410,6 @@ class GeneratoreGrafici:
         ax2.axvline(sigma_s_amm, color='red', linestyle='--', alpha=0.5,
                    label=f'σs,amm = {sigma_s_amm:.2f} MPa')
         
-        ax2.set_ylim(-h*0.1, h*1.1)
         ax2.set_xlabel('Tensione (MPa)')
         ax2.set_ylabel('Altezza (mm)')
         ax2.set_title('Diagramma Tensioni')
@@ -242,10 +417,11 @@ class GeneratoreGrafici:
         ax2.grid(True, alpha=0.2)
         ax2.axhline(x, color='red', linestyle=':', alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     @staticmethod
+    @rc_context(STYLE_CONFIG)
     def dominio_momento_sforzo_normale(
         base: float,
         altezza: float,
@@ -272,51 +448,16 @@ class GeneratoreGrafici:
         Returns:
             Figura matplotlib
         """
-        fig, ax = plt.subplots(figsize=(10, 8))
-        
-        d = altezza - copriferro - 15  # Altezza utile approssimata
-        d_prime = copriferro + 15
-        
-        momenti = []
-        sforzi_normali = []
-        
-        # Punto 1: Trazione pura
-        N1 = -sigma_s_amm * (area_armatura_inf + area_armatura_sup) / 1000
-        M1 = 0
-        momenti.append(M1)
-        sforzi_normali.append(N1)
-        
-        # Punto 2-4: Flessione semplice e composta
-        for x_ratio in np.linspace(0.1, 1.5, n_punti):
-            x = altezza * x_ratio / 3  # Posizione asse neutro variabile
-            
-            if x < altezza:
-                # Sezione parzialmente compressa
-                N = sigma_c_amm * base * x - sigma_s_amm * area_armatura_inf
-                N = N / 1000  # kN
-                
-                M = sigma_c_amm * base * x * (d - x/3) + \
-                    sigma_s_amm * area_armatura_sup * (d - d_prime)
-                M = M / 1e6  # kNm
-            else:
-                # Sezione tutta compressa
-                N = sigma_c_amm * base * altezza + \
-                    sigma_s_amm * (area_armatura_inf + area_armatura_sup) * 0.5
-                N = N / 1000
-                
-                M = sigma_c_amm * base * altezza * (altezza/2 - altezza/2) + \
-                    sigma_s_amm * area_armatura_inf * (d - altezza/2)
-                M = M / 1e6
-            
-            momenti.append(M)
-            sforzi_normali.append(N)
+        fig = Figure(figsize=(10, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
         
-        # Punto 5: Compressione centrata
-        N5 = (sigma_c_amm * base * altezza + 
-              sigma_s_amm * (area_armatura_inf + area_armatura_sup)) / 1000
-        M5 = 0
-        momenti.append(M5)
-        sforzi_normali.append(N5)
+        momenti, sforzi_normali = _calcola_dominio(
+            base, altezza, area_armatura_inf, area_armatura_sup,
+            sigma_c_amm, sigma_s_amm, copriferro, n_punti,
+        )
+        M1, N1 = momenti[0], sforzi_normali[0]
+        M5, N5 = momenti[-1], sforzi_normali[-1]
         
         # Disegna dominio
         ax.plot(momenti, sforzi_normali, 'b-', linewidth=2, label='Dominio di rottura')
@@ -335,18 +476,39 @@ class GeneratoreGrafici:
                     fontweight='bold', fontsize=12)
         ax.legend()
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     @staticmethod
-    def salva_grafico(fig: Figure, filepath: Path, dpi: int = 300) -> None:
+    def salva_grafico(
+        fig: Figure,
+        filepath: Path,
+        dpi: int = 300,
+        rasterizza: bool = False,
+    ) -> None:
         """
         Salva un grafico su file.
         
+        Le figure di questa classe non sono registrate in pyplot; quelle
+        create con pyplot vengono chiuse dopo il salvataggio.
+        
         Args:
             fig: Figura matplotlib
             filepath: Percorso file output
-            dpi: Risoluzione in DPI
+            dpi: Risoluzione in DPI (per i formati vettoriali, quella delle
+                parti rasterizzate)
+            rasterizza: Se True, nei formati vettoriali (PDF, SVG, EPS) le
+                collezioni (barre, campiture) sono salvate come immagine
+                invece che come singoli tracciati. Nei formati raster
+                (PNG, JPG) non ha effetto: tutto è già un'immagine.
         """
+        if rasterizza and Path(filepath).suffix.lower() not in _FORMATI_RASTER:
+            for ax in fig.axes:
+                for collezione in ax.collections:
+                    collezione.set_rasterized(True)
         fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
-        plt.close(fig)
+        # Una figura creata con pyplot implica pyplot già importato: non lo
+        # si importa solo per chiudere figure che non può gestire
+        pyplot = sys.modules.get('matplotlib.pyplot')
+        if pyplot is not None:
+            pyplot.close(fig)
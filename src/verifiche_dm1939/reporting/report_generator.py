@@ -8,11 +8,89 @@ Crea relazioni di calcolo dettagliate in formato:
 - DOCX
 """
 
+from functools import lru_cache
+from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from datetime import datetime
-from jinja2 import Template
 import json
+import math
+import re
+
+from verifiche_dm1939.core.compat import orjson
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+
+@lru_cache(maxsize=1)
+def _ambiente() -> "Environment":
+    """
+    Ambiente Jinja condiviso, creato al primo report.
+    
+    jinja2 è importato solo qui, così chi usa il pacchetto per le sole
+    verifiche non ne paga il caricamento. I template sono stringhe
+    costanti: non serve ricontrollarne l'aggiornamento.
+    """
+    from jinja2 import Environment
+    return Environment(autoescape=False, auto_reload=False, cache_size=-1)
+
+def _contiene_non_finiti(dati: Any) -> bool:
+    """
+    True se i dati contengono float infiniti o NaN.
+    
+    orjson li scrive come null, il modulo json come Infinity/NaN: i risultati
+    delle verifiche li contengono (es. coefficiente di sicurezza a carico nullo).
+    """
+    if isinstance(dati, float):
+        return not math.isfinite(dati)
+    if isinstance(dati, dict):
+        return any(map(_contiene_non_finiti, dati.values()))
+    if isinstance(dati, (list, tuple)):
+        return any(map(_contiene_non_finiti, dati))
+    return False
+
+# Tag di apertura e chiusura delle tabelle, sostituiti da un a capo nel Markdown
+_RE_TABELLA = re.compile(r"</?table>")
+
+
+@lru_cache(maxsize=None)
+def _compila_template(sorgente: str) -> "Template":
+    """
+    Compila un template una sola volta per sorgente.
+    
+    I template compilati sono condivisi tra tutte le istanze di
+    GeneratoreReport (anche sottoclassi con template propri).
+    """
+    return _ambiente().from_string(sorgente)
+
+
+@lru_cache(maxsize=16)
+def _render_report(
+    template: "Template",
+    titolo: str,
+    data: str,
+    normativa: str,
+    metodo: str,
+    progettista: Optional[str],
+    contenuto: str,
+) -> str:
+    """
+    Documento finale di un report (vedi GeneratoreReport.genera_report_completo).
+    
+    Memorizzata: rigenerare lo stesso report (anteprime, salvataggi
+    ripetuti) restituisce il testo già prodotto senza ripassare da Jinja.
+    La chiave comprende il contenuto stesso, non un suo riassunto, quindi
+    non ci sono collisioni.
+    """
+    return template.render(
+        titolo=titolo,
+        data=data,
+        normativa=normativa,
+        metodo=metodo,
+        progettista=progettista,
+        contenuto=contenuto,
+    )
 
 
 class GeneratoreReport:
@@ -140,34 +218,9 @@ class GeneratoreReport:
 *Generato con Verifiche DM 1939 - {{ data }}*
 """
     
-    def __init__(self):
-        """Inizializza il generatore."""
-        self.template_html = Template(self.TEMPLATE_HTML)
-        self.template_markdown = Template(self.TEMPLATE_MARKDOWN)
-    
-    def genera_report_verifica_flessione(
-        self,
-        risultato: Any,
-        sezione: Any,
-        materiali: Dict[str, Any],
-        sollecitazioni: Dict[str, Any],
-    ) -> str:
-        """
-        Genera contenuto HTML per verifica a flessione.
-        
-        Args:
-            risultato: Risultato verifica flessione
-            sezione: Sezione verificata
-            materiali: Dizionario materiali
-            sollecitazioni: Dizionario sollecitazioni
-            
-        Returns:
-            Contenuto HTML
-        """
-        stato_classe = "verificato" if risultato.verificato else "non-verificato"
-        stato_testo = "VERIFICATA ✓" if risultato.verificato else "NON VERIFICATA ✗"
-        
-        html = f"""
+    # Corpo delle singole verifiche, inserito in {{ contenuto }}: modelli per
+    # str.format_map, riempiti con valori già formattati
+    TEMPLATE_FLESSIONE = """
 <div class="sezione">
     <h2>Verifica a Flessione - <span class="{stato_classe}">{stato_testo}</span></h2>
     
@@ -180,32 +233,32 @@ class GeneratoreReport:
         </tr>
         <tr>
             <td>Base sezione</td>
-            <td>{sezione.base:.0f}</td>
+            <td>{base}</td>
             <td>mm</td>
         </tr>
         <tr>
             <td>Altezza sezione</td>
-            <td>{sezione.altezza:.0f}</td>
+            <td>{altezza}</td>
             <td>mm</td>
         </tr>
         <tr>
             <td>Altezza utile</td>
-            <td>{sezione.altezza_utile:.0f}</td>
+            <td>{altezza_utile}</td>
             <td>mm</td>
         </tr>
         <tr>
             <td>Copriferro</td>
-            <td>{sezione.copriferro:.0f}</td>
+            <td>{copriferro}</td>
             <td>mm</td>
         </tr>
         <tr>
             <td>Area armatura tesa</td>
-            <td>{sezione.area_armatura_inferiore:.0f}</td>
+            <td>{area_armatura_tesa}</td>
             <td>mm²</td>
         </tr>
         <tr>
             <td>Percentuale armatura</td>
-            <td>{sezione.percentuale_armatura_meccanica:.2f}</td>
+            <td>{percentuale_armatura}</td>
             <td>%</td>
         </tr>
     </table>
@@ -221,23 +274,23 @@ class GeneratoreReport:
         <tr>
             <td rowspan="2">Calcestruzzo</td>
             <td>Rck</td>
-            <td>{materiali['calcestruzzo']['resistenza_caratteristica']:.1f}</td>
+            <td>{rck}</td>
             <td>MPa</td>
         </tr>
         <tr>
             <td>σc,amm</td>
-            <td>{materiali['calcestruzzo']['tensione_ammissibile_compressione']:.2f}</td>
+            <td>{sigma_c_amm}</td>
             <td>MPa</td>
         </tr>
         <tr>
             <td rowspan="2">Acciaio</td>
             <td>Tipo</td>
-            <td>{materiali['acciaio']['tipo']}</td>
+            <td>{tipo_acciaio}</td>
             <td>-</td>
         </tr>
         <tr>
             <td>σs,amm</td>
-            <td>{materiali['acciaio']['tensione_ammissibile']:.1f}</td>
+            <td>{sigma_s_amm}</td>
             <td>MPa</td>
         </tr>
     </table>
@@ -252,19 +305,19 @@ class GeneratoreReport:
         </tr>
         <tr>
             <td>Momento sollecitante</td>
-            <td class="valore-importante">{sollecitazioni['momento']:.2f}</td>
+            <td class="valore-importante">{momento}</td>
             <td>kNm</td>
             <td>-</td>
         </tr>
         <tr>
             <td>Momento resistente</td>
-            <td class="valore-importante">{risultato.momento_resistente:.2f}</td>
+            <td class="valore-importante">{momento_resistente}</td>
             <td>kNm</td>
             <td>-</td>
         </tr>
         <tr>
             <td>Coefficiente di sicurezza</td>
-            <td class="valore-importante">{risultato.coefficiente_sicurezza:.2f}</td>
+            <td class="valore-importante">{coefficiente_sicurezza}</td>
             <td>-</td>
             <td>-</td>
         </tr>
@@ -280,48 +333,25 @@ class GeneratoreReport:
         </tr>
         <tr>
             <td>Calcestruzzo</td>
-            <td>{risultato.tensione_calcestruzzo:.2f} MPa</td>
-            <td>{materiali['calcestruzzo']['tensione_ammissibile_compressione']:.2f} MPa</td>
-            <td>{risultato.rapporto_sfruttamento_cls*100:.1f}%</td>
+            <td>{sigma_c} MPa</td>
+            <td>{sigma_c_amm} MPa</td>
+            <td>{sfruttamento_cls}%</td>
         </tr>
         <tr>
             <td>Acciaio</td>
-            <td>{risultato.tensione_acciaio:.2f} MPa</td>
-            <td>{materiali['acciaio']['tensione_ammissibile']:.1f} MPa</td>
-            <td>{risultato.rapporto_sfruttamento_acciaio*100:.1f}%</td>
+            <td>{sigma_s} MPa</td>
+            <td>{sigma_s_amm} MPa</td>
+            <td>{sfruttamento_acciaio}%</td>
         </tr>
     </table>
     
     <h3>Asse Neutro</h3>
-    <p>Posizione asse neutro dal lembo compresso: <span class="valore-importante">{risultato.posizione_asse_neutro:.1f} mm</span></p>
-    <p>Rapporto x/d: <span class="valore-importante">{risultato.posizione_asse_neutro/sezione.altezza_utile:.3f}</span></p>
+    <p>Posizione asse neutro dal lembo compresso: <span class="valore-importante">{asse_neutro} mm</span></p>
+    <p>Rapporto x/d: <span class="valore-importante">{rapporto_x_d}</span></p>
 </div>
 """
-        return html
     
-    def genera_report_verifica_taglio(
-        self,
-        risultato: Any,
-        sezione: Any,
-        materiali: Dict[str, Any],
-        sollecitazioni: Dict[str, Any],
-    ) -> str:
-        """
-        Genera contenuto HTML per verifica a taglio.
-        
-        Args:
-            risultato: Risultato verifica taglio
-            sezione: Sezione verificata
-            materiali: Dizionario materiali
-            sollecitazioni: Dizionario sollecitazioni
-            
-        Returns:
-            Contenuto HTML
-        """
-        stato_classe = "verificato" if risultato.verificato else "non-verificato"
-        stato_testo = "VERIFICATA ✓" if risultato.verificato else "NON VERIFICATA ✗"
-        
-        html = f"""
+    TEMPLATE_TAGLIO = """
 <div class="sezione">
     <h2>Verifica a Taglio - <span class="{stato_classe}">{stato_testo}</span></h2>
     
@@ -334,77 +364,181 @@ class GeneratoreReport:
         </tr>
         <tr>
             <td>Taglio sollecitante</td>
-            <td class="valore-importante">{sollecitazioni['taglio']:.2f}</td>
+            <td class="valore-importante">{taglio}</td>
             <td>kN</td>
         </tr>
         <tr>
             <td>Taglio resistente totale</td>
-            <td class="valore-importante">{risultato.taglio_resistente:.2f}</td>
+            <td class="valore-importante">{taglio_resistente}</td>
             <td>kN</td>
         </tr>
         <tr>
             <td>- Contributo calcestruzzo</td>
-            <td>{risultato.contributo_calcestruzzo:.2f}</td>
+            <td>{contributo_calcestruzzo}</td>
             <td>kN</td>
         </tr>
         <tr>
             <td>- Contributo staffe</td>
-            <td>{risultato.contributo_staffe:.2f}</td>
+            <td>{contributo_staffe}</td>
             <td>kN</td>
         </tr>
         <tr>
             <td>- Contributo ferri piegati</td>
-            <td>{risultato.contributo_ferri_piegati:.2f}</td>
+            <td>{contributo_ferri_piegati}</td>
             <td>kN</td>
         </tr>
         <tr>
             <td>Coefficiente di sicurezza</td>
-            <td class="valore-importante">{risultato.coefficiente_sicurezza:.2f}</td>
+            <td class="valore-importante">{coefficiente_sicurezza}</td>
             <td>-</td>
         </tr>
         <tr>
             <td>Sfruttamento</td>
-            <td class="valore-importante">{risultato.rapporto_sfruttamento*100:.1f}%</td>
+            <td class="valore-importante">{sfruttamento}%</td>
             <td>%</td>
         </tr>
     </table>
     
     <h3>Armatura Trasversale</h3>
+{armatura_staffe}{armatura_piegati}
+    <h3>Tensione Tangenziale</h3>
+    <p>Tensione tangenziale media: <span class="valore-importante">{tau} MPa</span></p>
+    <p>Tensione tangenziale ammissibile cls: <span class="valore-importante">{tau_amm} MPa</span></p>
+</div>
 """
-        
-        if sezione.staffe:
-            html += f"""
+    
+    TEMPLATE_STAFFE = """
     <p><strong>Staffe:</strong></p>
     <ul>
-        <li>Diametro: {sezione.staffe.diametro} mm</li>
-        <li>Passo: {sezione.staffe.passo} mm</li>
-        <li>Numero bracci: {sezione.staffe.numero_bracci}</li>
-        <li>Area totale: {sezione.staffe.area_totale:.1f} mm²</li>
+        <li>Diametro: {diametro} mm</li>
+        <li>Passo: {passo} mm</li>
+        <li>Numero bracci: {numero_bracci}</li>
+        <li>Area totale: {area_totale} mm²</li>
     </ul>
 """
-        else:
-            html += "<p>Nessuna staffa definita</p>"
-        
-        if sezione.ferri_piegati:
-            html += f"""
+    
+    TEMPLATE_FERRI_PIEGATI = """
     <p><strong>Ferri piegati:</strong></p>
     <ul>
-        <li>Diametro: {sezione.ferri_piegati.diametro} mm</li>
-        <li>Numero: {sezione.ferri_piegati.numero}</li>
-        <li>Inclinazione: {sezione.ferri_piegati.inclinazione}°</li>
-        <li>Area totale: {sezione.ferri_piegati.area_totale:.1f} mm²</li>
+        <li>Diametro: {diametro} mm</li>
+        <li>Numero: {numero}</li>
+        <li>Inclinazione: {inclinazione}°</li>
+        <li>Area totale: {area_totale} mm²</li>
     </ul>
 """
+    
+    def __init__(self):
+        """Inizializza il generatore."""
+        self.template_html = _compila_template(self.TEMPLATE_HTML)
+        self.template_markdown = _compila_template(self.TEMPLATE_MARKDOWN)
+    
+    def genera_report_verifica_flessione(
+        self,
+        risultato: Any,
+        sezione: Any,
+        materiali: Dict[str, Any],
+        sollecitazioni: Dict[str, Any],
+    ) -> str:
+        """
+        Genera contenuto HTML per verifica a flessione.
+        
+        Args:
+            risultato: Risultato verifica flessione
+            sezione: Sezione verificata
+            materiali: Dizionario materiali
+            sollecitazioni: Dizionario sollecitazioni
+            
+        Returns:
+            Contenuto HTML
+        """
+        stato_classe = "verificato" if risultato.verificato else "non-verificato"
+        stato_testo = "VERIFICATA ✓" if risultato.verificato else "NON VERIFICATA ✗"
+        
+        calcestruzzo = materiali['calcestruzzo']
+        acciaio = materiali['acciaio']
+        return self.TEMPLATE_FLESSIONE.format_map({
+            "stato_classe": stato_classe,
+            "stato_testo": stato_testo,
+            "base": format(sezione.base, ".0f"),
+            "altezza": format(sezione.altezza, ".0f"),
+            "altezza_utile": format(sezione.altezza_utile, ".0f"),
+            "copriferro": format(sezione.copriferro, ".0f"),
+            "area_armatura_tesa": format(sezione.area_armatura_inferiore, ".0f"),
+            "percentuale_armatura": format(sezione.percentuale_armatura_meccanica, ".2f"),
+            "rck": format(calcestruzzo['resistenza_caratteristica'], ".1f"),
+            "sigma_c_amm": format(calcestruzzo['tensione_ammissibile_compressione'], ".2f"),
+            "tipo_acciaio": acciaio['tipo'],
+            "sigma_s_amm": format(acciaio['tensione_ammissibile'], ".1f"),
+            "momento": format(sollecitazioni['momento'], ".2f"),
+            "momento_resistente": format(risultato.momento_resistente, ".2f"),
+            "coefficiente_sicurezza": format(risultato.coefficiente_sicurezza, ".2f"),
+            "sigma_c": format(risultato.tensione_calcestruzzo, ".2f"),
+            "sfruttamento_cls": format(risultato.rapporto_sfruttamento_cls*100, ".1f"),
+            "sigma_s": format(risultato.tensione_acciaio, ".2f"),
+            "sfruttamento_acciaio": format(risultato.rapporto_sfruttamento_acciaio*100, ".1f"),
+            "asse_neutro": format(risultato.posizione_asse_neutro, ".1f"),
+            "rapporto_x_d": format(risultato.posizione_asse_neutro/sezione.altezza_utile, ".3f"),
+        })
+    
+    def genera_report_verifica_taglio(
+        self,
+        risultato: Any,
+        sezione: Any,
+        materiali: Dict[str, Any],
+        sollecitazioni: Dict[str, Any],
+    ) -> str:
+        """
+        Genera contenuto HTML per verifica a taglio.
+        
+        Args:
+            risultato: Risultato verifica taglio
+            sezione: Sezione verificata
+            materiali: Dizionario materiali
+            sollecitazioni: Dizionario sollecitazioni
+            
+        Returns:
+            Contenuto HTML
+        """
+        stato_classe = "verificato" if risultato.verificato else "non-verificato"
+        stato_testo = "VERIFICATA ✓" if risultato.verificato else "NON VERIFICATA ✗"
+        
+        if sezione.staffe:
+            staffe = sezione.staffe
+            armatura_staffe = self.TEMPLATE_STAFFE.format_map({
+                "diametro": staffe.diametro,
+                "passo": staffe.passo,
+                "numero_bracci": staffe.numero_bracci,
+                "area_totale": format(staffe.area_totale, ".1f"),
+            })
         else:
-            html += "<p>Nessun ferro piegato definito</p>"
+            armatura_staffe = "<p>Nessuna staffa definita</p>"
         
-        html += f"""
-    <h3>Tensione Tangenziale</h3>
-    <p>Tensione tangenziale media: <span class="valore-importante">{risultato.tensione_tangenziale:.3f} MPa</span></p>
-    <p>Tensione tangenziale ammissibile cls: <span class="valore-importante">{materiali['calcestruzzo']['tensione_ammissibile_taglio']:.3f} MPa</span></p>
-</div>
-"""
-        return html
+        if sezione.ferri_piegati:
+            piegati = sezione.ferri_piegati
+            armatura_piegati = self.TEMPLATE_FERRI_PIEGATI.format_map({
+                "diametro": piegati.diametro,
+                "numero": piegati.numero,
+                "inclinazione": piegati.inclinazione,
+                "area_totale": format(piegati.area_totale, ".1f"),
+            })
+        else:
+            armatura_piegati = "<p>Nessun ferro piegato definito</p>"
+        
+        return self.TEMPLATE_TAGLIO.format_map({
+            "stato_classe": stato_classe,
+            "stato_testo": stato_testo,
+            "taglio": format(sollecitazioni['taglio'], ".2f"),
+            "taglio_resistente": format(risultato.taglio_resistente, ".2f"),
+            "contributo_calcestruzzo": format(risultato.contributo_calcestruzzo, ".2f"),
+            "contributo_staffe": format(risultato.contributo_staffe, ".2f"),
+            "contributo_ferri_piegati": format(risultato.contributo_ferri_piegati, ".2f"),
+            "coefficiente_sicurezza": format(risultato.coefficiente_sicurezza, ".2f"),
+            "sfruttamento": format(risultato.rapporto_sfruttamento*100, ".1f"),
+            "armatura_staffe": armatura_staffe,
+            "armatura_piegati": armatura_piegati,
+            "tau": format(risultato.tensione_tangenziale, ".3f"),
+            "tau_amm": format(materiali['calcestruzzo']['tensione_ammissibile_taglio'], ".3f"),
+        })
     
     def genera_report_completo(
         self,
@@ -431,44 +565,36 @@ class GeneratoreReport:
         normativa = "DM 2229 del 16 novembre 1939"
         
         # Genera contenuto
-        contenuto = ""
+        buffer = StringIO()
         for i, ris in enumerate(risultati, 1):
             tipo_verifica = ris.get("tipo", "generale")
-            contenuto += f"<h2>Verifica {i}: {tipo_verifica.upper()}</h2>\n"
+            buffer.write(f"<h2>Verifica {i}: {tipo_verifica.upper()}</h2>\n")
             
             if tipo_verifica == "flessione":
-                contenuto += self.genera_report_verifica_flessione(
+                buffer.write(self.genera_report_verifica_flessione(
                     ris["risultato"],
                     ris["sezione"],
                     ris["materiali"],
                     ris["sollecitazioni"],
-                )
+                ))
             elif tipo_verifica == "taglio":
-                contenuto += self.genera_report_verifica_taglio(
+                buffer.write(self.genera_report_verifica_taglio(
                     ris["risultato"],
                     ris["sezione"],
                     ris["materiali"],
                     ris["sollecitazioni"],
-                )
+                ))
+        contenuto = buffer.getvalue()
         
         # Renderizza template
         if formato.lower() == "html":
-            output = self.template_html.render(
-                titolo=titolo,
-                data=data,
-                normativa=normativa,
-                metodo=metodo,
-                progettista=progettista,
-                contenuto=contenuto,
+            output = _render_report(
+                self.template_html, titolo, data, normativa, metodo, progettista, contenuto,
             )
         elif formato.lower() == "markdown":
-            output = self.template_markdown.render(
-                titolo=titolo,
-                data=data,
-                normativa=normativa,
-                metodo=metodo,
-                progettista=progettista,
-                contenuto=contenuto.replace("<table>", "\n").replace("</table>", "\n"),
+            output = _render_report(
+                self.template_markdown, titolo, data, normativa, metodo, progettista,
+                _RE_TABELLA.sub("\n", contenuto),
             )
         else:
             raise ValueError(f"Formato non supportato: {formato}")
@@ -484,9 +610,29 @@ class GeneratoreReport:
         """
         Esporta risultati in formato JSON.
         
+        Con orjson installato il file è serializzato in C e scritto in un
+        solo passo; i dati che orjson non gestisce nativamente (scalari e
+        array numpy, interi oltre 64 bit) passano dal modulo json, così
+        come i dati con valori infiniti o NaN (json li scrive come
+        Infinity/NaN, orjson come null). Con o senza orjson il JSON è
+        equivalente; la forma dei numeri può differire (es. 1e-05 / 0.00001).
+        
         Args:
             risultati: Dizionario con risultati
             filepath: Percorso file output
         """
+        if orjson is not None and not _contiene_non_finiti(risultati):
+            try:
+                dati = orjson.dumps(
+                    risultati,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                )
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                Path(filepath).write_bytes(dati)
+                return
+        
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(risultati, f, indent=2, ensure_ascii=False)
+
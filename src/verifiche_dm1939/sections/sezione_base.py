@@ -5,37 +5,60 @@ Definisce l'interfaccia comune per il calcolo delle proprietà geometriche,
 gestione armature, calcolo asse neutro e rappresentazione grafica.
 """
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import List, Tuple, Optional, Dict
 import numpy as np
 
+from verifiche_dm1939.core.compat import DATACLASS_SLOTS, njit, prange
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Barra:
-    """Rappresenta una barra di armatura."""
+    """Rappresenta una barra di armatura (immutabile: l'area resta coerente)."""
     diametro: float  # mm
     n_barre: int
     y_pos: float  # mm - posizione verticale dal lembo superiore
     x_pos: float = 0.0  # mm - posizione orizzontale (default asse)
+    area: float = field(init=False, repr=False, compare=False)  # mm² - calcolata alla creazione
     
-    @property
-    def area(self) -> float:
-        """Area totale delle barre [mm²]."""
-        return self.n_barre * np.pi * (self.diametro / 2) ** 2
+    def __post_init__(self):
+        # Area totale delle barre [mm²]
+        object.__setattr__(self, 'area', self.n_barre * math.pi * (self.diametro / 2) ** 2)
+
+
+# Liste delle barre per lembo, con i rispettivi array paralleli (SoA)
+_LISTE_BARRE = {'inf': 'barre_inferiori', 'sup': 'barre_superiori'}
+_LATI_BARRE = {lista: lato for lato, lista in _LISTE_BARRE.items()}
+
+
+def _armatura_da_barre(barre: List[Barra]) -> Dict[str, np.ndarray]:
+    """
+    Parametri delle barre in array paralleli (struttura di array).
+    
+    Chiavi: 'd' diametri [mm], 'n' numero di barre, 'y' e 'x' posizioni [mm].
+    """
+    return {
+        'd': np.array([b.diametro for b in barre], dtype=float),
+        'n': np.array([b.n_barre for b in barre], dtype=np.int64),
+        'y': np.array([b.y_pos for b in barre], dtype=float),
+        'x': np.array([b.x_pos for b in barre], dtype=float),
+    }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Staffa:
-    """Rappresenta una staffa di armatura a taglio."""
+    """Rappresenta una staffa di armatura a taglio (immutabile)."""
     diametro: float  # mm
     n_bracci: int
     passo: float  # mm
+    area_bracci: float = field(init=False, repr=False, compare=False)  # mm² - calcolata alla creazione
     
-    @property
-    def area_bracci(self) -> float:
-        """Area totale dei bracci della staffa [mm²]."""
-        return self.n_bracci * np.pi * (self.diametro / 2) ** 2
+    def __post_init__(self):
+        # Area totale dei bracci della staffa [mm²]
+        object.__setattr__(self, 'area_bracci', self.n_bracci * math.pi * (self.diametro / 2) ** 2)
 
     @property
     def area_totale(self) -> float:
@@ -51,7 +74,7 @@ class Staffa:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProprietaGeometriche:
     """Proprietà geometriche della sezione."""
     area: float  # mm²
@@ -64,6 +87,11 @@ class ProprietaGeometriche:
     modulo_resistenza_sup: float = 0.0  # mm³ - W = Ix / ysup
     modulo_resistenza_inf: float = 0.0  # mm³ - W = Ix / yinf
     
+    def __post_init__(self):
+        # Tutti i campi come float Python (non scalari NumPy né interi)
+        for nome in self.__dataclass_fields__:
+            setattr(self, nome, float(getattr(self, nome)))
+    
     def __str__(self) -> str:
         return (
             f"Area: {self.area:.0f} mm²\n"
@@ -75,7 +103,7 @@ class ProprietaGeometriche:
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AsseNeutro:
     """Informazioni sull'asse neutro della sezione."""
     posizione: float  # mm - dal lembo superiore
@@ -88,6 +116,150 @@ class AsseNeutro:
     sforzo_normale_resistente: float = 0.0  # kN
 
 
+# Attributi dei materiali: assegnarli scarta il coefficiente n memorizzato
+_ATTRIBUTI_MATERIALI = frozenset({'calcestruzzo', 'acciaio'})
+
+
+# Leggi di compressione del calcestruzzo note al calcolo compilato
+# dell'asse neutro (vedi SezioneBase._parametri_cls_compressa)
+_CLS_RETTANGOLARE = 0
+_CLS_T = 1
+_CLS_CIRCOLARE = 2
+_CLS_CIRCOLARE_CAVA = 3
+
+
+def _segmento_circolare(r: float, h: float) -> Tuple[float, float]:
+    """
+    Segmento circolare di freccia h (0 < h ≤ 2r) in un cerchio di raggio r.
+    
+    Returns:
+        (area [mm²], distanza del baricentro dal centro [mm], verso il
+        lembo del segmento): 4 r sin³(θ/2) / (3 (θ - sin θ))
+    """
+    theta = 2 * math.acos((r - h) / r)
+    sin_theta = math.sin(theta)
+    area = r**2 * (theta - sin_theta) / 2
+    if theta > sin_theta:
+        e = 4 * r * math.sin(theta / 2)**3 / (3 * (theta - sin_theta))
+    else:  # segmento degenere
+        e = r
+    return area, e
+
+
+# Stessa funzione per i kernel compilati
+_segmento_circolare_jit = njit(cache=True)(_segmento_circolare)
+
+
+@njit(cache=True)
+def _forza_cls_compressa(tipo: int, g1: float, g2: float, g3: float,
+                         x: float, sigma_amm: float) -> float:
+    """
+    Risultante di compressione nel calcestruzzo [N] per la legge `tipo`.
+    
+    Replica la forza di _calcola_risultante_cls_compressa delle sezioni;
+    g1..g3 sono le dimensioni restituite da _parametri_cls_compressa.
+    """
+    if tipo == _CLS_T:
+        bf, tf, bw = g1, g2, g3
+        if x <= tf:
+            return bf * x * sigma_amm
+        return bf * tf * sigma_amm + bw * (x - tf) * sigma_amm
+    
+    if tipo == _CLS_CIRCOLARE:
+        D = g1
+        r = D / 2
+        y_center = D / 2
+        if x >= D:
+            return math.pi * r**2 * sigma_amm
+        if x <= 0:
+            return 0.0
+        h_segm = x if x < y_center else D - x
+        A_segm = _segmento_circolare_jit(r, h_segm)[0]
+        A_compr = A_segm if x < y_center else math.pi * r**2 - A_segm
+        return A_compr * sigma_amm
+    
+    if tipo == _CLS_CIRCOLARE_CAVA:
+        De, Di = g1, g2
+        if x <= 0:
+            return 0.0
+        r_est = De / 2
+        r_int = Di / 2
+        h_int = min(max(x - (r_est - r_int), 0.0), Di)
+        A_compr = _segmento_circolare_jit(r_est, min(x, De))[0]
+        if h_int > 0:
+            A_compr -= _segmento_circolare_jit(r_int, h_int)[0]
+        return A_compr * sigma_amm
+    
+    # Distribuzione rettangolare di larghezza b = g1
+    return g1 * x * sigma_amm
+
+
+@njit(cache=True)
+def _itera_asse_neutro(tipo: int, g1: float, g2: float, g3: float,
+                       x: float, h: float, b: float, d: float, d_p: float,
+                       As: float, As_p: float, sigma_amm_cls: float,
+                       sigma_amm_acc: float, Es: float, N: float) -> float:
+    """
+    Iterazione dell'asse neutro per calcola_asse_neutro_batch (compilata
+    con numba se disponibile).
+    
+    Stessi passi di SezioneBase._calcola_asse_neutro_iterativo a partire
+    da x (baricentro): equilibrio alla traslazione con smorzamento 0.5,
+    passo diviso per b e x limitato a [10, h - 10].
+    """
+    for _ in range(20):
+        Fc = _forza_cls_compressa(tipo, g1, g2, g3, x, sigma_amm_cls)
+        
+        eps_s = 0.002 * (d - x) / x if x > 0 else 0.001
+        eps_s_p = 0.002 * (x - d_p) / x if x > d_p else -0.001
+        
+        sigma_s = min(eps_s * Es, sigma_amm_acc)
+        sigma_s_p = min(abs(eps_s_p) * Es, sigma_amm_acc)
+        if eps_s_p < 0:
+            sigma_s_p = -sigma_s_p
+        
+        R = Fc + As_p * sigma_s_p - As * sigma_s + N
+        if abs(R) < 100:  # N
+            break
+        
+        x += (-R / b) * 0.5
+        x = max(10.0, min(x, h - 10.0))
+    
+    return x
+
+
+@njit(cache=True, parallel=True)
+def _itera_asse_neutro_batch(tipo: int, g1: float, g2: float, g3: float,
+                             x0: float, h: float, b: float, d: float, d_p: float,
+                             As: float, As_p: float, sigma_amm_cls: float,
+                             sigma_amm_acc: float, Es: float, N: np.ndarray) -> np.ndarray:
+    """
+    _itera_asse_neutro per più sforzi normali N [N] sulla stessa sezione.
+    
+    Le combinazioni sono indipendenti: con numba sono ripartite tra i core
+    disponibili, senza numba è un ciclo ordinario.
+    """
+    posizioni = np.empty(len(N))
+    for i in prange(len(N)):
+        posizioni[i] = _itera_asse_neutro(tipo, g1, g2, g3, x0, h, b, d, d_p, As, As_p,
+                                          sigma_amm_cls, sigma_amm_acc, Es, N[i])
+    return posizioni
+
+
+@lru_cache(maxsize=None)
+def _legge_cls_compilabile(classe: type) -> bool:
+    """
+    True se la classe descrive con _parametri_cls_compressa la stessa legge
+    di _calcola_risultante_cls_compressa (entrambi definiti nella stessa
+    classe della gerarchia): altrimenti si usa l'iterazione in Python.
+    """
+    def definito_in(nome: str) -> type:
+        return next(k for k in classe.__mro__ if nome in vars(k))
+    
+    return (definito_in('_calcola_risultante_cls_compressa')
+            is definito_in('_parametri_cls_compressa'))
+
+
 class SezioneBase(ABC):
     """
     Classe base astratta per tutte le tipologie di sezioni.
@@ -103,6 +275,15 @@ class SezioneBase(ABC):
     - N+ → trazione
     """
     
+    # Attributi che definiscono la geometria: assegnarli invalida le
+    # proprietà geometriche memorizzate (vedi _get_prop_cached)
+    _ATTRIBUTI_GEOMETRIA: frozenset = frozenset()
+    
+    # Combinazioni da cui calcola_asse_neutro_batch usa il kernel compilato:
+    # sotto, la compilazione (~0.5 s anche dalla cache su disco) costa più
+    # dell'iterazione in Python (60-100 µs per combinazione)
+    SOGLIA_BATCH_COMPILATO: int = 5000
+    
     def __init__(self, calcestruzzo, acciaio, copriferro: float = 30.0):
         """
         Inizializza la sezione base.
@@ -116,6 +297,20 @@ class SezioneBase(ABC):
         self.acciaio = acciaio
         self.copriferro = copriferro
         
+        # Barre inferiori e superiori anche in array paralleli, con area
+        # totale e momento statico memorizzati per lembo ('inf', 'sup').
+        # I buffer hanno capacità libera; _armature ne espone le viste
+        # limitate alle barre presenti, _barre_armature le barre da cui
+        # sono stati costruiti (None = da ricostruire).
+        self._buffer_armature: Dict[str, Dict[str, np.ndarray]] = {
+            lato: _armatura_da_barre([]) for lato in _LISTE_BARRE
+        }
+        self._armature: Dict[str, Dict[str, np.ndarray]] = {
+            lato: dict(buffer) for lato, buffer in self._buffer_armature.items()
+        }
+        self._barre_armature: Dict[str, Optional[List[Barra]]] = {}
+        self._riepiloghi_armatura: Dict[str, Tuple[float, float]] = {}
+        
         # Armature longitudinali
         self.barre_inferiori: List[Barra] = []
         self.barre_superiori: List[Barra] = []
@@ -130,6 +325,49 @@ class SezioneBase(ABC):
         
         # Rotazione
         self._ruotata_90: bool = False
+        
+        # Proprietà geometriche e dimensioni memorizzate (None = da ricalcolare)
+        self._prop_cache: Optional[ProprietaGeometriche] = None
+        self._dim_cache: Optional[Dict[str, float]] = None
+    
+    def __setattr__(self, nome: str, valore) -> None:
+        super().__setattr__(nome, valore)
+        if nome in self._ATTRIBUTI_GEOMETRIA:
+            self._invalida_geometria()
+        elif nome in _ATTRIBUTI_MATERIALI:
+            self.__dict__.pop('_coeff_n_auto', None)
+        elif nome in _LATI_BARRE:
+            self._invalida_armatura(_LATI_BARRE[nome])
+    
+    def _invalida_geometria(self) -> None:
+        """Scarta le proprietà geometriche e le dimensioni memorizzate."""
+        self._prop_cache = None
+        self._dim_cache = None
+    
+    def _invalida_armatura(self, lato: str) -> None:
+        """Scarta gli array paralleli e il riepilogo delle barre del lembo."""
+        self._barre_armature[lato] = None
+        self._riepiloghi_armatura.pop(lato, None)
+    
+    def _get_prop_cached(self) -> ProprietaGeometriche:
+        """
+        Proprietà geometriche memorizzate sull'istanza.
+        
+        Sono ricalcolate solo dopo una modifica della geometria
+        (attributi in _ATTRIBUTI_GEOMETRIA o rotazione).
+        """
+        if self._prop_cache is None:
+            self._prop_cache = self.calcola_proprieta_geometriche()
+        return self._prop_cache
+    
+    def _get_dim_cached(self) -> Dict[str, float]:
+        """
+        Dimensioni principali memorizzate sull'istanza (uso interno, in
+        sola lettura): ricalcolate solo dopo una modifica della geometria.
+        """
+        if self._dim_cache is None:
+            self._dim_cache = self.get_dimensioni_principali()
+        return self._dim_cache
     
     @property
     def coeff_omogeneizzazione(self) -> float:
@@ -140,10 +378,15 @@ class SezioneBase(ABC):
             Coefficiente n [-]
         """
         if self._calcola_n_automatico:
-            return self.acciaio.modulo_elastico / self.calcestruzzo.modulo_elastico
+            return self._coeff_n_auto
         else:
             return self._coeff_omogeneizzazione or 15.0
     
+    @cached_property
+    def _coeff_n_auto(self) -> float:
+        """n = Es/Ec dai materiali, calcolato una volta (scartato se cambiano)."""
+        return self.acciaio.modulo_elastico / self.calcestruzzo.modulo_elastico
+    
     @coeff_omogeneizzazione.setter
     def coeff_omogeneizzazione(self, valore: Optional[float]):
         """
@@ -167,6 +410,7 @@ class SezioneBase(ABC):
     def ruota_90_gradi(self):
         """Ruota la sezione di 90 gradi."""
         self._ruotata_90 = not self._ruotata_90
+        self._invalida_geometria()
     
     @abstractmethod
     def calcola_proprieta_geometriche(self) -> ProprietaGeometriche:
@@ -198,29 +442,78 @@ class SezioneBase(ABC):
         """
         pass
     
+    def _armatura(self, lato: str) -> Dict[str, np.ndarray]:
+        """
+        Array paralleli delle barre del lembo ('inf' o 'sup').
+        
+        Se la lista delle barre è stata riassegnata o modificata direttamente
+        (senza aggiungi_armatura_*), gli array vengono ricostruiti: il
+        confronto con le barre memorizzate è per identità e poi per valore
+        (le barre sono immutabili).
+        """
+        barre = getattr(self, _LISTE_BARRE[lato])
+        if self._barre_armature.get(lato) != barre:
+            buffer = self._buffer_armature[lato] = _armatura_da_barre(barre)
+            self._armature[lato] = dict(buffer)
+            self._barre_armature[lato] = list(barre)
+            self._riepiloghi_armatura.pop(lato, None)
+        return self._armature[lato]
+    
+    def _riepilogo_armatura(self, lato: str) -> Tuple[float, float]:
+        """
+        Area totale [mm²] e momento statico rispetto al lembo superiore
+        [mm³] delle barre del lembo, memorizzati finché le barre non cambiano.
+        """
+        armatura = self._armatura(lato)
+        riepilogo = self._riepiloghi_armatura.get(lato)
+        if riepilogo is None:
+            aree = armatura['n'] * np.pi * (armatura['d'] / 2) ** 2
+            riepilogo = (float(aree.sum()), float((aree * armatura['y']).sum()))
+            self._riepiloghi_armatura[lato] = riepilogo
+        return riepilogo
+    
+    def _aggiungi_barra(self, lato: str, barra: Barra) -> None:
+        """Aggiunge la barra alla lista e agli array paralleli del lembo."""
+        n = len(self._armatura(lato)['d'])
+        buffer = self._buffer_armature[lato]
+        if n == len(buffer['d']):
+            # Buffer pieno: capacità raddoppiata (inserimento O(1) ammortizzato)
+            capacita = max(4, 2 * n)
+            for chiave, valori in buffer.items():
+                nuovi = np.empty(capacita, dtype=valori.dtype)
+                nuovi[:n] = valori
+                buffer[chiave] = nuovi
+        
+        for chiave, valore in zip('dnyx', (barra.diametro, barra.n_barre, barra.y_pos, barra.x_pos)):
+            buffer[chiave][n] = valore
+        self._armature[lato] = {chiave: valori[:n + 1] for chiave, valori in buffer.items()}
+        self._barre_armature[lato].append(barra)
+        getattr(self, _LISTE_BARRE[lato]).append(barra)
+        self._riepiloghi_armatura.pop(lato, None)
+    
     @property
     def As(self) -> float:
         """Area armatura inferiore (tesa con M+) [mm²]."""
-        return sum(b.area for b in self.barre_inferiori)
+        return self._riepilogo_armatura('inf')[0]
     
     @property
     def As_prime(self) -> float:
         """Area armatura superiore (tesa con M-) [mm²]."""
-        return sum(b.area for b in self.barre_superiori)
+        return self._riepilogo_armatura('sup')[0]
     
     @property
     def d(self) -> float:
         """Altezza utile inferiore dal lembo superiore [mm]."""
         if not self.barre_inferiori:
-            prop = self.calcola_proprieta_geometriche()
+            prop = self._get_prop_cached()
             return prop.area ** 0.5 - self.copriferro  # stima
         
         # Media ponderata delle posizioni
-        area_tot = sum(b.area for b in self.barre_inferiori)
+        area_tot, momento_statico = self._riepilogo_armatura('inf')
         if area_tot == 0:
             return 0.0
         
-        return sum(b.area * b.y_pos for b in self.barre_inferiori) / area_tot
+        return momento_statico / area_tot
     
     @property
     def d_prime(self) -> float:
@@ -229,11 +522,11 @@ class SezioneBase(ABC):
             return self.copriferro + 15.0  # stima
         
         # Media ponderata delle posizioni
-        area_tot = sum(b.area for b in self.barre_superiori)
+        area_tot, momento_statico = self._riepilogo_armatura('sup')
         if area_tot == 0:
             return self.copriferro + 15.0
         
-        return sum(b.area * b.y_pos for b in self.barre_superiori) / area_tot
+        return momento_statico / area_tot
     
     def aggiungi_armatura_inferiore(self, diametro: float, n_barre: int, 
                                    y_pos: Optional[float] = None):
@@ -246,11 +539,11 @@ class SezioneBase(ABC):
             y_pos: Posizione verticale [mm] (default: auto da dimensioni)
         """
         if y_pos is None:
-            dim = self.get_dimensioni_principali()
+            dim = self._get_dim_cached()
             h = dim.get('h', dim.get('altezza', 500.0))
             y_pos = h - self.copriferro - diametro / 2
         
-        self.barre_inferiori.append(Barra(diametro, n_barre, y_pos))
+        self._aggiungi_barra('inf', Barra(diametro, n_barre, y_pos))
     
     def aggiungi_armatura_superiore(self, diametro: float, n_barre: int,
                                    y_pos: Optional[float] = None):
@@ -265,7 +558,7 @@ class SezioneBase(ABC):
         if y_pos is None:
             y_pos = self.copriferro + diametro / 2
         
-        self.barre_superiori.append(Barra(diametro, n_barre, y_pos))
+        self._aggiungi_barra('sup', Barra(diametro, n_barre, y_pos))
     
     def aggiungi_staffe(self, diametro: float, passo: float, n_bracci: int = 2, numero_bracci: Optional[int] = None):
         """
@@ -297,7 +590,7 @@ class SezioneBase(ABC):
         Returns:
             Area ferro necessaria [mm²]
         """
-        prop = self.calcola_proprieta_geometriche()
+        prop = self._get_prop_cached()
         
         # Determina altezza utile
         if posizione == 'inferiore':
@@ -305,7 +598,7 @@ class SezioneBase(ABC):
         else:
             d_eff = self.copriferro + 15.0
         
-        h = self.get_dimensioni_principali().get('h', prop.area ** 0.5)
+        h = self._get_dim_cached().get('h', prop.area ** 0.5)
         
         # Verifica segno momento
         if (M > 0 and posizione == 'superiore') or (M < 0 and posizione == 'inferiore'):
@@ -346,23 +639,11 @@ class SezioneBase(ABC):
         Returns:
             Informazioni sull'asse neutro
         """
-        prop = self.calcola_proprieta_geometriche()
-        n = self.coeff_omogeneizzazione
+        prop, n, As, As_p, d, d_p, b, h = self._parametri_asse_neutro()
         
         M_Nmm = M * 1e6  # Nmm
         N_N = N * 1e3  # N
         
-        # Parametri sezione
-        As = self.As
-        As_p = self.As_prime
-        d = self.d if self.d > 0 else prop.area ** 0.5 - self.copriferro - 15
-        d_p = self.d_prime
-        
-        # Dimensioni
-        dim = self.get_dimensioni_principali()
-        b = dim.get('b', dim.get('base', 300.0))
-        h = dim.get('h', dim.get('altezza', 500.0))
-        
         if metodo == 'analitico' and self.__class__.__name__ == 'SezioneRettangolare':
             # Soluzione analitica per sezione rettangolare
             x = self._calcola_asse_neutro_analitico(b, h, d, d_p, As, As_p, n, N_N, M_Nmm)
@@ -395,6 +676,69 @@ class SezioneBase(ABC):
             epsilon_acciaio_sup=eps_s_sup
         )
     
+    def calcola_asse_neutro_batch(self, M: np.ndarray, N: np.ndarray = 0.0,
+                                  metodo: str = 'iterativo') -> np.ndarray:
+        """
+        Posizione dell'asse neutro per più combinazioni di carico
+        (versione vettoriale di calcola_asse_neutro).
+        
+        Da SOGLIA_BATCH_COMPILATO combinazioni in su l'iterazione è compilata
+        con numba (se installato) e ripartita tra i core, con gli stessi
+        risultati; sotto la soglia resta in Python.
+        
+        Args:
+            M: Momenti flettenti [kNm]
+            N: Sforzi normali [kN] (scalare o uno per momento)
+            metodo: 'iterativo' o 'analitico'
+        
+        Returns:
+            Posizioni dell'asse neutro [mm dal lembo superiore], una per combinazione
+        """
+        M, N = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(M, dtype=float)) * 1e6,  # Nmm
+            np.atleast_1d(np.asarray(N, dtype=float)) * 1e3,  # N
+        )
+        prop, n, As, As_p, d, d_p, b, h = self._parametri_asse_neutro()
+        
+        if metodo == 'analitico' and self.__class__.__name__ == 'SezioneRettangolare':
+            return np.array([
+                self._calcola_asse_neutro_analitico(b, h, d, d_p, As, As_p, n, N_N, M_Nmm)
+                for M_Nmm, N_N in zip(M.tolist(), N.tolist())
+            ])
+        
+        if len(N) >= self.SOGLIA_BATCH_COMPILATO and _legge_cls_compilabile(type(self)):
+            return _itera_asse_neutro_batch(
+                *self._dati_kernel_asse_neutro(prop, d, d_p, As, As_p),
+                np.ascontiguousarray(N),
+            )
+        return np.array([
+            self._calcola_asse_neutro_iterativo(prop, d, d_p, As, As_p, n, N_N, M_Nmm)
+            for M_Nmm, N_N in zip(M.tolist(), N.tolist())
+        ])
+    
+    def _parametri_asse_neutro(self) -> tuple:
+        """
+        Grandezze comuni al calcolo dell'asse neutro.
+        
+        Returns:
+            (prop, n, As, As', d, d', b, h)
+        """
+        prop = self._get_prop_cached()
+        n = self.coeff_omogeneizzazione
+        
+        # Parametri sezione
+        As = self.As
+        As_p = self.As_prime
+        d = self.d if self.d > 0 else prop.area ** 0.5 - self.copriferro - 15
+        d_p = self.d_prime
+        
+        # Dimensioni
+        dim = self._get_dim_cached()
+        b = dim.get('b', dim.get('base', 300.0))
+        h = dim.get('h', dim.get('altezza', 500.0))
+        
+        return prop, n, As, As_p, d, d_p, b, h
+    
     def _calcola_asse_neutro_analitico(self, b: float, h: float, d: float,
                                       d_p: float, As: float, As_p: float,
                                       n: float, N: float, M: float) -> float:
@@ -412,8 +756,8 @@ class SezioneBase(ABC):
         if delta < 0:
             return d / 3  # Fallback
         
-        x1 = (-b_coeff + np.sqrt(delta)) / (2 * a)
-        x2 = (-b_coeff - np.sqrt(delta)) / (2 * a)
+        x1 = (-b_coeff + math.sqrt(delta)) / (2 * a)
+        x2 = (-b_coeff - math.sqrt(delta)) / (2 * a)
         
         # Scegli soluzione fisica (0 < x < h)
         x = x1 if 0 < x1 < h else x2
@@ -426,8 +770,14 @@ class SezioneBase(ABC):
                                        As_p: float, n: float, N: float,
                                        M: float) -> float:
         """Calcolo iterativo asse neutro (generale per tutte le sezioni)."""
-        dim = self.get_dimensioni_principali()
+        dim = self._get_dim_cached()
         h = dim.get('h', dim.get('altezza', 500.0))
+        b = dim.get('b', 300.0)
+        
+        # Materiali e metodo letti una volta, fuori dal ciclo
+        Es = self.acciaio.modulo_elastico
+        sigma_amm_acc = self.acciaio.tensione_ammissibile or 140.0
+        risultante_cls = self._calcola_risultante_cls_compressa
         
         # Stima iniziale
         x = prop.y_baricentro
@@ -435,39 +785,61 @@ class SezioneBase(ABC):
         # Iterazione Newton-Raphson
         for _ in range(20):
             # Calcola risultante compressione cls
-            Fc, yc = self._calcola_risultante_cls_compressa(x)
+            Fc, _yc = risultante_cls(x)
             
             # Forze nelle armature
             eps_s = 0.002 * (d - x) / x if x > 0 else 0.001
             eps_s_p = 0.002 * (x - d_p) / x if x > d_p else -0.001
             
-            sigma_amm_acc = self.acciaio.tensione_ammissibile or 140.0
-            sigma_s = min(eps_s * self.acciaio.modulo_elastico, sigma_amm_acc)
-            sigma_s_p = min(abs(eps_s_p) * self.acciaio.modulo_elastico, sigma_amm_acc)
+            sigma_s = min(eps_s * Es, sigma_amm_acc)
+            sigma_s_p = min(abs(eps_s_p) * Es, sigma_amm_acc)
             sigma_s_p = -sigma_s_p if eps_s_p < 0 else sigma_s_p
             
             Fs = As * sigma_s
             Fs_p = As_p * sigma_s_p
             
-            # Equilibrio traslazione
+            # Equilibrio traslazione (l'aggiornamento di x usa solo questo)
             R = Fc + Fs_p - Fs + N
             
-            # Equilibrio rotazione rispetto baricentro
-            M_eq = Fc * (yc - prop.y_baricentro) + \
-                   Fs * (d - prop.y_baricentro) - \
-                   Fs_p * (d_p - prop.y_baricentro)
-            
             # Convergenza
             if abs(R) < 100:  # N
                 break
             
             # Aggiornamento
-            dx = -R / (dim.get('b', 300.0))
+            dx = -R / b
             x += dx * 0.5  # Damping
             x = max(10.0, min(x, h - 10.0))
         
         return x
     
+    def _dati_kernel_asse_neutro(self, prop: ProprietaGeometriche, d: float,
+                                 d_p: float, As: float, As_p: float) -> tuple:
+        """Argomenti di _itera_asse_neutro che non dipendono dai carichi."""
+        dim = self._get_dim_cached()
+        h = dim.get('h', dim.get('altezza', 500.0))
+        tipo, g1, g2, g3 = self._parametri_cls_compressa()
+        return (
+            tipo, g1, g2, g3, float(prop.y_baricentro), float(h),
+            float(dim.get('b', 300.0)), float(d), float(d_p), float(As), float(As_p),
+            float(self.calcestruzzo.tensione_ammissibile_compressione),
+            float(self.acciaio.tensione_ammissibile or 140.0),
+            float(self.acciaio.modulo_elastico),
+        )
+    
+    def _parametri_cls_compressa(self) -> Tuple[int, float, float, float]:
+        """
+        Legge di compressione per il calcolo compilato dell'asse neutro.
+        
+        Le sottoclassi che ridefiniscono _calcola_risultante_cls_compressa
+        ridefiniscono anche questo metodo (vedi _forza_cls_compressa).
+        
+        Returns:
+            (tipo, g1, g2, g3): codice della legge e dimensioni [mm]
+        """
+        dim = self._get_dim_cached()
+        b = dim.get('b', dim.get('base', 300.0))
+        return _CLS_RETTANGOLARE, float(b), 0.0, 0.0
+    
     def _calcola_risultante_cls_compressa(self, x: float) -> Tuple[float, float]:
         """
         Calcola risultante compressione nel calcestruzzo.
@@ -479,7 +851,7 @@ class SezioneBase(ABC):
             (Forza risultante [N], Posizione baricentro forza [mm])
         """
         # Semplificazione: distribuzione rettangolare
-        dim = self.get_dimensioni_principali()
+        dim = self._get_dim_cached()
         b = dim.get('b', dim.get('base', 300.0))
         
         # Area compressa (approssimazione)
@@ -503,30 +875,30 @@ class SezioneBase(ABC):
             Testo tooltip
         """
         x, y = punto
-        prop = self.calcola_proprieta_geometriche()
+        prop = self._get_prop_cached()
         
         info = [
             f"Posizione: ({x:.0f}, {y:.0f}) mm",
             f"Distanza da baricentro: {abs(y - prop.y_baricentro):.1f} mm",
         ]
         
-        # Verifica armature
-        for i, barra in enumerate(self.barre_inferiori):
-            dist = ((x - barra.x_pos)**2 + (y - barra.y_pos)**2)**0.5
-            if dist < barra.diametro:
-                info.append(f"Barra inf. {i+1}: ⌀{barra.diametro} ({barra.n_barre}×)")
-        
-        for i, barra in enumerate(self.barre_superiori):
-            dist = ((x - barra.x_pos)**2 + (y - barra.y_pos)**2)**0.5
-            if dist < barra.diametro:
-                info.append(f"Barra sup. {i+1}: ⌀{barra.diametro} ({barra.n_barre}×)")
+        # Verifica armature: distanze di tutte le barre del lembo in una volta
+        for lato, etichetta in (('inf', 'inf.'), ('sup', 'sup.')):
+            armatura = self._armatura(lato)
+            vicine = np.flatnonzero(
+                np.hypot(armatura['x'] - x, armatura['y'] - y) < armatura['d']
+            )
+            barre = getattr(self, _LISTE_BARRE[lato])
+            for i in vicine.tolist():
+                barra = barre[i]
+                info.append(f"Barra {etichetta} {i+1}: ⌀{barra.diametro} ({barra.n_barre}×)")
         
         return "\n".join(info)
     
     def __str__(self) -> str:
         """Rappresentazione testuale della sezione."""
-        prop = self.calcola_proprieta_geometriche()
-        dim = self.get_dimensioni_principali()
+        prop = self._get_prop_cached()
+        dim = self._get_dim_cached()
         
         info = [
             f"{self.__class__.__name__}",
@@ -1,8 +1,40 @@
 """Sezioni circolari (piene e cave) per pilastri in calcestruzzo armato."""
 
+import math
+from functools import lru_cache
 from typing import List, Tuple, Dict
 import numpy as np
-from .sezione_base import SezioneBase, ProprietaGeometriche
+from .sezione_base import (
+    SezioneBase,
+    ProprietaGeometriche,
+    _CLS_CIRCOLARE,
+    _CLS_CIRCOLARE_CAVA,
+    _segmento_circolare,
+)
+
+
+# Numero di punti predefinito del contorno circolare
+N_PUNTI_CONTORNO = 64
+
+
+@lru_cache(maxsize=None)
+def _circonferenza_unitaria(n_punti: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Coseni e seni di n_punti angoli equispaziati in [0, 2π].
+    
+    Memorizzati per n_punti e condivisi da tutte le sezioni:
+    gli array sono in sola lettura.
+    """
+    theta = np.linspace(0, 2*np.pi, n_punti)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    cos_t.flags.writeable = False
+    sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+
+# Griglia predefinita calcolata all'import
+_circonferenza_unitaria(N_PUNTI_CONTORNO)
 
 
 class SezioneCircolare(SezioneBase):
@@ -16,6 +48,8 @@ class SezioneCircolare(SezioneBase):
         \\___/
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"D"})
+    
     def __init__(self, D: float, calcestruzzo, acciaio, copriferro: float = 30.0):
         """
         Inizializza sezione circolare.
@@ -40,13 +74,13 @@ class SezioneCircolare(SezioneBase):
     def calcola_proprieta_geometriche(self) -> ProprietaGeometriche:
         """Calcola proprietà geometriche della sezione circolare."""
         # Area
-        A = np.pi * (self.D / 2)**2
+        A = math.pi * (self.D / 2)**2
         
         # Baricentro
         y_G = self.D / 2
         
         # Momento d'inerzia
-        I = np.pi * self.D**4 / 64
+        I = math.pi * self.D**4 / 64
         
         # Modulo resistenza
         W = I / (self.D / 2)
@@ -60,14 +94,19 @@ class SezioneCircolare(SezioneBase):
             modulo_resistenza_inf=W
         )
     
-    def get_contorno(self) -> List[Tuple[float, float]]:
+    def get_contorno(self, n_punti: int = N_PUNTI_CONTORNO) -> List[Tuple[float, float]]:
         """Restituisce punti del contorno."""
-        n_punti = 64
-        theta = np.linspace(0, 2*np.pi, n_punti)
+        cos_t, sin_t = _circonferenza_unitaria(n_punti)
         r = self.D / 2
         y_center = self.D / 2
         
-        return [(r * np.cos(t), y_center + r * np.sin(t)) for t in theta]
+        xs = r * cos_t
+        ys = y_center + r * sin_t
+        return list(zip(xs.tolist(), ys.tolist()))
+    
+    def _parametri_cls_compressa(self) -> Tuple[int, float, float, float]:
+        """Legge di compressione circolare per il calcolo compilato dell'asse neutro."""
+        return _CLS_CIRCOLARE, float(self.D), 0.0, 0.0
     
     def _calcola_risultante_cls_compressa(self, x: float) -> Tuple[float, float]:
         """Calcola risultante compressione in sezione circolare."""
@@ -77,7 +116,7 @@ class SezioneCircolare(SezioneBase):
         sigma_amm = self.calcestruzzo.tensione_ammissibile_compressione
         if x >= self.D:
             # Tutta compressa
-            A_compr = np.pi * r**2
+            A_compr = math.pi * r**2
             Fc = A_compr * sigma_amm
             yc = y_center
         elif x <= 0:
@@ -85,19 +124,19 @@ class SezioneCircolare(SezioneBase):
             Fc = 0.0
             yc = 0.0
         else:
-            # Parzialmente compressa - approssimazione
-            # Area segmento circolare
+            # Parzialmente compressa
+            # Segmento circolare di freccia h_segm (compresso se x < r,
+            # altrimenti teso e sottratto al cerchio)
             h_segm = x if x < y_center else self.D - x
-            theta = 2 * np.arccos((r - h_segm) / r) if h_segm < r else np.pi
-            A_segm = r**2 * (theta - np.sin(theta)) / 2
-            
-            A_compr = A_segm if x < y_center else np.pi * r**2 - A_segm
+            A_segm, e_segm = _segmento_circolare(r, h_segm)
             
-            # Baricentro segmento (approssimazione)
             if x < y_center:
-                yc = x / 2
+                A_compr = A_segm
+                # Limitato a [0, x] contro la cancellazione per segmenti sottili
+                yc = min(max(y_center - e_segm, 0.0), x)
             else:
-                yc = (y_center + x) / 2
+                A_compr = math.pi * r**2 - A_segm
+                yc = y_center - A_segm * e_segm / A_compr
             
             Fc = A_compr * sigma_amm
         
@@ -115,6 +154,8 @@ class SezioneCircolareCava(SezioneBase):
         \\_____/
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"De", "Di"})
+    
     def __init__(self, De: float, Di: float, calcestruzzo, acciaio, 
                  copriferro: float = 30.0):
         """
@@ -146,16 +187,16 @@ class SezioneCircolareCava(SezioneBase):
     def calcola_proprieta_geometriche(self) -> ProprietaGeometriche:
         """Calcola proprietà geometriche della sezione cava."""
         # Area
-        A_est = np.pi * (self.De / 2)**2
-        A_int = np.pi * (self.Di / 2)**2
+        A_est = math.pi * (self.De / 2)**2
+        A_int = math.pi * (self.Di / 2)**2
         A = A_est - A_int
         
         # Baricentro
         y_G = self.De / 2
         
         # Momento d'inerzia
-        I_est = np.pi * self.De**4 / 64
-        I_int = np.pi * self.Di**4 / 64
+        I_est = math.pi * self.De**4 / 64
+        I_int = math.pi * self.Di**4 / 64
         I = I_est - I_int
         
         # Modulo resistenza
@@ -170,37 +211,48 @@ class SezioneCircolareCava(SezioneBase):
             modulo_resistenza_inf=W
         )
     
-    def get_contorno(self) -> List[Tuple[float, float]]:
+    def get_contorno(self, n_punti: int = N_PUNTI_CONTORNO) -> List[Tuple[float, float]]:
         """Restituisce punti del contorno."""
-        n_punti = 64
-        theta = np.linspace(0, 2*np.pi, n_punti)
+        cos_t, sin_t = _circonferenza_unitaria(n_punti)
         
         r_est = self.De / 2
         r_int = self.Di / 2
         y_center = self.De / 2
         
-        # Contorno esterno
-        ext = [(r_est * np.cos(t), y_center + r_est * np.sin(t)) for t in theta]
-        
-        # Contorno interno (in senso opposto)
-        int_pts = [(r_int * np.cos(t), y_center + r_int * np.sin(t)) 
-                   for t in reversed(theta)]
+        # Contorno esterno e interno (in senso opposto)
+        ext = np.column_stack((r_est * cos_t, y_center + r_est * sin_t))
+        int_pts = np.column_stack((r_int * cos_t, y_center + r_int * sin_t))
         
-        return ext + int_pts
+        punti = np.concatenate((ext, int_pts[::-1]), axis=0)
+        return list(map(tuple, punti.tolist()))
+    
+    def _parametri_cls_compressa(self) -> Tuple[int, float, float, float]:
+        """Legge di compressione della sezione cava per il calcolo compilato dell'asse neutro."""
+        return _CLS_CIRCOLARE_CAVA, float(self.De), float(self.Di), 0.0
     
     def _calcola_risultante_cls_compressa(self, x: float) -> Tuple[float, float]:
         """Calcola risultante compressione in sezione cava."""
-        # Semplificazione: come sezione piena con riduzione area
+        if x <= 0:
+            # Nulla compressa
+            return 0.0, 0.0
+        
         r_est = self.De / 2
         r_int = self.Di / 2
         sigma_amm = self.calcestruzzo.tensione_ammissibile_compressione
         
-        # Calcolo simile a circolare piena, ma sottraendo parte interna
-        A_compr_est = min(np.pi * r_est**2, max(0, np.pi * r_est**2 * x / self.De))
-        A_compr_int = min(np.pi * r_int**2, max(0, np.pi * r_int**2 * x / self.De))
+        # Zona compressa = segmento del cerchio esterno meno il segmento
+        # del foro, che inizia a r_est - r_int dal lembo superiore
+        A_est, e_est = _segmento_circolare(r_est, min(x, self.De))
+        A_compr = A_est
+        momento = A_est * (r_est - e_est)  # rispetto al lembo superiore
+        
+        h_int = min(max(x - (r_est - r_int), 0.0), self.Di)
+        if h_int > 0:
+            A_int, e_int = _segmento_circolare(r_int, h_int)
+            A_compr -= A_int
+            momento -= A_int * (r_est - e_int)
         
-        A_compr = A_compr_est - A_compr_int
         Fc = A_compr * sigma_amm
-        yc = x / 2 if x > 0 else 0
+        yc = momento / A_compr
         
         return Fc, yc
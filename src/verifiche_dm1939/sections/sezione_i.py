@@ -19,6 +19,8 @@ class SezioneI(SezioneBase):
          |<---- bf_inf ---->|
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"bw", "h", "bf_sup", "tf_sup", "bf_inf", "tf_inf"})
+    
     def __init__(self, bw: float, h: float, 
                  bf_sup: float, tf_sup: float,
                  bf_inf: float, tf_inf: float,
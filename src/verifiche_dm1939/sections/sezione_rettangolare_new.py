@@ -4,6 +4,7 @@ Sezione rettangolare aggiornata con nuova architettura.
 Eredita da SezioneBase con tutte le funzionalità avanzate.
 """
 
+import math
 from typing import List, Optional, Tuple, Dict
 import numpy as np
 from .sezione_base import SezioneBase, ProprietaGeometriche, Barra, Staffa
@@ -23,6 +24,8 @@ class SezioneRettangolare(SezioneBase):
     - N- → compressione, N+ → trazione
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"base", "altezza"})
+    
     def __init__(self, base: float, altezza: float,
                  calcestruzzo, acciaio, copriferro: float = 30.0):
         """
@@ -162,8 +165,8 @@ class SezioneRettangolare(SezioneBase):
             if delta < 0:
                 return d / 3  # Fallback
             
-            x1 = (-b_coeff + np.sqrt(delta)) / (2 * a)
-            x2 = (-b_coeff - np.sqrt(delta)) / (2 * a)
+            x1 = (-b_coeff + math.sqrt(delta)) / (2 * a)
+            x2 = (-b_coeff - math.sqrt(delta)) / (2 * a)
             
             x = x1 if 0 < x1 < self.altezza else x2
             return max(10.0, min(x, self.altezza - 10.0))
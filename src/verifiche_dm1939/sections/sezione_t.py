@@ -2,7 +2,7 @@
 
 from typing import List, Tuple, Dict
 import numpy as np
-from .sezione_base import SezioneBase, ProprietaGeometriche
+from .sezione_base import SezioneBase, ProprietaGeometriche, _CLS_T
 
 
 class SezioneT(SezioneBase):
@@ -18,6 +18,8 @@ class SezioneT(SezioneBase):
               -----  ← bw (nervatura)
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"bw", "h", "bf", "tf"})
+    
     def __init__(self, bw: float, h: float, bf: float, tf: float,
                  calcestruzzo, acciaio, copriferro: float = 30.0):
         """
@@ -142,6 +144,10 @@ class SezioneT(SezioneBase):
                 (-self.bf/2, 0)
             ]
     
+    def _parametri_cls_compressa(self) -> Tuple[int, float, float, float]:
+        """Legge di compressione a T per il calcolo compilato dell'asse neutro."""
+        return _CLS_T, float(self.bf), float(self.tf), float(self.bw)
+    
     def _calcola_risultante_cls_compressa(self, x: float) -> Tuple[float, float]:
         """Calcola risultante compressione considerando forma a T."""
         sigma_amm = self.calcestruzzo.tensione_ammissibile_compressione
@@ -20,6 +20,8 @@ class SezioneL(SezioneBase):
               ↑ t2
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"b1", "t1", "h", "b2", "t2"})
+    
     def __init__(self, b1: float, t1: float, h: float, b2: float, t2: float,
                  calcestruzzo, acciaio, copriferro: float = 30.0):
         """
@@ -129,6 +131,8 @@ class SezioneU(SezioneBase):
          ---------------  ← tf
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"b", "h", "tf", "tw"})
+    
     def __init__(self, b: float, h: float, tf: float, tw: float,
                  calcestruzzo, acciaio, copriferro: float = 30.0):
         """
@@ -240,6 +244,8 @@ class SezioneRettangolareCava(SezioneBase):
          |<---- b ---->|
     """
     
+    _ATTRIBUTI_GEOMETRIA = frozenset({"b", "h", "tw", "ts", "ti"})
+    
     def __init__(self, b: float, h: float, tw: float, ts: float, ti: float,
                  calcestruzzo, acciaio, copriferro: float = 30.0):
         """
@@ -0,0 +1,47 @@
+"""
+Test proprietà acciaio da armatura.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.materials.acciaio import Acciaio
+
+
+def test_da_tipo_riusa_le_istanze():
+    """Gli acciai tipici sono costruiti una volta per (tipo, calcola_auto)."""
+    feb32 = Acciaio.da_tipo("FeB32k")
+    assert feb32 is Acciaio.da_tipo("FeB32k")
+    assert feb32 is not Acciaio.da_tipo("FeB32k", calcola_auto=False)
+    assert abs(feb32.tensione_ammissibile - 320.0 / 2.3) < 1e-9
+
+
+def test_acciaio_immutabile():
+    """Acciaio è frozen: hashable e non modificabile dopo la costruzione."""
+    feb38 = Acciaio.da_tipo("FeB38k")
+    assert {feb38: "ok"}[Acciaio(tipo="FeB38k", tensione_snervamento=375.0,
+                                 aderenza_migliorata=True)] == "ok"
+    try:
+        feb38.tensione_ammissibile = 0.0
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("Acciaio deve essere immutabile")
+
+
+def test_ancoraggio_batch_coerente_con_scalare():
+    """Le versioni vettoriali danno gli stessi valori di quelle scalari."""
+    diametri = np.array([6, 8, 12, 16, 20, 22, 26, 32], dtype=float)
+    for tipo in ("FeB32k", "FeB44k"):
+        acciaio = Acciaio.da_tipo(tipo)
+        assert acciaio.tensione_aderenza_ammissibile_batch(diametri).tolist() == [
+            acciaio.tensione_aderenza_ammissibile(d) for d in diametri
+        ]
+        assert acciaio.lunghezza_ancoraggio_base_batch(diametri).tolist() == [
+            acciaio.lunghezza_ancoraggio_base(d) for d in diametri
+        ]
@@ -0,0 +1,92 @@
+"""
+Test proprietà calcestruzzo.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.materials.calcestruzzo import CALCESTRUZZI_TIPICI, Calcestruzzo
+
+
+def test_calcestruzzi_tipici_coerenti_con_costruttore():
+    """I parametri precalcolati coincidono con quelli calcolati dal costruttore."""
+    assert list(CALCESTRUZZI_TIPICI) == ["Rck10", "Rck15", "Rck20", "Rck25", "Rck30"]
+    for classe, calcestruzzo in CALCESTRUZZI_TIPICI.items():
+        atteso = Calcestruzzo(resistenza_caratteristica=float(classe[3:]))
+        assert calcestruzzo.to_dict() == atteso.to_dict()
+
+
+def test_da_array_coerente_con_scalare():
+    """I parametri per array coincidono con quelli dei singoli oggetti."""
+    rck = [12.5, 20.0, 35.0]
+    for storica, tipo_cemento in ((False, "normale"), (True, "normale"), (True, "alta_resistenza")):
+        parametri = Calcestruzzo.da_array(np.array(rck), da_tabella_storica=storica, tipo_cemento=tipo_cemento)
+        for i, r in enumerate(rck):
+            atteso = Calcestruzzo(r, da_tabella_storica=storica, tipo_cemento=tipo_cemento).to_dict()
+            assert {chiave: valori[i] for chiave, valori in parametri.items()} == atteso
+
+    # Default come il costruttore: Calcestruzzo(r) usa le formule storiche
+    parametri = Calcestruzzo.da_array(np.array(rck))
+    for i, r in enumerate(rck):
+        assert {chiave: valori[i] for chiave, valori in parametri.items()} == Calcestruzzo(r).to_dict()
+
+    with pytest.raises(ValueError):
+        Calcestruzzo.da_array(np.array([20.0, 0.0]))
+
+
+def test_coefficiente_riduzione_taglio_batch_coerente_con_scalare():
+    """La versione vettoriale dà gli stessi coefficienti di quella scalare."""
+    calcestruzzo = CALCESTRUZZI_TIPICI["Rck20"]
+    percentuali = np.linspace(0.0, 2.5, 26)
+
+    coefficienti = calcestruzzo.coefficiente_riduzione_taglio_batch(percentuali)
+
+    assert coefficienti.tolist() == [calcestruzzo.coefficiente_riduzione_taglio(p) for p in percentuali]
+
+
+def test_tensione_flessione_definita_alla_creazione():
+    """Senza σc,amm l'oggetto non è creato; altrimenti la flessione usa σc,amm."""
+    with pytest.raises(ValueError, match="non definita"):
+        Calcestruzzo(20.0, calcola_auto=False, coefficiente_omogeneizzazione=10.0)
+
+    calcestruzzo = Calcestruzzo(
+        20.0, calcola_auto=False,
+        tensione_ammissibile_compressione=6.0, coefficiente_omogeneizzazione=10.0,
+    )
+    assert calcestruzzo.tensione_ammissibile_flessione() == 6.0
+
+
+def test_da_classe():
+    """La classe è letta con o senza prefisso Rck; le altre sigle sono rifiutate."""
+    assert Calcestruzzo.da_classe("Rck25").resistenza_caratteristica == 25.0
+    assert Calcestruzzo.da_classe("RCK 12.5").resistenza_caratteristica == 12.5
+    assert Calcestruzzo.da_classe("20").resistenza_caratteristica == 20.0
+
+    with pytest.raises(ValueError, match="C25/30"):
+        Calcestruzzo.da_classe("C25/30")
+
+
+def test_da_classe_riusa_le_istanze():
+    """Le istanze per classe sono memoizzate: immutabili e condivisibili."""
+    rck25 = Calcestruzzo.da_classe("Rck25")
+    assert rck25 is Calcestruzzo.da_classe("Rck25")
+    assert {rck25: True}[Calcestruzzo(25.0)]
+
+    with pytest.raises(AttributeError):
+        rck25.modulo_elastico = 1.0
+
+
+def test_grandezze_derivate_precalcolate():
+    """εc,amm e n·σc,amm sono calcolate alla creazione dai parametri dell'oggetto."""
+    calcestruzzo = CALCESTRUZZI_TIPICI["Rck25"]
+    sigma_c = calcestruzzo.tensione_ammissibile_compressione
+
+    assert calcestruzzo.deformazione_ammissibile == sigma_c / calcestruzzo.modulo_elastico
+    assert calcestruzzo.tensione_omogeneizzata == calcestruzzo.coefficiente_omogeneizzazione * sigma_c
+    assert "_tensione_omogeneizzata" not in calcestruzzo.to_dict()
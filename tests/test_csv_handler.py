@@ -0,0 +1,182 @@
+"""
+Test import/export CSV delle sezioni.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.io_handlers.csv_handler import CSVHandler, _componi_record
+
+
+def test_importa_sezioni_template_trave(tmp_path):
+    """Il template trave viene reimportato con i tipi attesi per ogni campo."""
+    filepath = tmp_path / "trave.csv"
+    CSVHandler.genera_template_csv(filepath, "trave")
+
+    sezioni = CSVHandler.importa_sezioni(filepath)
+
+    assert len(sezioni) == 1
+    sezione = sezioni[0]
+    assert list(sezione)[:5] == ["base", "altezza", "copriferro", "rck", "tipo_acciaio"]
+    assert sezione["base"] == 300.0 and type(sezione["base"]) is float
+    assert sezione["numero_inf"] == 4 and type(sezione["numero_inf"]) is int
+    assert sezione["tipo_acciaio"] == "FeB32k"
+
+
+def test_importa_sezioni_alias_e_alternative(tmp_path):
+    """Intestazioni alternative e campi in alternativa (rck/classe_cls, acciaio/fyk)."""
+    filepath = tmp_path / "alias.csv"
+    filepath.write_text(" B ,H,Mx,classe_cls,fy,tipo\n300,500,80,C20,3800,\n", encoding="utf-8")
+
+    sezioni = CSVHandler.importa_sezioni(filepath)
+
+    assert sezioni == [{
+        "base": 300.0,
+        "altezza": 500.0,
+        "classe_cls": "C20",
+        "fyk": 3800.0,
+        "momento": 80.0,
+        "momento_x": 80.0,
+        "tipo": "nan",
+    }]
+
+
+def test_lettura_diretta_coerente_con_pandas(tmp_path, monkeypatch):
+    """I file piccoli, letti senza DataFrame, danno gli stessi record del percorso pandas."""
+    filepath = tmp_path / "misto.csv"
+    filepath.write_text(
+        "base,numero_inf,classe_cls,tipo_acciaio,foo\n"
+        "300,4,15,FeB32k,x\n"
+        "250.5,3,,NA,y\n",
+        encoding="utf-8",
+    )
+
+    diretto = CSVHandler.importa_sezioni(filepath)
+    monkeypatch.setattr(CSVHandler, "SOGLIA_LETTURA_DIRETTA", 0)
+    da_pandas = CSVHandler.importa_sezioni(filepath)
+
+    assert diretto == da_pandas
+    assert diretto[0]["classe_cls"] == "15.0"
+    assert diretto[1]["tipo_acciaio"] == "nan"
+
+
+def test_importa_sezioni_colonne(tmp_path):
+    """Il lotto colonnare contiene gli stessi dati dei record di importa_sezioni."""
+    filepath = tmp_path / "pilastro.csv"
+    CSVHandler.genera_template_csv(filepath, "pilastro")
+
+    lotto = CSVHandler.importa_sezioni_colonne(filepath)
+
+    assert lotto.n_sezioni == 1
+    assert lotto.base.dtype == np.float64 and lotto.numero_inf.dtype == np.int64
+    assert lotto.momento is None
+    assert (lotto.base * lotto.altezza).tolist() == [160000.0]
+    assert list(lotto.iter_righe()) == CSVHandler.importa_sezioni(filepath)
+
+
+def test_matrice_e_tabella_sezioni(tmp_path):
+    """Matrice colonnare (ordine Fortran) e DataFrame con le chiavi standard."""
+    filepath = tmp_path / "trave.csv"
+    CSVHandler.genera_template_csv(filepath, "trave")
+    lotto = CSVHandler.importa_sezioni_colonne(filepath)
+
+    matrice = lotto.matrice(["base", "altezza", "numero_inf"])
+    assert matrice.flags.f_contiguous
+    assert matrice.tolist() == [[300.0, 500.0, 4.0]]
+    assert lotto.matrice().shape == (1, 13)
+
+    tabella = CSVHandler.importa_sezioni_tabella(filepath)
+    assert list(tabella.columns) == lotto.campi_presenti()
+    assert tabella.to_dict(orient="records") == CSVHandler.importa_sezioni(filepath)
+
+
+def test_esporta_risultati_motori(tmp_path):
+    """Con entrambi i motori il CSV esportato si rilegge con gli stessi valori."""
+    risultati = [
+        {"sezione": "T1", "momento": 80.5, "verificato": True},
+        {"sezione": "T2", "momento": 120.0, "verificato": False},
+    ]
+    letture = []
+    for motore in ("pandas", "pyarrow"):
+        filepath = tmp_path / f"risultati_{motore}.csv"
+        CSVHandler.esporta_risultati(risultati, filepath, motore=motore)
+        letture.append(CSVHandler.leggi_csv(filepath).to_dict(orient="records"))
+
+    assert letture[0] == letture[1] == risultati
+
+
+def test_esporta_risultati_per_colonne(tmp_path):
+    """Record eterogenei e risultati già per colonne producono lo stesso file."""
+    record = [{"a": 1, "b": "x"}, {"b": "y", "c": True}]
+    colonne = {"a": [1, None], "b": ["x", "y"], "c": [None, True]}
+
+    CSVHandler.esporta_risultati(record, tmp_path / "record.csv")
+    CSVHandler.esporta_risultati(colonne, tmp_path / "colonne.csv")
+
+    testo = (tmp_path / "record.csv").read_text(encoding="utf-8")
+    assert testo.splitlines() == ["a,b,c", "1.0,x,", ",y,True"]
+    assert (tmp_path / "colonne.csv").read_text(encoding="utf-8") == testo
+
+
+def test_importa_e_crea_sezioni(tmp_path):
+    """Le sezioni create in streaming coincidono con crea_sezione_da_dati sui record."""
+    filepath = tmp_path / "travi.csv"
+    filepath.write_text(
+        "b,h,c,M,phi_st,passo\n"
+        "300,500,30,80,8,200\n"
+        "250,400,25,60,10,150\n",
+        encoding="utf-8",
+    )
+
+    sezioni = CSVHandler.importa_e_crea_sezioni(filepath)
+    assert iter(sezioni) is sezioni
+
+    attese = [CSVHandler.crea_sezione_da_dati(dati) for dati in CSVHandler.importa_sezioni(filepath)]
+    for sezione, attesa in zip(sezioni, attese):
+        assert (sezione.base, sezione.altezza) == (attesa.base, attesa.altezza)
+        assert repr(sezione) == repr(attesa)
+        assert repr(sezione.staffe) == repr(attesa.staffe)
+    assert attese[1].staffe.passo == 150.0
+
+
+def test_componi_record():
+    """Un record per riga con le chiavi nell'ordine dato (anche non identificatori)."""
+    assert _componi_record(["base", "altezza"], [[300.0, 250.0], [500.0, 400.0]], 2) == [
+        {"base": 300.0, "altezza": 500.0},
+        {"base": 250.0, "altezza": 400.0},
+    ]
+    assert _componi_record(["class", "φ 16"], [[1], [2]], 1) == [{"class": 1, "φ 16": 2}]
+    assert _componi_record([], [], 2) == [{}, {}]
+
+
+def test_mappa_colonne_memorizzata(tmp_path):
+    """La mappatura è calcolata una volta per DataFrame e ricalcolata se le colonne cambiano."""
+    filepath = tmp_path / "trave.csv"
+    filepath.write_text("B,H,foo\n300,500,1\n", encoding="utf-8")
+    df = CSVHandler.leggi_csv(filepath)
+
+    mapping = CSVHandler.mappa_colonne(df)
+    mapping["altezza"] = "foo"
+    assert CSVHandler.mappa_colonne(df) == {"base": "B", "altezza": "H"}
+
+    df.columns = ["b", "h", "c"]
+    assert CSVHandler.mappa_colonne(df) == {"base": "b", "altezza": "h", "copriferro": "c"}
+
+
+def test_importa_sezioni_colonne_precisione_ridotta(tmp_path):
+    """Con ridotta=True i campi numerici sono float32/int32, con gli stessi valori."""
+    filepath = tmp_path / "trave.csv"
+    CSVHandler.genera_template_csv(filepath, "trave")
+
+    estesa = CSVHandler.importa_sezioni_colonne(filepath)
+    ridotta = CSVHandler.importa_sezioni_colonne(filepath, ridotta=True)
+
+    assert ridotta.base.dtype == np.float32 and ridotta.numero_inf.dtype == np.int32
+    assert ridotta.tipo_acciaio.tolist() == estesa.tipo_acciaio.tolist()
+    assert ridotta.matrice().tolist() == estesa.matrice().tolist()
+    assert CSVHandler.importa_sezioni_tabella(filepath, ridotta=True)["rck"].dtype == np.float32
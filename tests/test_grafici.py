@@ -0,0 +1,121 @@
+"""
+Test grafici delle verifiche (backend senza interfaccia).
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.reporting.grafici import _LEGENDA_TESA, _PROTO_CONTORNO, GeneratoreGrafici, _calcola_dominio
+
+
+def _sezione(staffe: bool = True) -> SimpleNamespace:
+    """Sezione 300x500 con 4 barre inferiori e 2 superiori (solo gli attributi disegnati)."""
+    def barre(y, diametro, ascisse):
+        return [SimpleNamespace(posizione_x=x, posizione_y=y, diametro=diametro) for x in ascisse]
+
+    return SimpleNamespace(
+        base=300.0, altezza=500.0, copriferro=30.0, altezza_utile=455.0,
+        barre_inferiori=barre(45.0, 16.0, (-100, -33, 33, 100)),
+        barre_superiori=barre(455.0, 12.0, (-100, 100)),
+        staffe=SimpleNamespace(diametro=8, passo=200) if staffe else None,
+    )
+
+
+def test_disegna_sezione_barre_in_collezioni():
+    """Le barre sono disegnate con una collezione per gruppo, centrate sulle posizioni."""
+    fig = GeneratoreGrafici.disegna_sezione(_sezione(), asse_neutro=150.0)
+    ax = fig.axes[0]
+
+    inferiori, superiori = ax.collections
+    assert len(inferiori.get_paths()) == 4 and len(superiori.get_paths()) == 2
+    centro = inferiori.get_paths()[0].vertices.mean(axis=0)
+    assert abs(centro[0] + 100) < 1e-9 and abs(centro[1] - 45) < 1.0
+    assert [t.get_text() for t in ax.get_legend().get_texts()][-1] == "Staffe φ8/200"
+
+
+def test_dominio_momento_sforzo_normale_estremi():
+    """Il dominio parte dalla trazione pura e termina nella compressione centrata."""
+    fig = GeneratoreGrafici.dominio_momento_sforzo_normale(
+        300.0, 500.0, 804.0, 402.0, 6.0, 140.0, n_punti=20,
+    )
+    linea = fig.axes[0].get_lines()[0]
+    momenti, sforzi = linea.get_xdata(), linea.get_ydata()
+
+    assert len(momenti) == len(sforzi) == 22
+    assert momenti[0] == momenti[-1] == 0
+    assert sforzi[0] == -140.0 * 1206.0 / 1000
+    assert sforzi[-1] == (6.0 * 300.0 * 500.0 + 140.0 * 1206.0) / 1000
+    x = 500.0 * 0.1 / 3
+    assert abs(sforzi[1] - (6.0 * 300.0 * x - 140.0 * 804.0) / 1000) < 1e-9
+
+
+def test_calcola_dominio_memorizzato():
+    """La spezzata del dominio è calcolata una volta per insieme di parametri."""
+    parametri = (300.0, 500.0, 804.0, 402.0, 6.0, 140.0, 30.0, 20)
+    momenti, sforzi = _calcola_dominio(*parametri)
+
+    assert _calcola_dominio(*parametri)[0] is momenti
+    assert momenti.shape == sforzi.shape == (22,) and not momenti.flags.writeable
+    fig = GeneratoreGrafici.dominio_momento_sforzo_normale(*parametri)
+    assert fig.axes[0].get_lines()[0].get_ydata().tolist() == sforzi.tolist()
+
+
+def test_disegna_sezione_png_memorizzata():
+    """Il PNG è prodotto una volta per geometria; cambia se cambia il disegno."""
+    png = GeneratoreGrafici.disegna_sezione_png(_sezione(), asse_neutro=150.0, dpi=50)
+
+    assert png.startswith(b"\x89PNG")
+    assert GeneratoreGrafici.disegna_sezione_png(_sezione(), asse_neutro=150.0, dpi=50) is png
+    assert GeneratoreGrafici.disegna_sezione_png(_sezione(staffe=False), asse_neutro=150.0, dpi=50) != png
+
+
+def test_figure_fuori_da_pyplot_e_stile_locale():
+    """Le figure non sono registrate in pyplot e lo stile non altera i parametri globali."""
+    dimensione_font = matplotlib.rcParams["font.size"]
+    generatore = GeneratoreGrafici()
+    fig = generatore.disegna_sezione(_sezione())
+
+    assert matplotlib.rcParams["font.size"] == dimensione_font
+    assert fig.axes[0].get_legend().get_texts()[0].get_fontsize() == GeneratoreGrafici.STYLE_CONFIG["legend.fontsize"]
+    assert fig not in map(plt.figure, plt.get_fignums())
+
+
+def test_prototipi_non_modificati():
+    """I contorni sono copie del prototipo, che resta fuori dai grafici e invariato."""
+    primo = GeneratoreGrafici.disegna_sezione(_sezione()).axes[0].patches[0]
+    secondo = GeneratoreGrafici.disegna_sezione(_sezione(staffe=False)).axes[0].patches[0]
+
+    assert primo is not secondo and primo.axes is not secondo.axes
+    assert primo.get_bbox().bounds == (-150.0, 0.0, 300.0, 500.0)
+    assert _PROTO_CONTORNO.axes is None
+    assert _PROTO_CONTORNO.get_bbox().bounds == (0.0, 0.0, 1.0, 1.0)
+
+
+def test_salva_grafico_rasterizza_solo_vettoriali(tmp_path):
+    """Con rasterizza=True le barre finiscono nell'SVG come immagine; il PNG resta uguale."""
+    for rasterizza in (False, True):
+        fig = GeneratoreGrafici.disegna_sezione(_sezione())
+        GeneratoreGrafici.salva_grafico(fig, tmp_path / f"sezione_{rasterizza}.svg", dpi=50, rasterizza=rasterizza)
+        GeneratoreGrafici.salva_grafico(fig, tmp_path / f"sezione_{rasterizza}.png", dpi=50, rasterizza=rasterizza)
+
+    assert "<image" not in (tmp_path / "sezione_False.svg").read_text()
+    assert "<image" in (tmp_path / "sezione_True.svg").read_text()
+    assert (tmp_path / "sezione_False.png").read_bytes() == (tmp_path / "sezione_True.png").read_bytes()
+
+
+def test_voci_legenda_condivise():
+    """Le voci fisse della legenda sono condivise; ogni legenda ne disegna copie proprie."""
+    legende = [GeneratoreGrafici.disegna_sezione(_sezione()).axes[0].get_legend() for _ in range(2)]
+
+    primi, secondi = (legenda.legend_handles[0] for legenda in legende)
+    assert primi is not secondi and _LEGENDA_TESA not in (primi, secondi)
+    assert primi.get_markerfacecolor() == _LEGENDA_TESA.get_markerfacecolor() == "red"
+    assert _LEGENDA_TESA.axes is None
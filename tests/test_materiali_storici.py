@@ -0,0 +1,122 @@
+"""
+Test tabelle materiali storici completi RD 2229/1939.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.core.materiali_storici_completi import (
+    ACCIAI_COMPLETI,
+    ACCIAI_COLONNE,
+    CALCESTRUZZI_COMPLETI,
+    CodiceAvviso,
+    elenca_acciai_dict,
+    elenca_calcestruzzi_dict,
+    format_avvisi,
+    get_acciaio,
+    valida_acciaio,
+    valida_acciai_batch,
+    valida_calcestruzzo,
+    valida_calcestruzzi_batch,
+)
+
+
+def test_colonne_acciai_allineate_alla_tabella():
+    """Le colonne dell'archivio acciai seguono l'ordine di ACCIAI_COMPLETI."""
+    assert ACCIAI_COLONNE['sigla'] == [a.sigla for a in ACCIAI_COMPLETI]
+    assert ACCIAI_COLONNE['sigma_y_kgcm2'].tolist() == [a.sigma_y_kgcm2 for a in ACCIAI_COMPLETI]
+
+
+def test_acciaio_immutabile_e_hashable():
+    """AcciaioCompleto è frozen: hashable e convertibile in dizionario."""
+    aq70 = get_acciaio("Aq70")
+    assert aq70 is get_acciaio("Aq70")
+    assert {aq70: True}[aq70]
+    assert aq70.to_dict()['sigma_y_kgcm2'] == 700
+    assert get_acciaio("inesistente") is None
+
+
+def test_elenca_acciai_dict():
+    """Elenco acciai come dizionari per la tabella comparativa."""
+    acciai = elenca_acciai_dict()
+    assert len(acciai) == len(ACCIAI_COMPLETI)
+
+    feb32 = acciai[0]
+    assert feb32['tipo_mat'] == 'acciaio'
+    assert feb32['tipo'] == "FeB32k"
+    assert feb32['sigma_y_kgcm2'] == 1400
+    assert feb32['sigma_ammissibile_kgcm2'] == 609
+    assert feb32['aderenza_migliorata'] is False
+
+
+def test_elenca_calcestruzzi_dict_restituisce_copie():
+    """Gli elenchi sono copie: modificarli non altera le chiamate successive."""
+    calcestruzzi = elenca_calcestruzzi_dict()
+    assert len(calcestruzzi) == len(CALCESTRUZZI_COMPLETI)
+    assert calcestruzzi[3]['sigma_c_ammissibile_kgcm2'] == CALCESTRUZZI_COMPLETI[3].sigma_c_inflessa_kgcm2
+
+    calcestruzzi[0]['nome'] = "modificato"
+    assert elenca_calcestruzzi_dict()[0]['nome'] == CALCESTRUZZI_COMPLETI[0].nome
+
+
+def test_validazione_batch_coerente_con_scalare():
+    """La validazione vettoriale dà gli stessi esiti di quella per singolo materiale."""
+    parametri_cls = [
+        (c.sigma_c_kgcm2, c.sigma_c_inflessa_kgcm2, c.tau_ammissibile_kgcm2,
+         c.modulo_elastico_kgcm2, c.coefficiente_omogeneo)
+        for c in CALCESTRUZZI_COMPLETI
+    ] + [(50, 0, 1, 100000, 9)]
+    validi, esiti = valida_calcestruzzi_batch(*zip(*parametri_cls))
+    for parametri, valido, esito in zip(parametri_cls, validi, esiti):
+        è_valido, avvisi = valida_calcestruzzo(*parametri)
+        assert valido == è_valido
+        assert (esito != 0).sum() == len(avvisi)
+
+    parametri_acc = [
+        (a.sigma_y_kgcm2, a.sigma_ammissibile_traczione_kgcm2, a.modulo_elastico_kgcm2)
+        for a in ACCIAI_COMPLETI
+    ] + [(0, 100, 150000)]
+    validi, esiti = valida_acciai_batch(*zip(*parametri_acc))
+    for parametri, valido, esito in zip(parametri_acc, validi, esiti):
+        è_valido, avvisi = valida_acciaio(*parametri)
+        assert valido == è_valido
+        assert (esito != 0).sum() == len(avvisi)
+
+
+def test_avvisi_codificati_formattati_su_richiesta():
+    """Con formatta=False gli avvisi sono codici; format_avvisi dà lo stesso testo."""
+    è_valido, codificati = valida_acciaio(200, 150, 150000, formatta=False)
+    assert [codice for codice, _ in codificati] == [
+        CodiceAvviso.ACC_RAPPORTO_ALTO,
+        CodiceAvviso.ACC_ES_ANOMALO,
+        CodiceAvviso.ACC_SIGMA_FUORI_RANGE,
+    ]
+    assert format_avvisi(codificati) == valida_acciaio(200, 150, 150000)[1]
+    assert valida_acciaio(200, 150, 150000)[1][0].startswith("⚠ Carico ammissibile alto: 75.0%")
+
+
+def test_import_e_validazione_senza_numba():
+    """Importare il pacchetto e validare un calcestruzzo non carica numba."""
+    codice = (
+        "import sys; sys.path.insert(0, {src!r}); "
+        "import verifiche_dm1939; "
+        "from verifiche_dm1939.core.materiali_storici_completi import valida_calcestruzzo; "
+        "valida_calcestruzzo(160.0, 50.0, 4.0, 250000.0, 8.0); "
+        "print('numba' in sys.modules)"
+    ).format(src=str(Path(__file__).parent.parent / "src"))
+    esito = subprocess.run([sys.executable, "-c", codice], capture_output=True, text=True, check=True)
+
+    assert esito.stdout.strip() == "False"
+
+
+def test_dizionari_malta_costruiti_una_volta():
+    """I dizionari storici della Tabella III sono lo stesso oggetto a ogni accesso."""
+    from verifiche_dm1939.core import tabella_malta
+
+    assert tabella_malta.MALTA_PER_RAPPORTO is tabella_malta.MALTA_PER_RAPPORTO
+    assert tabella_malta.MALTA_PER_RAPPORTO_NUMERICO is tabella_malta.MALTA_PER_RAPPORTO_NUMERICO
+    assert tabella_malta.MALTA_PER_RAPPORTO["1:3.70"] is tabella_malta.MALTA_PER_RAPPORTO_NUMERICO[3.70]
@@ -0,0 +1,148 @@
+"""
+Test generazione report HTML/Markdown e JSON.
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.reporting import report_generator
+from verifiche_dm1939.reporting.report_generator import GeneratoreReport
+
+
+def test_template_compilati_una_volta():
+    """Le istanze condividono i template compilati; le sottoclassi usano i propri."""
+    class ReportBreve(GeneratoreReport):
+        TEMPLATE_MARKDOWN = "# {{ titolo }}\n{{ contenuto }}"
+
+    primo, secondo, breve = GeneratoreReport(), GeneratoreReport(), ReportBreve()
+
+    assert primo.template_html is secondo.template_html
+    assert breve.template_html is primo.template_html
+    assert breve.template_markdown.render(titolo="T", contenuto="c") == "# T\nc"
+
+
+def _verifica_taglio(staffe: bool) -> dict:
+    """Risultato di una verifica a taglio con i soli attributi usati nel report."""
+    sezione = SimpleNamespace(
+        staffe=SimpleNamespace(diametro=8, passo=200.0, numero_bracci=2, area_totale=100.53) if staffe else None,
+        ferri_piegati=None,
+    )
+    risultato = SimpleNamespace(
+        verificato=staffe, taglio_resistente=45.2, contributo_calcestruzzo=20.1,
+        contributo_staffe=25.1, contributo_ferri_piegati=0.0, coefficiente_sicurezza=0.9,
+        rapporto_sfruttamento=1.1, tensione_tangenziale=0.41,
+    )
+    materiali = {"calcestruzzo": {"tensione_ammissibile_taglio": 0.4}}
+    return {"tipo": "taglio", "risultato": risultato, "sezione": sezione,
+            "materiali": materiali, "sollecitazioni": {"taglio": 50.0}}
+
+
+def test_report_taglio_e_completo(tmp_path):
+    """Il corpo della verifica segue la presenza delle staffe e finisce con un a capo."""
+    generatore = GeneratoreReport()
+    con_staffe, senza_staffe = _verifica_taglio(True), _verifica_taglio(False)
+
+    html = generatore.genera_report_verifica_taglio(
+        con_staffe["risultato"], con_staffe["sezione"], con_staffe["materiali"], con_staffe["sollecitazioni"],
+    )
+    assert '<span class="verificato">VERIFICATA ✓</span>' in html
+    assert "<li>Passo: 200.0 mm</li>" in html and "<li>Area totale: 100.5 mm²</li>" in html
+    assert "</ul>\n<p>Nessun ferro piegato definito</p>\n    <h3>Tensione Tangenziale</h3>" in html
+    assert html.endswith("</div>\n")
+
+    filepath = tmp_path / "report.html"
+    generatore.genera_report_completo([con_staffe, senza_staffe], filepath)
+    testo = filepath.read_text(encoding="utf-8")
+    assert testo.index("<h2>Verifica 1: TAGLIO</h2>") < testo.index("<h2>Verifica 2: TAGLIO</h2>")
+    assert testo.count("<p>Nessuna staffa definita</p>") == 1
+
+
+def test_esporta_json_con_e_senza_orjson(tmp_path, monkeypatch):
+    """Il JSON esportato è equivalente con orjson e con il modulo json; inf, NaN e tipi numpy ripiegano su json."""
+    casi = {
+        "semplice": {"sezione": "T1 – già", "momento": 80.5, "esiti": [True, None], "n": {"x": 1}},
+        "esponenti": {"epsilon": 1e-05, "grande": 1e20, "valori": [2.5e-7, 3.0]},
+        "non_finiti": {"coefficiente_sicurezza": float("inf"), "tau": float("nan"), "valori": [1.0, -float("inf")]},
+        "numpy": {"sigma": np.float64(1.5), "valori": [np.float64(2.0)]},
+        "interi_enormi": {"grande": 2**70},
+    }
+
+    def esporta(cartella):
+        cartella.mkdir()
+        for nome, dati in casi.items():
+            GeneratoreReport.esporta_json(dati, cartella / f"{nome}.json")
+        with pytest.raises(TypeError):
+            GeneratoreReport.esporta_json({"array": np.arange(3.0)}, cartella / "array.json")
+        return {nome: (cartella / f"{nome}.json").read_text(encoding="utf-8") for nome in casi}
+
+    veloce = esporta(tmp_path / "veloce")
+    monkeypatch.setattr(report_generator, "orjson", None)
+    standard = esporta(tmp_path / "standard")
+
+    for nome, testo in veloce.items():
+        assert json.dumps(json.loads(testo)) == json.dumps(json.loads(standard[nome]))
+    # Con inf/NaN o tipi numpy si usa in ogni caso il modulo json: file identici
+    assert veloce["non_finiti"] == standard["non_finiti"]
+    assert veloce["numpy"] == standard["numpy"]
+    assert "Infinity" in veloce["non_finiti"] and "NaN" in veloce["non_finiti"] and "null" not in veloce["non_finiti"]
+    assert json.loads(veloce["interi_enormi"]) == {"grande": 2**70}
+
+
+def test_contiene_non_finiti():
+    """Valori infiniti o NaN riconosciuti anche in dizionari, liste e tuple annidati."""
+    assert not report_generator._contiene_non_finiti({"a": [1.0, 2, "x", None], "b": (0.5,)})
+    assert report_generator._contiene_non_finiti({"a": {"b": (1.0, float("nan"))}})
+    assert report_generator._contiene_non_finiti([np.float64(1.0), [np.float64(np.inf)]])
+
+
+def test_report_completo_riusa_il_render(tmp_path, monkeypatch):
+    """Lo stesso report rigenerato non ripassa dal template; un titolo diverso sì."""
+    class DataFissa(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 1, 1, 12, 0)
+
+    monkeypatch.setattr(report_generator, "datetime", DataFissa)
+    generatore = GeneratoreReport()
+    report_generator._render_report.cache_clear()
+    risultati = [_verifica_taglio(True)]
+
+    generatore.genera_report_completo(risultati, tmp_path / "a.html")
+    generatore.genera_report_completo(risultati, tmp_path / "b.html")
+    generatore.genera_report_completo(risultati, tmp_path / "c.html", titolo="Altro")
+
+    informazioni = report_generator._render_report.cache_info()
+    assert (informazioni.hits, informazioni.misses) == (1, 2)
+    assert (tmp_path / "a.html").read_text(encoding="utf-8") == (tmp_path / "b.html").read_text(encoding="utf-8")
+
+
+def test_report_markdown_senza_tag_tabella(tmp_path):
+    """Nel Markdown i tag <table> e </table> diventano a capo; il resto dell'HTML resta."""
+    filepath = tmp_path / "report.md"
+    GeneratoreReport().genera_report_completo([_verifica_taglio(True)], filepath, formato="markdown")
+    testo = filepath.read_text(encoding="utf-8")
+
+    assert "table>" not in testo
+    assert "<h3>Sollecitazioni e Resistenze</h3>\n    \n\n        <tr>" in testo
+
+
+def test_import_senza_jinja_ne_matplotlib():
+    """Importare il generatore di report o la CLI non carica jinja2 né matplotlib."""
+    codice = (
+        "import sys; sys.path.insert(0, {src!r}); "
+        "import verifiche_dm1939.reporting.report_generator, verifiche_dm1939.cli; "
+        "print(sorted(m for m in ('jinja2', 'matplotlib') if m in sys.modules))"
+    ).format(src=str(Path(__file__).parent.parent / "src"))
+    esito = subprocess.run([sys.executable, "-c", codice], capture_output=True, text=True, check=True)
+
+    assert esito.stdout.strip() == "[]"
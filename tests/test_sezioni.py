@@ -0,0 +1,292 @@
+"""
+Test sezioni (architettura SezioneBase): proprietà geometriche e armature.
+"""
+
+import dataclasses
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Aggiungi src al path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from verifiche_dm1939.materials.calcestruzzo import Calcestruzzo
+from verifiche_dm1939.materials.acciaio import Acciaio
+from verifiche_dm1939.sections import (
+    Barra,
+    Staffa,
+    SezioneCircolare,
+    SezioneCircolareCava,
+    SezioneI,
+    SezioneRettangolare,
+    SezioneT,
+)
+from verifiche_dm1939.sections import AsseNeutro, ProprietaGeometriche, sezione_base
+from verifiche_dm1939.sections.sezione_circolare import _circonferenza_unitaria
+
+
+@pytest.fixture
+def materiali():
+    return Calcestruzzo(resistenza_caratteristica=20.0, calcola_auto=True), Acciaio.da_tipo("FeB32k")
+
+
+def test_proprieta_memorizzate_e_invalidate(materiali):
+    """Le proprietà sono calcolate una volta e ricalcolate se cambia la geometria."""
+    sezione = SezioneCircolare(400, *materiali)
+
+    prop = sezione._get_prop_cached()
+    assert sezione._get_prop_cached() is prop
+    assert prop == sezione.calcola_proprieta_geometriche()
+
+    sezione.D = 500
+    assert sezione._get_prop_cached().y_baricentro == 250.0
+
+    cava = SezioneCircolareCava(600, 300, *materiali)
+    area = cava._get_prop_cached().area
+    cava.Di = 200
+    assert cava._get_prop_cached().area > area
+
+
+def test_rotazione_invalida_proprieta(materiali):
+    """La rotazione di 90° scarta le proprietà memorizzate."""
+    sezione = SezioneRettangolare(300, 500, *materiali)
+    assert sezione._get_prop_cached().y_baricentro == 250.0
+
+    sezione.ruota_90_gradi()
+    assert sezione._get_prop_cached().y_baricentro == 150.0
+
+
+def test_dimensioni_memorizzate(materiali):
+    """Le dimensioni principali sono costruite una volta per geometria."""
+    sezione = SezioneCircolareCava(600, 300, *materiali)
+    dim = sezione._get_dim_cached()
+    assert sezione._get_dim_cached() is dim and dim == sezione.get_dimensioni_principali()
+
+    sezione.De = 700
+    assert sezione._get_dim_cached()['spessore'] == 200.0
+
+
+def test_contorno_circolare(materiali):
+    """Il contorno è una lista di tuple (x, y) di float sulla circonferenza."""
+    contorno = SezioneCircolare(400, *materiali).get_contorno()
+    assert len(contorno) == 64 and type(contorno[0][0]) is float
+    assert contorno[0] == (200.0, 200.0)
+    assert all(abs(x**2 + (y - 200)**2 - 200**2) < 1e-6 for x, y in contorno)
+
+    cava = SezioneCircolareCava(600, 300, *materiali).get_contorno()
+    assert len(cava) == 128
+    assert cava[0] == (300.0, 300.0) and cava[-1] == (150.0, 300.0)
+
+
+def test_circonferenza_unitaria_condivisa(materiali):
+    """Seni e coseni sono calcolati una volta per numero di punti, in sola lettura."""
+    cos_t, sin_t = _circonferenza_unitaria(64)
+    assert _circonferenza_unitaria(64)[0] is cos_t
+    assert not cos_t.flags.writeable and not sin_t.flags.writeable
+
+    contorno = SezioneCircolare(400, *materiali).get_contorno(n_punti=16)
+    assert len(contorno) == 16 and contorno[-1][0] == pytest.approx(200.0)
+
+
+def test_armature_in_array_paralleli(materiali):
+    """As e d dagli array paralleli coincidono con le somme sulle barre."""
+    sezione = SezioneRettangolare(300, 500, *materiali)
+    assert sezione.As == 0.0 and sezione.d_prime == 45.0
+
+    sezione.aggiungi_armatura_inferiore(16, 4)
+    sezione.aggiungi_armatura_inferiore(20, 2, y_pos=420)
+    barre = sezione.barre_inferiori
+    assert sezione.As == sum(b.area for b in barre)
+    assert sezione.d == pytest.approx(sum(b.area * b.y_pos for b in barre) / sezione.As)
+    assert sezione._armatura('inf')['n'].tolist() == [4, 2]
+
+    # Una barra aggiunta direttamente alla lista riallinea gli array
+    sezione.barre_superiori.append(Barra(12, 2, 40.0))
+    assert sezione.As_prime == sezione.barre_superiori[0].area
+    assert sezione.d_prime == 40.0
+
+
+def test_armature_sostituite_o_riassegnate(materiali):
+    """Sostituire una barra o riassegnare la lista aggiorna As e d."""
+    sezione = SezioneRettangolare(300, 500, *materiali)
+    sezione.aggiungi_armatura_inferiore(16, 4, y_pos=462)
+    assert sezione.As == pytest.approx(804.25, abs=0.01) and sezione.d == 462
+
+    sezione.barre_inferiori[0] = Barra(20, 4, 460)
+    assert sezione.As == pytest.approx(1256.64, abs=0.01) and sezione.d == 460
+
+    sezione.barre_inferiori = [Barra(12, 2, 450)]
+    assert sezione.As == pytest.approx(226.19, abs=0.01) and sezione.d == 450
+    assert sezione._armatura('inf')['d'].tolist() == [12.0]
+
+    # Dopo la riassegnazione gli inserimenti proseguono sulla nuova lista
+    sezione.aggiungi_armatura_inferiore(12, 2, y_pos=450)
+    assert len(sezione.barre_inferiori) == 2
+    assert sezione.As == pytest.approx(2 * 226.19, abs=0.01) and sezione.d == 450
+
+
+def _sezioni_armate(cls, acc):
+    sezioni = [
+        SezioneRettangolare(300, 500, cls, acc),
+        SezioneT(300, 600, 1000, 120, cls, acc),
+        SezioneI(250, 700, 600, 120, 400, 100, cls, acc),
+        SezioneCircolare(400, cls, acc),
+        SezioneCircolareCava(600, 300, cls, acc),
+    ]
+    for sezione in sezioni:
+        sezione.aggiungi_armatura_inferiore(16, 4)
+        sezione.aggiungi_armatura_superiore(12, 2)
+    return sezioni
+
+
+def test_asse_neutro_singolo_non_compilato(materiali, monkeypatch):
+    """Il calcolo di una sola combinazione resta in Python (nessuna compilazione)."""
+    def kernel(*args):
+        raise AssertionError("kernel compilato usato per una sola combinazione")
+
+    monkeypatch.setattr(sezione_base, "_itera_asse_neutro", kernel)
+    monkeypatch.setattr(sezione_base, "_itera_asse_neutro_batch", kernel)
+    for sezione in _sezioni_armate(*materiali):
+        assert 10.0 <= sezione.calcola_asse_neutro(120, -300).posizione <= 990.0
+        assert len(sezione.calcola_asse_neutro_batch([50.0, 120.0], [0.0, -300.0])) == 2
+
+
+def test_legge_cls_ridefinita_usa_python(materiali):
+    """Una sottoclasse che ridefinisce solo la risultante non usa il kernel."""
+    class SezioneSperimentale(SezioneRettangolare):
+        def _calcola_risultante_cls_compressa(self, x):
+            return 0.0, x / 2
+
+    assert sezione_base._legge_cls_compilabile(SezioneRettangolare)
+    assert not sezione_base._legge_cls_compilabile(SezioneSperimentale)
+    sezione = SezioneSperimentale(300, 500, *materiali)
+    sezione.aggiungi_armatura_inferiore(16, 4)
+    assert 10.0 <= sezione.calcola_asse_neutro(80).posizione <= 490.0
+
+
+def test_asse_neutro_batch_coerente_con_scalare(materiali, monkeypatch):
+    """La versione vettoriale (compilata) dà le posizioni di calcola_asse_neutro per ogni combinazione."""
+    monkeypatch.setattr(sezione_base.SezioneBase, "SOGLIA_BATCH_COMPILATO", 0)
+    M = np.array([50.0, 120.0, -80.0, 0.0])
+    N = np.array([0.0, -300.0, 100.0, -1000.0])
+    for sezione in _sezioni_armate(*materiali):
+        posizioni = sezione.calcola_asse_neutro_batch(M, N)
+        assert posizioni.tolist() == [sezione.calcola_asse_neutro(m, n).posizione for m, n in zip(M, N)]
+
+    rettangolare = _sezioni_armate(*materiali)[0]
+    analitico = rettangolare.calcola_asse_neutro_batch([80.0, 100.0], metodo='analitico')
+    assert analitico.tolist() == [rettangolare.calcola_asse_neutro(80.0, metodo='analitico').posizione] * 2
+
+
+def test_aree_barre_e_staffe_precalcolate():
+    """Le aree sono attributi calcolati alla creazione, esclusi da repr e confronto."""
+    barra = Barra(16, 4, 455.0)
+    assert barra.area == pytest.approx(4 * 3.141592653589793 * 64)
+    assert repr(barra) == "Barra(diametro=16, n_barre=4, y_pos=455.0, x_pos=0.0)"
+
+    staffa = Staffa(8, 2, 200)
+    assert staffa.area_totale == staffa.area_bracci == pytest.approx(2 * 3.141592653589793 * 16)
+    assert staffa.to_dict()["area_totale"] == staffa.area_bracci
+
+    # Immutabili: l'area precalcolata non può restare disallineata dai campi
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        barra.n_barre = 6
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        staffa.n_bracci = 4
+
+
+def test_baricentro_segmento_circolare(materiali):
+    """Baricentro esatto della zona compressa: semicerchio e segmento sottile."""
+    sezione = SezioneCircolare(400, *materiali)
+    sigma = sezione.calcestruzzo.tensione_ammissibile_compressione
+
+    Fc, yc = sezione._calcola_risultante_cls_compressa(200.0)
+    assert Fc == pytest.approx(3.141592653589793 * 200**2 / 2 * sigma)
+    assert yc == pytest.approx(200 - 4 * 200 / (3 * 3.141592653589793))
+
+    # Segmento sottile: baricentro a 3/5 della freccia dal lembo compresso
+    assert sezione._calcola_risultante_cls_compressa(1.0)[1] == pytest.approx(0.6, rel=1e-3)
+    # Zona compressa oltre il centro: cerchio meno il segmento teso
+    assert 200 > sezione._calcola_risultante_cls_compressa(399.0)[1] > 199.9
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots nei dataclass da Python 3.10")
+def test_dataclass_sezioni_con_slots():
+    """Barre, staffe, proprietà e asse neutro non hanno __dict__ per istanza."""
+    for oggetto in (Barra(16, 4, 455.0), Staffa(8, 2, 200), ProprietaGeometriche(1.0, 0.5),
+                    AsseNeutro(100.0, 'cls')):
+        assert not hasattr(oggetto, "__dict__")
+
+
+def test_tooltip_barre_vicine(materiali):
+    """Il tooltip elenca solo le barre entro un diametro dal punto."""
+    sezione = SezioneRettangolare(300, 500, *materiali)
+    sezione.aggiungi_armatura_inferiore(16, 4)
+    sezione.aggiungi_armatura_inferiore(20, 2, y_pos=420.0)
+    sezione.aggiungi_armatura_superiore(12, 2)
+
+    righe = sezione.get_info_tooltip((5.0, 455.0)).splitlines()
+    assert righe[0] == "Posizione: (5, 455) mm"
+    assert righe[2:] == ["Barra inf. 1: ⌀16 (4×)"]
+
+    righe = sezione.get_info_tooltip((0.0, 40.0)).splitlines()
+    assert righe[2:] == ["Barra sup. 1: ⌀12 (2×)"]
+    assert len(sezione.get_info_tooltip((100.0, 250.0)).splitlines()) == 2
+
+
+def test_proprieta_geometriche_float():
+    """I campi di ProprietaGeometriche sono sempre float Python."""
+    prop = ProprietaGeometriche(area=np.float64(150000), y_baricentro=250, momento_inerzia_x=np.pi * 4)
+    assert all(type(getattr(prop, nome)) is float for nome in prop.__dataclass_fields__)
+    assert prop.area == 150000.0 and prop.x_baricentro == 0.0
+
+
+def test_buffer_armature_a_raddoppio(materiali):
+    """Gli array delle barre crescono per raddoppio; le viste contengono solo le barre presenti."""
+    sezione = SezioneRettangolare(300, 500, *materiali)
+    for i in range(5):
+        sezione.aggiungi_armatura_inferiore(12 + 2 * i, 2, y_pos=400.0 + i)
+
+    assert len(sezione._buffer_armature['inf']['d']) == 8
+    armatura = sezione._armatura('inf')
+    assert armatura['d'].tolist() == [12.0, 14.0, 16.0, 18.0, 20.0]
+    assert armatura['y'].base is sezione._buffer_armature['inf']['y']
+    assert sezione.As == pytest.approx(sum(b.area for b in sezione.barre_inferiori))
+
+
+def test_risultante_sezione_cava_anulare(materiali):
+    """Zona compressa della sezione cava: segmento esterno meno segmento del foro."""
+    sezione = SezioneCircolareCava(600, 300, *materiali)
+    sigma = sezione.calcestruzzo.tensione_ammissibile_compressione
+    area_anello = 3.141592653589793 * (300**2 - 150**2)
+
+    Fc, yc = sezione._calcola_risultante_cls_compressa(300.0)
+    assert Fc == pytest.approx(area_anello / 2 * sigma)
+    assert yc < 300.0
+
+    Fc, yc = sezione._calcola_risultante_cls_compressa(700.0)
+    assert Fc == pytest.approx(area_anello * sigma) and yc == pytest.approx(300.0)
+
+    # Sopra il foro la zona compressa è un segmento del solo cerchio esterno
+    piena = SezioneCircolare(600, *materiali)
+    assert sezione._calcola_risultante_cls_compressa(100.0) == piena._calcola_risultante_cls_compressa(100.0)
+    assert sezione._calcola_risultante_cls_compressa(0.0) == (0.0, 0.0)
+
+
+def test_coeff_omogeneizzazione_memorizzato(materiali):
+    """n automatico è calcolato una volta e ricalcolato se cambia un materiale."""
+    cls, acc = materiali
+    sezione = SezioneRettangolare(300, 500, cls, acc)
+    n = sezione.coeff_omogeneizzazione
+    assert n == acc.modulo_elastico / cls.modulo_elastico
+    assert sezione.__dict__['_coeff_n_auto'] == n
+
+    sezione.coeff_omogeneizzazione = 10
+    assert sezione.coeff_omogeneizzazione == 10
+    sezione.coeff_omogeneizzazione = None
+    assert sezione.coeff_omogeneizzazione == n
+
+    sezione.calcestruzzo = Calcestruzzo(resistenza_caratteristica=30.0, calcola_auto=True)
+    assert sezione.coeff_omogeneizzazione == acc.modulo_elastico / sezione.calcestruzzo.modulo_elastico